@@ -1,5 +1,6 @@
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
+from .results import read_results
 
 
 def integrate_col(df: pd.DataFrame, val_col: str, class_col: str = 'edc_id') -> Dict[str, float]:
@@ -16,19 +17,16 @@ def mean_value(df: pd.DataFrame, val_col: str, class_col: str = 'edc_id') -> Dic
     return {class_id: val / total_t for class_id, val in integrate_col(df, val_col, class_col).items()}
 
 
-def energy_per_edc(path: str, sep: str = ',', edc_col: str = 'edc_id',
-                   pwr_col: str = 'power_demand') -> Dict[str, float]:
-    return {edc_id: joules / 3600 for edc_id, joules in integrate_col(pd.read_csv(path, sep), pwr_col, edc_col).items()}
+def energy_per_edc(path: str, sep: str = ',', edc_col: str = 'edc_id', pwr_col: str = 'power_demand',
+                   table: str = 'transducer_edc_report_events') -> Dict[str, float]:
+    df = read_results(path, table, sep)
+    return {edc_id: joules / 3600 for edc_id, joules in integrate_col(df, pwr_col, edc_col).items()}
 
 
-def mean_delay_per_service(path: str, sep: str = ',', ue_id: Optional[str] = None,
-                           action: Optional[str] = None) -> Dict[str, float]:
+def mean_delay_per_service(path: str, sep: str = ',', ue_id: Optional[str] = None, action: Optional[str] = None,
+                           table: str = 'transducer_srv_report_events') -> Dict[str, float]:
     res: Dict[str, float] = dict()
-    df = pd.read_csv(path, sep)
-    if ue_id is not None:
-        df = df[df['ue_id'] == ue_id]
-    if action is not None:
-        df = df[df['action'] == action]
+    df = read_results(path, table, sep, ue_id=ue_id, action=action)
     for srv_id in df['service_id'].unique():
         srv_df = df[df['service_id'] == srv_id]
         res[srv_id] = srv_df['delay'].mean()
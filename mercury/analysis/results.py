@@ -0,0 +1,86 @@
+from __future__ import annotations
+import os
+import sqlite3
+from contextlib import closing
+import pandas as pd
+from typing import Any, Iterable
+
+SQLITE_HEADER: bytes = b'SQLite format 3\x00'
+
+
+def is_sqlite(path: str) -> bool:
+    """:return: True if the path corresponds to a SQLite database file."""
+    if not os.path.isfile(path):
+        return False
+    with open(path, 'rb') as file:
+        return file.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+
+
+def list_tables(path: str) -> list[str]:
+    """:return: list with the name of the tables of a SQLite database file."""
+    with closing(sqlite3.connect(path)) as conn:
+        return [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")]
+
+
+def report_path(location: str, table: str) -> str:
+    """
+    Finds the file that contains a given report.
+    :param location: SQLite database file or directory with the CSV files of the transducers.
+    :param table: name of the report (e.g., "transducer_srv_report_events").
+    :return: path to the SQLite database or to the CSV file of the report.
+    """
+    return location if is_sqlite(location) else os.path.join(location, f'{table}.csv')
+
+
+def read_results(path: str, table: str | None = None, sep: str = ',', columns: Iterable[str] | None = None,
+                 t_start: float | None = None, t_end: float | None = None, time_col: str = 'time',
+                 **filters: Any) -> pd.DataFrame:
+    """
+    Reads simulation results from a CSV file or from a table of a SQLite database.
+    With SQLite databases, rows are filtered by the database (using its indexes), so only matching rows are read.
+    :param path: path to the CSV file or SQLite database.
+    :param table: name of the table. It is only required for SQLite databases.
+    :param sep: delimiter of the CSV file. It is ignored for SQLite databases.
+    :param columns: columns to be read. By default, all the columns are read.
+    :param t_start: if not None, rows with a time less than t_start are discarded.
+    :param t_end: if not None, rows with a time greater than or equal to t_end are discarded.
+    :param time_col: name of the time column.
+    :param filters: {column: value} only rows with these values are read. If value is a list, tuple, or set,
+    rows with any of the given values are read. None values are ignored.
+    :return: data frame with the results, sorted as they were generated.
+    """
+    filters = {col: value for col, value in filters.items() if value is not None}
+    columns = None if columns is None else list(columns)
+    if is_sqlite(path):
+        if table is None:
+            raise ValueError('a table must be specified for reading results from SQLite databases')
+        conditions, params = list(), list()
+        if t_start is not None:
+            conditions.append(f'"{time_col}" >= ?')
+            params.append(t_start)
+        if t_end is not None:
+            conditions.append(f'"{time_col}" < ?')
+            params.append(t_end)
+        for col, value in filters.items():
+            if isinstance(value, (list, tuple, set)):
+                conditions.append(f'"{col}" IN ({", ".join("?" * len(value))})')
+                params.extend(value)
+            else:
+                conditions.append(f'"{col}" = ?')
+                params.append(value)
+        selection = '*' if columns is None else ', '.join(f'"{col}"' for col in columns)
+        query = f'SELECT {selection} FROM "{table}"'
+        if conditions:
+            query = f'{query} WHERE {" AND ".join(conditions)}'
+        with closing(sqlite3.connect(path)) as conn:
+            return pd.read_sql_query(f'{query} ORDER BY rowid', conn, params=params)
+    df = pd.read_csv(path, sep=sep)
+    mask = pd.Series(True, index=df.index)
+    if t_start is not None:
+        mask &= df[time_col] >= t_start
+    if t_end is not None:
+        mask &= df[time_col] < t_end
+    for col, value in filters.items():
+        mask &= df[col].isin(value) if isinstance(value, (list, tuple, set)) else df[col] == value
+    df = df[mask].reset_index(drop=True)
+    return df if columns is None else df[columns]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+import json
+import subprocess
+import sys
+from statistics import median
+
+CORE_MODULES: tuple[str, ...] = ('mercury.config', 'mercury.model', 'mercury.msg', 'mercury.plugin')
+HEAVY_MODULES: tuple[str, ...] = ('matplotlib', 'seaborn', 'sklearn', 'scipy')
+
+_SCRIPT = '''
+import json, resource, sys, time
+t_start = time.perf_counter()
+for module in {modules!r}:
+    __import__(module)
+t_import = time.perf_counter() - t_start
+heavy = sorted(module for module in sys.modules if module.split('.')[0] in {heavy!r})
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'t_import': t_import, 'heavy_modules': heavy, 'peak_rss_kb': rss}}))
+'''
+
+
+class ImportReport:
+    def __init__(self, modules: tuple[str, ...], t_import: list[float], heavy_modules: list[str], peak_rss_kb: int):
+        """
+        Results of the import-time benchmark.
+        :param modules: modules that were imported.
+        :param t_import: time (in seconds) required to import the modules in every repetition.
+        :param heavy_modules: heavy modules (e.g., plotting or ML libraries) that were imported as a side effect.
+        :param peak_rss_kb: peak resident set size (in kB) of the importing process.
+        """
+        self.modules: tuple[str, ...] = modules
+        self.t_import: list[float] = t_import
+        self.heavy_modules: list[str] = heavy_modules
+        self.peak_rss_kb: int = peak_rss_kb
+
+    @property
+    def t_median(self) -> float:
+        return median(self.t_import)
+
+    def __str__(self):
+        res = f'import {", ".join(self.modules)}: {self.t_median * 1000:.1f} ms (median of {len(self.t_import)}), ' \
+              f'peak RSS: {self.peak_rss_kb / 1024:.1f} MB'
+        if self.heavy_modules:
+            roots = sorted({module.split('.')[0] for module in self.heavy_modules})
+            res = f'{res}, heavy modules: {", ".join(roots)}'
+        return res
+
+
+def measure_import(modules: tuple[str, ...] = CORE_MODULES, repeat: int = 5,
+                   heavy_modules: tuple[str, ...] = HEAVY_MODULES) -> ImportReport:
+    """
+    Measures the time required for importing a set of modules. Each repetition runs in a fresh interpreter.
+    :param modules: modules to be imported.
+    :param repeat: number of repetitions.
+    :param heavy_modules: root packages that are reported if they are imported as a side effect.
+    :return: import-time report.
+    """
+    if repeat < 1:
+        raise ValueError(f'repeat ({repeat}) must be greater than 0')
+    script = _SCRIPT.format(modules=tuple(modules), heavy=tuple(heavy_modules))
+    t_import, heavy, peak_rss_kb = list(), list(), 0
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+        res = json.loads(output.strip().splitlines()[-1])
+        t_import.append(res['t_import'])
+        heavy = res['heavy_modules']
+        peak_rss_kb = max(peak_rss_kb, res['peak_rss_kb'])
+    return ImportReport(tuple(modules), t_import, heavy, peak_rss_kb)
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Mercury import-time benchmark')
+    parser.add_argument('modules', nargs='*', default=CORE_MODULES, help='modules to import')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='number of repetitions')
+    parser.add_argument('--strict', action='store_true', help='fail if any heavy module is imported')
+    args = parser.parse_args()
+    report = measure_import(tuple(args.modules), args.repeat)
+    print(report)
+    if args.strict and report.heavy_modules:
+        sys.exit(1)
@@ -0,0 +1,252 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+from math import sqrt
+from statistics import mean, median, variance
+from typing import Any, Iterable
+from mercury.utils.maths import betainc
+from .suite import BenchmarkResult
+
+# Metrics checked by the regression gate: {metric: True if higher is better}
+METRICS: dict[str, bool] = {'sim_time': False, 'events_per_second': True, 'peak_rss_kb': False}
+
+
+def machine_fingerprint() -> dict[str, Any]:
+    """:return: description of the machine and interpreter that run the benchmarks."""
+    info = {
+        'system': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+    }
+    info['id'] = hashlib.sha1(json.dumps(info, sort_keys=True).encode()).hexdigest()[:12]
+    return info
+
+
+class BenchmarkRun:
+    def __init__(self, results: list[BenchmarkResult], fingerprint: dict[str, Any] | None = None,
+                 timestamp: float | None = None, label: str | None = None):
+        """
+        Set of benchmark results obtained in the same machine.
+        :param results: benchmark results. A scenario and variant may appear more than once (i.e., repetitions).
+        :param fingerprint: machine fingerprint. By default, it is the fingerprint of the current machine.
+        :param timestamp: UNIX timestamp of the run. By default, it is the current time.
+        :param label: optional label of the run (e.g., Mercury version or commit).
+        """
+        self.results: list[BenchmarkResult] = results
+        self.fingerprint: dict[str, Any] = machine_fingerprint() if fingerprint is None else fingerprint
+        self.timestamp: float = time.time() if timestamp is None else timestamp
+        self.label: str | None = label
+
+    def samples(self) -> dict[tuple[str, str], dict[str, list[float]]]:
+        """:return: dictionary {(scenario, variant): {metric: list of samples}}."""
+        res = dict()
+        for result in self.results:
+            metrics = res.setdefault((result.scenario, result.variant), {metric: list() for metric in METRICS})
+            result_dict = result.to_dict()
+            for metric in METRICS:
+                metrics[metric].append(result_dict[metric])
+        return res
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'fingerprint': self.fingerprint, 'timestamp': self.timestamp, 'label': self.label,
+                'results': [result.to_dict() for result in self.results]}
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> BenchmarkRun:
+        return BenchmarkRun([BenchmarkResult.from_dict(result) for result in data['results']],
+                            data['fingerprint'], data['timestamp'], data.get('label'))
+
+    def save(self, store_dir: str) -> str:
+        """
+        Saves the run in a results store.
+        :param store_dir: path to the results store directory.
+        :return: path to the new run file.
+        """
+        os.makedirs(store_dir, exist_ok=True)
+        name = time.strftime('%Y%m%d-%H%M%S', time.gmtime(self.timestamp))
+        if self.label is not None:
+            name = f'{name}_{self.label}'
+        path = os.path.join(store_dir, f'{name}.json')
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+        return path
+
+    @staticmethod
+    def load(path: str) -> BenchmarkRun:
+        with open(path) as file:
+            return BenchmarkRun.from_dict(json.load(file))
+
+    @staticmethod
+    def latest(store_dir: str, fingerprint_id: str | None = None) -> BenchmarkRun | None:
+        """
+        Reads the most recent run of a results store.
+        :param store_dir: path to the results store directory.
+        :param fingerprint_id: if not None, only runs from machines with this fingerprint ID are considered.
+        :return: most recent run. If there is no run in the store, it returns None.
+        """
+        runs = list()
+        if os.path.isdir(store_dir):
+            for filename in os.listdir(store_dir):
+                if filename.endswith('.json'):
+                    run = BenchmarkRun.load(os.path.join(store_dir, filename))
+                    if fingerprint_id is None or run.fingerprint.get('id') == fingerprint_id:
+                        runs.append(run)
+        return max(runs, key=lambda x: x.timestamp, default=None)
+
+
+def welch_test(baseline: list[float], current: list[float]) -> float:
+    """
+    Welch's t-test for the difference of means of two independent samples.
+    :param baseline: baseline samples.
+    :param current: current samples.
+    :return: two-sided p-value. If any sample has less than two elements, it returns 0.
+    """
+    n_a, n_b = len(baseline), len(current)
+    if n_a < 2 or n_b < 2:
+        return 0
+    se_a, se_b = variance(baseline) / n_a, variance(current) / n_b
+    diff = mean(current) - mean(baseline)
+    if se_a + se_b == 0:
+        return 1 if diff == 0 else 0
+    t = diff / sqrt(se_a + se_b)
+    df = (se_a + se_b) ** 2 / ((se_a ** 2 / (n_a - 1) if se_a else 0) + (se_b ** 2 / (n_b - 1) if se_b else 0))
+    return betainc(df / 2, 0.5, df / (df + t ** 2))
+
+
+class MetricComparison:
+    def __init__(self, scenario: str, variant: str, metric: str,
+                 baseline: list[float], current: list[float], threshold: float, alpha: float):
+        """
+        Comparison of a metric between a baseline and a current benchmark run.
+        A regression is flagged if the metric gets worse by more than the threshold, and the difference is
+        statistically significant (only when both runs contain repetitions).
+        :param scenario: name of the scenario.
+        :param variant: Mercury model variant.
+        :param metric: name of the metric.
+        :param baseline: samples of the metric in the baseline run.
+        :param current: samples of the metric in the current run.
+        :param threshold: minimum relative change of the median to flag a regression (e.g., 0.05 is 5%).
+        :param alpha: significance level of Welch's t-test.
+        """
+        self.scenario: str = scenario
+        self.variant: str = variant
+        self.metric: str = metric
+        self.baseline: float = median(baseline)
+        self.current: float = median(current)
+        self.change: float = (self.current - self.baseline) / self.baseline if self.baseline else 0
+        self.p_value: float = welch_test(baseline, current)
+        worse = -self.change if METRICS[metric] else self.change
+        self.regression: bool = worse > threshold and self.p_value < alpha
+        self.improvement: bool = -worse > threshold and self.p_value < alpha
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'scenario': self.scenario, 'variant': self.variant, 'metric': self.metric,
+                'baseline': self.baseline, 'current': self.current, 'change': self.change,
+                'p_value': self.p_value, 'regression': self.regression, 'improvement': self.improvement}
+
+    def __str__(self):
+        status = 'REGRESSION' if self.regression else 'improved' if self.improvement else 'ok'
+        return f'{self.scenario:<4} {self.variant:<13} {self.metric:<18} {self.baseline:14.3f} -> ' \
+               f'{self.current:14.3f} ({self.change:+7.1%}, p={self.p_value:.3f}) {status}'
+
+
+def compare_runs(baseline: BenchmarkRun, current: BenchmarkRun, threshold: float = 0.05,
+                 alpha: float = 0.05, thresholds: dict[str, float] | None = None) -> list[MetricComparison]:
+    """
+    Compares the metrics of two benchmark runs. Only scenarios and variants present in both runs are compared.
+    :param baseline: baseline benchmark run.
+    :param current: current benchmark run.
+    :param threshold: default minimum relative change to flag a regression.
+    :param alpha: significance level of Welch's t-test.
+    :param thresholds: custom thresholds for specific metrics {metric: threshold}.
+    :return: list of metric comparisons.
+    """
+    thresholds = dict() if thresholds is None else thresholds
+    baseline_samples, current_samples = baseline.samples(), current.samples()
+    res = list()
+    for key, samples in current_samples.items():
+        if key in baseline_samples:
+            for metric in METRICS:
+                res.append(MetricComparison(*key, metric, baseline_samples[key][metric], samples[metric],
+                                            thresholds.get(metric, threshold), alpha))
+    return res
+
+
+def run_benchmarks(scales: Iterable[str], variants: Iterable[str], time_interv: float,
+                   repeat: int = 3, seed: int = 0, label: str | None = None,
+                   flatten: bool = False, fast: bool = False) -> BenchmarkRun:
+    """
+    Runs the benchmark suite several times.
+    :param scales: scales of the synthetic scenarios to simulate.
+    :param variants: Mercury model variants to simulate.
+    :param time_interv: time (in seconds) to simulate.
+    :param repeat: number of repetitions.
+    :param seed: seed for the scenario generator and the random number generators.
+    :param label: optional label of the run.
+    :param flatten: if True, the coupled hierarchy of the models is flattened before the simulation.
+    :param fast: if True, the simulations use the activity-aware coordinator of Mercury.
+    :return: benchmark run.
+    """
+    from .suite import run_suite
+    if repeat < 1:
+        raise ValueError(f'repeat ({repeat}) must be greater than 0')
+    results = list()
+    for _ in range(repeat):
+        results.extend(run_suite(scales, variants, time_interv, seed, flatten=flatten, fast=fast))
+    return BenchmarkRun(results, label=label)
+
+
+if __name__ == '__main__':
+    import argparse
+    from .scenario import SCALES
+    from .suite import VARIANTS
+    parser = argparse.ArgumentParser(description='Mercury performance regression gate')
+    parser.add_argument('--store', default='benchmarks', help='path to the results store directory')
+    parser.add_argument('--baseline', default=None, help='baseline run file (by default, the latest compatible run)')
+    parser.add_argument('--current', default=None, help='current run file (by default, a new run is executed)')
+    parser.add_argument('-s', '--scales', nargs='+', default=['xs', 's'], choices=list(SCALES))
+    parser.add_argument('-v', '--variants', nargs='+', default=list(VARIANTS), choices=list(VARIANTS))
+    parser.add_argument('-t', '--time', type=float, default=100, help='time (in seconds) to simulate')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='number of repetitions')
+    parser.add_argument('--flatten', action='store_true', help='flatten the coupled hierarchy of the models')
+    parser.add_argument('--fast', action='store_true', help='use the activity-aware coordinator')
+    parser.add_argument('--label', default=None, help='label of the new run')
+    parser.add_argument('--threshold', type=float, default=0.05, help='minimum relative change to flag')
+    parser.add_argument('--alpha', type=float, default=0.05, help='significance level')
+    parser.add_argument('--save', action='store_true', help='save the new run in the results store')
+    parser.add_argument('--report', default=None, help='path to a JSON file for the comparison report')
+    args = parser.parse_args()
+
+    if args.baseline is not None:
+        baseline_run = BenchmarkRun.load(args.baseline)
+    else:
+        baseline_run = BenchmarkRun.latest(args.store, machine_fingerprint()['id'])
+    if args.current is not None:
+        current_run = BenchmarkRun.load(args.current)
+    else:
+        current_run = run_benchmarks(args.scales, args.variants, args.time, args.repeat,
+                                     label=args.label, flatten=args.flatten, fast=args.fast)
+        if args.save:
+            print(f'results saved in {current_run.save(args.store)}')
+    if baseline_run is None:
+        print('no compatible baseline found in the results store')
+        sys.exit(0)
+    if baseline_run.fingerprint.get('id') != current_run.fingerprint.get('id'):
+        print('WARNING: baseline and current runs come from different machines')
+    comparisons = compare_runs(baseline_run, current_run, args.threshold, args.alpha)
+    for comparison in comparisons:
+        print(comparison)
+    if args.report is not None:
+        with open(args.report, 'w') as file:
+            json.dump([comparison.to_dict() for comparison in comparisons], file, indent=2)
+    n_regressions = sum(comparison.regression for comparison in comparisons)
+    print(f'{n_regressions} regression(s) found')
+    sys.exit(1 if n_regressions else 0)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+import json
+from math import ceil, sqrt
+from random import Random
+from typing import Any
+
+SCALES: dict[str, dict[str, int]] = {
+    'xs': {'n_edcs': 1, 'n_pus': 2, 'n_gws': 1, 'n_clients': 5, 'n_services': 1},
+    's': {'n_edcs': 2, 'n_pus': 4, 'n_gws': 4, 'n_clients': 20, 'n_services': 2},
+    'm': {'n_edcs': 4, 'n_pus': 8, 'n_gws': 9, 'n_clients': 100, 'n_services': 3},
+    'l': {'n_edcs': 8, 'n_pus': 16, 'n_gws': 16, 'n_clients': 400, 'n_services': 4},
+    'xl': {'n_edcs': 16, 'n_pus': 32, 'n_gws': 36, 'n_clients': 1600, 'n_services': 4},
+}
+
+
+def grid_locations(n: int, side: float) -> list[tuple[float, float]]:
+    """
+    Distributes n nodes in a regular grid that covers a square area.
+    :param n: number of nodes.
+    :param side: length (in meters) of the side of the square area.
+    :return: list with the location of every node.
+    """
+    n_cols = ceil(sqrt(n))
+    n_rows = ceil(n / n_cols) if n else 0
+    step_x, step_y = side / n_cols if n else 0, side / n_rows if n else 0
+    return [((i % n_cols + 0.5) * step_x, (i // n_cols + 0.5) * step_y) for i in range(n)]
+
+
+def synthetic_scenario(n_edcs: int = 1, n_pus: int = 2, n_gws: int = 1, n_clients: int = 10, n_services: int = 1,
+                       gw_range: float = 100, req_period: float = 1, t_client: float = 1, cloud: bool = True,
+                       mapping_id: str = 'closest', seed: int = 0) -> dict[str, Any]:
+    """
+    Generates a synthetic Mercury scenario. The result follows the format expected by MercuryConfig.from_json.
+    Gateways and EDCs are distributed in a regular grid, while clients are still nodes randomly placed in the scenario.
+    :param n_edcs: number of edge data centers.
+    :param n_pus: number of processing units per edge data center.
+    :param n_gws: number of gateways.
+    :param n_clients: number of clients.
+    :param n_services: number of services. Clients run all the services of the scenario.
+    :param gw_range: distance (in meters) between neighbouring gateways.
+    :param req_period: time (in seconds) between consecutive requests of a client while a service is active.
+    :param t_client: time (in seconds) between consecutive client arrivals.
+    :param cloud: if true, the scenario includes a cloud facility.
+    :param mapping_id: ID of the server mapping strategy of the edge federation.
+    :param seed: seed for the random location of clients.
+    :return: dictionary with the scenario configuration.
+    """
+    for name, value in ('n_edcs', n_edcs), ('n_pus', n_pus), ('n_gws', n_gws), ('n_services', n_services):
+        if value < 1:
+            raise ValueError(f'{name} ({value}) must be greater than 0')
+    if n_clients < 0:
+        raise ValueError(f'n_clients ({n_clients}) must be greater than or equal to 0')
+    rng = Random(seed)
+    side = ceil(sqrt(n_gws)) * gw_range
+    services = [f'srv_{i}' for i in range(n_services)]
+    link_config = {'bandwidth': 100e6, 'carrier_freq': 33e9, 'att_id': 'fspl', 'noise_id': 'thermal'}
+    config = {
+        'acc_config': {
+            'wireless_div_id': 'equal',
+            'wireless_dl_link': link_config,
+            'wireless_ul_link': link_config,
+        },
+        'services': {srv_id: {
+            'cool_down': 1,
+            't_deadline': 0.1 * (i + 1),
+            'activity_gen_id': 'periodic',
+            'activity_gen_config': {'period': 10 * (i + 1)},
+            'activity_window_id': 'constant',
+            'activity_window_config': {'length': 9 * (i + 1)},
+            'req_gen_id': 'periodic',
+            'req_gen_config': {'period': req_period},
+        } for i, srv_id in enumerate(services)},
+        'edge_fed_config': {
+            'mapping_id': mapping_id,
+            'mapping_config': {},
+            'congestion': 1,
+            'srv_window_size': {srv_id: 10 for srv_id in services},
+        },
+        'edc_pus': {
+            'pu': {
+                't_on': 2,
+                't_off': 2,
+                'pwr_config': {'power': 300},
+                'services': {srv_id: {
+                    'max_parallel_tasks': 5,
+                    'proc_t_id': 'constant',
+                    'proc_t_config': {'proc_t': [0.1, 0.15, 0.2, 0.25, 0.3]},
+                    'pwr_id': 'idle_active',
+                    'pwr_config': {'idle_power': 310, 'active_power': 320},
+                } for srv_id in services},
+            },
+        },
+        'edc_r_managers': {
+            'always_off': {'standby': False},
+        },
+        'gateways': {f'gw_{i}': {'location': location, 'wired': False}
+                     for i, location in enumerate(grid_locations(n_gws, side))},
+        'edcs': {f'edc_{i}': {
+            'location': location,
+            'pus': {f'pu_{j}': 'pu' for j in range(n_pus)},
+            'r_manager_id': 'always_off',
+        } for i, location in enumerate(grid_locations(n_edcs, side))},
+        'clients_config': {
+            'srv_max_guard': 0,
+            'client_generators': [{
+                'generator_id': 'list',
+                'services': services,
+                'generator_config': {'clients': {f'client_{i}': {
+                    't_start': i * t_client,
+                    'mob_id': 'still',
+                    'mob_config': {'location': (rng.uniform(0, side), rng.uniform(0, side))},
+                } for i in range(n_clients)}},
+            }],
+        },
+    }
+    if cloud:
+        config['cloud_config'] = {
+            'cloud_id': 'cloud',
+            'delay_id': 'constant',
+            'delay_config': {'prop_delay': 0.3},
+            'srv_configs': {srv_id: {
+                'profiling_window': 20,
+                'proc_t_id': 'constant',
+                'proc_t_config': {'proc_t': 0.3},
+            } for srv_id in services},
+        }
+    return config
+
+
+def write_scenario(path: str, **kwargs):
+    """
+    Generates a synthetic Mercury scenario and writes it in a JSON file.
+    :param path: path of the resulting JSON file.
+    :param kwargs: configuration parameters of the synthetic scenario (see synthetic_scenario).
+    """
+    with open(path, 'w') as file:
+        json.dump(synthetic_scenario(**kwargs), file, indent=2)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Iterable
+from .scenario import SCALES, write_scenario
+
+VARIANTS: tuple[str, ...] = ('lite', 'shortcut_app', 'shortcut_net', 'physical')
+
+
+class BenchmarkResult:
+    def __init__(self, scenario: str, variant: str, time_interv: float, n_events: int,
+                 build_time: float, sim_time: float, peak_rss_kb: int, params: dict[str, Any] | None = None):
+        """
+        Results of a single benchmark run.
+        :param scenario: name of the scenario (e.g., scale of the synthetic scenario).
+        :param variant: Mercury model variant (lite, shortcut_app, shortcut_net, or physical).
+        :param time_interv: simulated time (in seconds).
+        :param n_events: number of state transitions executed by the atomic models of the scenario.
+        :param build_time: wall time (in seconds) required for building and initializing the model.
+        :param sim_time: wall time (in seconds) required for simulating the scenario.
+        :param peak_rss_kb: peak resident set size (in kB) of the simulation process.
+        :param params: configuration parameters of the synthetic scenario.
+        """
+        self.scenario: str = scenario
+        self.variant: str = variant
+        self.time_interv: float = time_interv
+        self.n_events: int = n_events
+        self.build_time: float = build_time
+        self.sim_time: float = sim_time
+        self.peak_rss_kb: int = peak_rss_kb
+        self.params: dict[str, Any] = dict() if params is None else params
+
+    @property
+    def events_per_second(self) -> float:
+        return self.n_events / self.sim_time if self.sim_time > 0 else 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'scenario': self.scenario, 'variant': self.variant, 'time_interv': self.time_interv,
+                'n_events': self.n_events, 'build_time': self.build_time, 'sim_time': self.sim_time,
+                'events_per_second': self.events_per_second, 'peak_rss_kb': self.peak_rss_kb, 'params': self.params}
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> BenchmarkResult:
+        return BenchmarkResult(data['scenario'], data['variant'], data['time_interv'], data['n_events'],
+                               data['build_time'], data['sim_time'], data['peak_rss_kb'], data.get('params'))
+
+    def __str__(self):
+        return f'{self.scenario:<4} {self.variant:<13} build: {self.build_time:7.3f} s  sim: {self.sim_time:8.3f} s  ' \
+               f'events: {self.n_events:9d}  events/s: {self.events_per_second:10.1f}  ' \
+               f'peak RSS: {self.peak_rss_kb / 1024:7.1f} MB'
+
+
+def count_transitions(coordinator) -> list[int]:
+    """
+    Instruments the simulators of a coordinator to count the state transitions of their atomic models.
+    :param coordinator: root xDEVS coordinator. It must be initialized.
+    :return: single-element list with the number of transitions. It is updated as the simulation goes on.
+    """
+    from xdevs.sim import Coordinator
+    counter = [0]
+
+    def instrument(simulator):
+        deltfcn = simulator.deltfcn
+
+        def counting_deltfcn():
+            res = deltfcn()
+            if res is not None:
+                counter[0] += 1
+            return res
+        simulator.deltfcn = counting_deltfcn
+
+    pending = [coordinator]
+    while pending:
+        for processor in pending.pop().processors:
+            if isinstance(processor, Coordinator):
+                pending.append(processor)
+            else:
+                instrument(processor)
+    return counter
+
+
+def run_scenario(config_path: str, variant: str, time_interv: float, seed: int = 0,
+                 flatten: bool = False, fast: bool = False) -> BenchmarkResult:
+    """
+    Runs a Mercury scenario in the current process and measures its performance.
+    Scenarios modify class-level configuration (e.g., services), so every run should have its own process.
+    :param config_path: path to the JSON file with the scenario configuration.
+    :param variant: Mercury model variant (lite, shortcut_app, shortcut_net, or physical).
+    :param time_interv: time (in seconds) to simulate.
+    :param seed: seed for the random number generators.
+    :param flatten: if True, the coupled hierarchy of the model is flattened before the simulation.
+    :param fast: if True, the simulation uses the activity-aware coordinator of Mercury.
+    :return: benchmark result.
+    """
+    import random
+    import numpy as np
+    import mercury.logger as logger
+    from xdevs.sim import Coordinator
+    from mercury.config import MercuryConfig
+    from mercury.model import MercuryModelABC
+    from mercury.model.common import FastCoordinator
+    from mercury.msg.packet import AppPacket, NetworkPacket, PhysicalPacket
+    if variant not in VARIANTS:
+        raise ValueError(f'unknown model variant: {variant}')
+    lite, p_type = {
+        'lite': (True, AppPacket),
+        'shortcut_app': (False, AppPacket),
+        'shortcut_net': (False, NetworkPacket),
+        'physical': (False, PhysicalPacket),
+    }[variant]
+    random.seed(seed)
+    np.random.seed(seed)
+    logger.set_logger_level('FATAL')
+
+    t_start = time.perf_counter()
+    model = MercuryModelABC.new_mercury(MercuryConfig.from_json(config_path), lite, p_type)
+    model.build(flatten)
+    coordinator = FastCoordinator(model) if fast else Coordinator(model)
+    coordinator.initialize()
+    build_time = time.perf_counter() - t_start
+
+    counter = count_transitions(coordinator)
+    t_start = time.perf_counter()
+    coordinator.simulate_time(time_interv=time_interv)
+    sim_time = time.perf_counter() - t_start
+    coordinator.exit()
+
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return BenchmarkResult(os.path.basename(config_path).split('.')[0], variant, time_interv,
+                           counter[0], build_time, sim_time, peak_rss_kb)
+
+
+def run_suite(scales: Iterable[str] = ('xs', 's'), variants: Iterable[str] = VARIANTS,
+              time_interv: float = 100, seed: int = 0, config_dir: str | None = None,
+              flatten: bool = False, fast: bool = False) -> list[BenchmarkResult]:
+    """
+    Runs the benchmark suite. Every scenario and variant is simulated in a fresh interpreter.
+    :param scales: scales of the synthetic scenarios to simulate (see SCALES).
+    :param variants: Mercury model variants to simulate.
+    :param time_interv: time (in seconds) to simulate.
+    :param seed: seed for the scenario generator and the random number generators.
+    :param config_dir: directory for the generated scenario configuration files. By default, a temporary directory.
+    :param flatten: if True, the coupled hierarchy of the models is flattened before the simulation.
+    :param fast: if True, the simulations use the activity-aware coordinator of Mercury.
+    :return: list of benchmark results.
+    """
+    variants = list(variants)
+    for variant in variants:
+        if variant not in VARIANTS:
+            raise ValueError(f'unknown model variant: {variant}')
+    res = list()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_dir = tmp_dir if config_dir is None else config_dir
+        os.makedirs(config_dir, exist_ok=True)
+        for scale in scales:
+            if scale not in SCALES:
+                raise ValueError(f'unknown scenario scale: {scale}')
+            config_path = os.path.join(config_dir, f'{scale}.json')
+            write_scenario(config_path, **SCALES[scale], seed=seed)
+            for variant in variants:
+                script = 'import json, sys\nfrom mercury.benchmark.suite import run_scenario\n' \
+                         'print(json.dumps(run_scenario(sys.argv[1], sys.argv[2], float(sys.argv[3]), ' \
+                         'int(sys.argv[4]), sys.argv[5] == \'1\', sys.argv[6] == \'1\').to_dict()))'
+                args = [sys.executable, '-c', script, config_path, variant,
+                        str(time_interv), str(seed), str(int(flatten)), str(int(fast))]
+                output = subprocess.run(args, check=True, capture_output=True, text=True).stdout
+                result = BenchmarkResult.from_dict(json.loads(output.strip().splitlines()[-1]))
+                result.params = dict(SCALES[scale], seed=seed, flatten=flatten, fast=fast)
+                res.append(result)
+    return res
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Mercury benchmark suite')
+    parser.add_argument('-s', '--scales', nargs='+', default=['xs', 's'], choices=list(SCALES))
+    parser.add_argument('-v', '--variants', nargs='+', default=list(VARIANTS), choices=list(VARIANTS))
+    parser.add_argument('-t', '--time', type=float, default=100, help='time (in seconds) to simulate')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--config-dir', default=None, help='directory for the generated scenarios')
+    parser.add_argument('--flatten', action='store_true', help='flatten the coupled hierarchy of the models')
+    parser.add_argument('--fast', action='store_true', help='use the activity-aware coordinator')
+    parser.add_argument('-o', '--output', default=None, help='path to a JSON file for the results')
+    args = parser.parse_args()
+    results = list()
+    for scale in args.scales:
+        for result in run_suite([scale], args.variants, args.time, args.seed, args.config_dir,
+                                args.flatten, args.fast):
+            print(result, flush=True)
+            results.append(result)
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump([result.to_dict() for result in results], file, indent=2)
@@ -1,18 +1,30 @@
 from __future__ import annotations
 from typing import Any
+from ..utils.rng import stream
 from .client import ServicesConfig
 from .network import StaticNodeConfig, TransceiverConfig
 
 
 class CloudServiceConfig:
+
+    QUEUE_POLICIES: tuple[str, ...] = ('fifo', 'edf')
+
     def __init__(self, service_id: str, profiling_window: float = None,
-                 proc_t_id: str = 'constant', proc_t_config: dict[str, Any] = None):
+                 proc_t_id: str = 'constant', proc_t_config: dict[str, Any] = None,
+                 n_servers: int | None = None, queue_policy: str = 'fifo'):
         """
         Processing unit-specific process configuration.
         :param service_id: Service ID.
         :param profiling_window: size of the profiling window for assessing the service demand.
         :param proc_t_id: processing time model ID to use by the PU when executing tasks of this service.
-        :param proc_t_config: processing time model configuration parameters.
+        :param proc_t_config: processing time model configuration parameters. With common random numbers, the model
+                              draws from the random stream of the cloud and the service. Draws are made in the
+                              order in which requests arrive to the cloud. Thus, processing times are only common
+                              to scenarios that send the same requests to the cloud.
+        :param n_servers: number of servers that the cloud allocates to this service.
+                          By default, it is set to None (i.e., infinite capacity). Otherwise, it must be greater than 0.
+        :param queue_policy: policy for serving requests that wait for a server. It can be either 'fifo'
+                             (first-in, first-out) or 'edf' (earliest deadline first). By default, it is set to 'fifo'.
         """
         from mercury.plugin import AbstractFactory, CloudProcTimeModel
         if not ServicesConfig.srv_defined(service_id):
@@ -26,6 +38,12 @@ class CloudServiceConfig:
         self.stream: bool = self.sess_required and ServicesConfig.SERVICES[service_id].sess_config.stream
         proc_t_config = dict() if proc_t_config is None else proc_t_config
         self.proc_t_model: CloudProcTimeModel = AbstractFactory.create_cloud_proc_t(proc_t_id, **proc_t_config)
+        if n_servers is not None and n_servers < 1:
+            raise ValueError(f'n_servers ({n_servers}) must be greater than 0')
+        self.n_servers: int | None = n_servers
+        if queue_policy not in CloudServiceConfig.QUEUE_POLICIES:
+            raise ValueError(f'invalid queue_policy ({queue_policy})')
+        self.queue_policy: str = queue_policy
 
 
 class CloudConfig:
@@ -42,5 +60,9 @@ class CloudConfig:
                 self.add_srv_config(service_id, **service_config)
 
     def add_srv_config(self, service_id: str, profiling_window: float = None,
-                       proc_t_id: str = 'constant', proc_t_config: dict[str, Any] = None):
-        self.srv_config[service_id] = CloudServiceConfig(service_id, profiling_window, proc_t_id, proc_t_config)
+                       proc_t_id: str = 'constant', proc_t_config: dict[str, Any] = None,
+                       n_servers: int | None = None, queue_policy: str = 'fifo'):
+        proc_t_config = {**({} if proc_t_config is None else proc_t_config),
+                         'rng': stream(f'{self.cloud_id}_{service_id}_proc_t')}
+        self.srv_config[service_id] = CloudServiceConfig(service_id, profiling_window, proc_t_id,
+                                                         proc_t_config, n_servers, queue_policy)
@@ -65,11 +65,12 @@ class MercuryConfig:
     def define_edge_fed_config(self, name: str = 'edge_fed', mapping_id: str = 'closest',
                                mapping_config: dict[str, Any] = None,
                                congestion: float = 1, srv_window_size: dict[str, float] = None,
-                               header: int = 0, content: int = 0):
+                               header: int = 0, content: int = 0,
+                               report_board: bool = False, report_board_delay: float = 0):
         if self.edcs_config is not None:
             raise ValueError('Edge federation configuration already defined')
-        self.edcs_config = EdgeFederationConfig(name, mapping_id, mapping_config, congestion,
-                                                srv_window_size, header, content)
+        self.edcs_config = EdgeFederationConfig(name, mapping_id, mapping_config, congestion, srv_window_size,
+                                                header, content, report_board, report_board_delay)
         if self.cloud_config is not None:
             self.edcs_config.add_cloud(self.cloud_config.cloud_id)
 
@@ -178,10 +179,12 @@ class MercuryConfig:
 
     def define_edc_r_manager_config(self, r_manager_id: str, mapping_id: str = 'ff',
                                     mapping_config: dict[str, Any] = None, standby: bool = False,
-                                    edc_slicing: dict[str, int] = None, cool_down: float = 0):
+                                    edc_slicing: dict[str, int] = None, cool_down: float = 0,
+                                    delta_reports: bool = False, report_quantum: float = 0):
         if self.edcs_config is None:
             self.define_edge_fed_config()
-        self.edcs_config.add_r_manager_config(r_manager_id, mapping_id, mapping_config, standby, edc_slicing, cool_down)
+        self.edcs_config.add_r_manager_config(r_manager_id, mapping_id, mapping_config, standby,
+                                              edc_slicing, cool_down, delta_reports, report_quantum)
 
     def add_edc(self, edc_id: str, location: tuple[float, ...], r_manager_id: str | None = None,
                 cooler_id: str | None = None, edc_temp: float = 298, xh_trx: dict[str, Any] = None,
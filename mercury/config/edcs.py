@@ -16,7 +16,9 @@ class ServiceTasksConfig:
         :param max_parallel_tasks: maximum number of tasks that the processing unit can execute in parallel.
                                    It must be greater than 0 (i.e., at least one concurrent task execution).
         :param proc_t_id: processing time model ID to use by the PU when executing tasks of this service.
-        :param proc_t_config: processing time model configuration parameters.
+        :param proc_t_config: processing time model configuration parameters. This configuration creates a model for
+                              estimating expected processing times. Each PU creates its own model for drawing
+                              processing times with the random stream of the PU (see ProcessingUnit).
         :param power_id: power consumption model ID to use by the PU when executing tasks of this service.
         :param power_config: power consumption model configuration parameters.
         """
@@ -32,6 +34,8 @@ class ServiceTasksConfig:
         self.stream: bool = self.sess_required and ServicesConfig.SERVICES[service_id].sess_config.stream
         proc_t_config = {'max_parallel_tasks': max_parallel_tasks} if proc_t_config is None \
             else {**proc_t_config, 'max_parallel_tasks': max_parallel_tasks}
+        self.proc_t_id: str = proc_t_id
+        self.proc_t_config: dict[str, Any] = proc_t_config
         self.proc_t_model: ProcessingUnitProcTimeModel = AbstractFactory.create_edc_pu_proc_t(proc_t_id, **proc_t_config)
         self.power_id: str = power_id
         self.power_config: dict[str, Any] = dict() if power_config is None else power_config
@@ -87,7 +91,8 @@ class CoolerConfig:
 
 class RManagerConfig:
     def __init__(self, mapping_id: str = 'ff', mapping_config: dict[str, Any] = None,
-                 standby: bool = False, edc_slicing: dict[str, int] = None, cool_down: float = 0):
+                 standby: bool = False, edc_slicing: dict[str, int] = None, cool_down: float = 0,
+                 delta_reports: bool = False, report_quantum: float = 0):
         """
         Edge Data Center resource manager configuration.
         :param mapping_id: request mapping function ID. By default, it uses the "First Fit" algorithm.
@@ -96,13 +101,21 @@ class RManagerConfig:
         :param edc_slicing: EDC resource slicing per service. By default, no slicing is enforced.
         :param cool_down: Hot standby cool-down period (i.e., minimum amount of time between hot standby explorations).
                           By default, it is set to 0 (i.e., no cool-down period).
+        :param delta_reports: if True, EDC reports only contain the services whose status changed. Only the PUs that
+                              changed are re-evaluated. By default, it is set to False (i.e., complete reports).
+        :param report_quantum: minimum amount of time between consecutive EDC reports. Changes within this period
+                               are coalesced into a single report. By default, it is set to 0 (i.e., no rate limiting).
         """
+        if report_quantum < 0:
+            raise ValueError(f'report_quantum ({report_quantum}) must be greater than or equal to 0')
         self.mapping_id: str = mapping_id
         self.mapping_config: dict[str, Any] = dict() if mapping_config is None else mapping_config
         self.standby: bool = standby
         edc_slicing = dict() if edc_slicing is None else edc_slicing
         self.edc_slicing: dict[str, int] = edc_slicing
         self.cool_down: float = cool_down
+        self.delta_reports: bool = delta_reports
+        self.report_quantum: float = report_quantum
 
 
 class SrvEstimatorConfig:
@@ -198,13 +211,17 @@ class EdgeDataCenterConfig:
 class EdgeFederationConfig:
     def __init__(self, edge_fed_id: str = 'edge_fed', mapping_id: str = 'closest',
                  mapping_config: dict[str, Any] = None, congestion: float = 1,
-                 srv_window_size: dict[str, float] = None, header: int = 0, content: int = 0):
+                 srv_window_size: dict[str, float] = None, header: int = 0, content: int = 0,
+                 report_board: bool = False, report_board_delay: float = 0):
         """
         Edge Federation configuration.
         :param edge_fed_id: ID of the edge computing federation.
         :param congestion: percentage of resources at which an EDC is considered congested. By default, it is 1.
         :param header: size (in bits) of the header of app messages related to edge federation management.
         :param content: size (in bits) of the content of app messages related to edge federation management.
+        :param report_board: if True, EDCs share their reports via a federation-wide in-memory board instead of
+                             sending report packets to each other. By default, it is False.
+        :param report_board_delay: staleness delay (in seconds) of the reports published in the board.
         """
         if 0 > congestion > 1:
             raise ValueError(f'congestion ({congestion}) must be between 0 and 1')
@@ -212,6 +229,8 @@ class EdgeFederationConfig:
             raise ValueError(f'header ({header}) must be greater than or equal to 0')
         if content < 0:
             raise ValueError(f'fed_mgmt_content ({content}) must be greater than or equal to 0')
+        if report_board_delay < 0:
+            raise ValueError(f'report_board_delay ({report_board_delay}) must be greater than or equal to 0')
         self.edge_fed_id: str = edge_fed_id
         self.mapping_id: str = mapping_id
         self.mapping_config: dict[str, Any] = dict() if mapping_config is None else mapping_config
@@ -221,6 +240,8 @@ class EdgeFederationConfig:
         self.r_managers_config: dict[str, RManagerConfig] = dict()
         self.edcs_config: dict[str, EdgeDataCenterConfig] = dict()
         self.congestion: float = congestion
+        self.report_board: bool = report_board
+        self.report_board_delay: float = report_board_delay
         self.srv_profiling_windows: dict[str, float] = dict()
         if srv_window_size is not None:
             for srv_id, window_size in srv_window_size.items():
@@ -267,10 +288,12 @@ class EdgeFederationConfig:
         self.coolers_config[cooler_id] = CoolerConfig(cooler_id, power_id, power_config)
 
     def add_r_manager_config(self, r_manager_id: str, mapping_id: str = 'ff', mapping_config: dict[str, Any] = None,
-                             standby: bool = False, edc_slicing: dict[str, int] = None, cool_down: float = 0):
+                             standby: bool = False, edc_slicing: dict[str, int] = None, cool_down: float = 0,
+                             delta_reports: bool = False, report_quantum: float = 0):
         if r_manager_id in self.r_managers_config:
             raise ValueError(f'Resource manager {r_manager_id} already defined')
-        self.r_managers_config[r_manager_id] = RManagerConfig(mapping_id, mapping_config, standby, edc_slicing, cool_down)
+        self.r_managers_config[r_manager_id] = RManagerConfig(mapping_id, mapping_config, standby, edc_slicing,
+                                                              cool_down, delta_reports, report_quantum)
 
     def add_edc_config(self, edc_id: str, location: tuple[float, ...], r_manager_id: str = None,
                        cooler_id: str = None, edc_temp: float = 298, edc_trx: TransceiverConfig = None,
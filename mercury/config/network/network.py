@@ -1,6 +1,7 @@
 from __future__ import annotations
 from abc import ABC
 from typing import Any
+from ...utils.rng import stream
 
 
 class LinkConfig:
@@ -119,7 +120,7 @@ class WirelessNodeConfig(DynamicNodeConfig):
     def __init__(self, node_id: str, t_start: float, t_end: float, mobility_id: str, mobility_config: dict[str, Any],
                  trx_config: TransceiverConfig | None = None, keep_connected: bool = True):
         from mercury.plugin import AbstractFactory, NodeMobility
-        mobility_config = {**mobility_config, 't_start': t_start, 't_end': t_end}
+        mobility_config = {**mobility_config, 't_start': t_start, 't_end': t_end, 'rng': stream(f'{node_id}_mobility')}
         self.mobility: NodeMobility = AbstractFactory.create_mobility(mobility_id, **mobility_config)
         super().__init__(node_id, t_start, t_end, self.mobility.location, trx_config, keep_connected)
 
@@ -1,4 +1,9 @@
+from __future__ import annotations
 import logging
+import pickle
+from collections import deque
+from logging import DEBUG, INFO, WARNING, ERROR
+from typing import Generator, Iterable
 
 
 logger = logging.getLogger('mercury_logger')
@@ -28,3 +33,129 @@ def add_file_handler(path='mercury.log', formatting='%(asctime)s %(levelname)-8s
 
 def logging_overhead(clock: float, overhead: str) -> str:
     return f'[t={clock:.2f}] {overhead}'
+
+
+_PLAIN_TYPES = (str, int, float, bool, type(None))  # immutable types that are recorded as they are
+
+
+class EventLog:
+    def __init__(self, max_len: int | None = None, path: str | None = None, chunk_size: int = 1024):
+        """
+        Structured event log. Events are recorded as compact tuples (level, clock, overhead, msg, args) and
+        they are only formatted when decoded. Thus, large simulations can keep debug-level traces cheaply.
+        :param max_len: maximum number of events kept in memory (ring buffer). If None, the buffer is unbounded.
+        :param path: path to a binary file to dump events. If None, events are only kept in memory.
+        :param chunk_size: number of events that are dumped to the binary file at once.
+        """
+        if max_len is not None and max_len < 1:
+            raise ValueError(f'max_len ({max_len}) must be greater than 0')
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size ({chunk_size}) must be greater than 0')
+        self.buffer: deque[tuple[int, float, str, str, tuple]] = deque(maxlen=max_len)
+        self.path: str | None = path
+        self.chunk_size: int = chunk_size
+        self._file = None if path is None else open(path, 'wb')
+        self._chunk: list[tuple[int, float, str, str, tuple]] = list()
+
+    def record(self, level: int, clock: float, overhead: str, msg: str, args: tuple):
+        """
+        Records a new event. Arguments of plain types are stored as they are. Any other argument is converted
+        to a string, as it could be modified before the event is decoded.
+        :param level: logging level of the event.
+        :param clock: simulation time of the event.
+        :param overhead: indentation of the event message.
+        :param msg: %-style event message.
+        :param args: arguments of the message.
+        """
+        event = level, clock, overhead, msg, tuple(arg if isinstance(arg, _PLAIN_TYPES) else str(arg) for arg in args)
+        self.buffer.append(event)
+        if self._file is not None:
+            self._chunk.append(event)
+            if len(self._chunk) >= self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        """Dumps all the pending events to the binary file."""
+        if self._file is not None and self._chunk:
+            pickle.dump(self._chunk, self._file, pickle.HIGHEST_PROTOCOL)
+            self._chunk.clear()
+
+    def close(self):
+        """Dumps all the pending events and closes the binary file (if any)."""
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def decode(self, level: int = logging.NOTSET) -> Generator[str, None, None]:
+        """
+        Decodes the events in the ring buffer.
+        :param level: minimum logging level of the events to be decoded.
+        :return: generator of event messages.
+        """
+        return decode_events(self.buffer, level)
+
+    @staticmethod
+    def read(path: str, level: int = logging.NOTSET) -> Generator[str, None, None]:
+        """
+        Decodes the events stored in a binary file.
+        :param path: path to the binary file.
+        :param level: minimum logging level of the events to be decoded.
+        :return: generator of event messages.
+        """
+        with open(path, 'rb') as file:
+            while True:
+                try:
+                    chunk = pickle.load(file)
+                except EOFError:
+                    break
+                yield from decode_events(chunk, level)
+
+
+_event_log: EventLog | None = None
+
+
+def enable_event_log(max_len: int | None = None, path: str | None = None, chunk_size: int = 1024) -> EventLog:
+    """
+    Enables the structured event log. From now on, events are recorded in the event log instead of
+    being formatted and sent to the handlers of the mercury logger. Events are still filtered by the logger level.
+    """
+    global _event_log
+    disable_event_log()
+    _event_log = EventLog(max_len, path, chunk_size)
+    return _event_log
+
+
+def disable_event_log():
+    """Disables the structured event log. Events are sent to the handlers of the mercury logger again."""
+    global _event_log
+    if _event_log is not None:
+        _event_log.close()
+        _event_log = None
+
+
+def get_event_log() -> EventLog | None:
+    return _event_log
+
+
+def log_event(level: int, clock: float, overhead: str, msg: str, *args):
+    """
+    Logs a simulation event. The logger level is checked before formatting anything.
+    :param level: logging level of the event.
+    :param clock: simulation time of the event.
+    :param overhead: indentation of the event message.
+    :param msg: %-style event message.
+    :param args: arguments of the message. They are only formatted if the event is sent to a handler or decoded.
+    """
+    if logger.isEnabledFor(level):
+        if _event_log is not None:
+            _event_log.record(level, clock, overhead, msg, args)
+        else:
+            logger.log(level, '[t=%.2f] %s' + msg, clock, overhead, *args)
+
+
+def decode_events(events: Iterable[tuple[int, float, str, str, tuple]],
+                  level: int = logging.NOTSET) -> Generator[str, None, None]:
+    for event_level, clock, overhead, msg, args in events:
+        if event_level >= level:
+            yield f'{logging.getLevelName(event_level):<8} {logging_overhead(clock, overhead)}{msg % args}'
@@ -1,11 +1,15 @@
 from __future__ import annotations
 import datetime
-from .optimization.allocation_manager import AllocationManager
 from .config.config import MercuryConfig, TransceiverConfig
+from .model.common.coordinator import FastCoordinator
 from .model.model import MercuryModelABC
-from .visualization import *
+from .run_controller import RunController
+from typing import TYPE_CHECKING
 from xdevs.sim import Coordinator
 
+if TYPE_CHECKING:  # The plotting and ML stacks are only imported when required
+    from .optimization.allocation_manager import AllocationManager
+
 
 class Mercury:
     def __init__(self, model: MercuryModelABC):
@@ -21,8 +25,10 @@ class Mercury:
         return self.model.config
 
     # TODO mover el allocation manager a config?
-    def init_allocation_manager(self, data, time_window: float = 60, grid_res: float = 40):
-        self.allocation_manager = AllocationManager(data, time_window, grid_res)
+    def init_allocation_manager(self, data, time_window: float = 60, grid_res: float = 40,
+                                bounds: tuple[float, float] | None = None):
+        from .optimization.allocation_manager import AllocationManager
+        self.allocation_manager = AllocationManager(data, time_window, grid_res, bounds)
 
     def auto_add_aps(self, prefix: str = 'ap', plot: bool = False,
                      xh_trx: TransceiverConfig = None, acc_trx: TransceiverConfig = None):
@@ -49,15 +55,31 @@ class Mercury:
         if plot:
             self.allocation_manager.plot_scenario()
 
-    def start_simulation(self, time_interv: float = 10000, log_time: bool = False):
-        """ Initialize Mercury xDEVS coordinator """
+    def start_simulation(self, time_interv: float = 10000, log_time: bool = False,
+                         controller: RunController | None = None, flatten: bool = False, fast: bool = False):
+        """
+        Initialize Mercury xDEVS coordinator and simulate the scenario.
+        :param time_interv: time (in seconds) to simulate.
+        :param log_time: if True, it prints the time required for creating the engine and simulating.
+        :param controller: optional run controller. If set, the simulation stops as soon as
+        the KPIs of the controller are estimated with the required precision.
+        :param flatten: if True, the model is flattened before simulating (see MercuryModelABC.flatten_model).
+        :param fast: if True, the coordinator only visits active models (see FastCoordinator).
+        :return: wall time required for creating the engine and for simulating.
+        """
         start_date = datetime.datetime.now()
         if not self.model.built:
-            self.model.build()
+            self.model.build(flatten)
+        elif flatten and not self.model.flat:
+            self.model.flatten_model()
 
-        self.coordinator = Coordinator(self.model)
+        self.coordinator = FastCoordinator(self.model) if fast else Coordinator(self.model)
         for transducer in self.model.transducers:
             self.coordinator.add_transducer(transducer)
+        if controller is not None:
+            for kpi in controller.create_kpis(self.model):
+                self.model.retarget(kpi)
+                self.coordinator.add_transducer(kpi)
         self.coordinator.initialize()
 
         finish_date = datetime.datetime.now()
@@ -68,12 +90,20 @@ class Mercury:
             print("*********************")
 
         start_date = datetime.datetime.now()
-        self.coordinator.simulate_time(time_interv=time_interv)
+        if controller is None:
+            self.coordinator.simulate_time(time_interv=time_interv)
+        else:
+            controller.simulate(self.coordinator, time_interv)
         finish_date = datetime.datetime.now()
         sim_time = finish_date - start_date
         if log_time:
             print("*********************")
             print(f'It took {sim_time} seconds to simulate')
+            if controller is not None:
+                if controller.t_stop is not None:
+                    print(f'Simulation stopped at t={controller.t_stop}: KPIs reached the target precision')
+                for kpi_id, estimate in controller.report().items():
+                    print(f'{kpi_id}: {"not enough observations" if estimate is None else estimate}')
             print("*********************")
         for transducer in self.model.transducers:
             transducer.exit()
@@ -82,64 +112,88 @@ class Mercury:
     @staticmethod
     def plot_srv_delay(dirname: str, sep: str = ',', client_id: str = None,
                        service_id: str = None, req_type: str = None, alpha: float = 1):
-        df = pd.read_csv(f'{dirname}/transducer_srv_report_events.csv', sep=sep)
-        if client_id is not None:
-            df = df[df['client_id'] == client_id]
-        if service_id is not None:
-            df = df[df['service_id'] == service_id]
-        if req_type is not None:
-            df = df[df['req_type'] == req_type]
+        """
+        Plots the delay of service requests.
+        :param dirname: directory with the CSV files of the transducers or path to a SQLite results database.
+        """
+        from .analysis.results import read_results, report_path
+        from .visualization import plot_service_delay
+        table = 'transducer_srv_report_events'
+        df = read_results(report_path(dirname, table), table, sep, ['time', 't_delay'],
+                          client_id=client_id, service_id=service_id, req_type=req_type)
         plot_service_delay(df['time'], df['t_delay'], client_id, service_id, req_type, alpha)
 
     @staticmethod
-    def plot_edc_power_demand(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1):
-        df = pd.read_csv(path, sep=sep)
+    def plot_edc_power_demand(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1,
+                              table: str = 'transducer_edc_report_events'):
+        from .analysis.results import read_results
+        from .visualization import plot_edc_power
+        df = read_results(path, table, sep)
         plot_edc_power(df['time'], df['edc_id'], df['power_demand'], stacked=stacked, alpha=alpha)
 
     @staticmethod
-    def plot_edc_it_power(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1):
-        df = pd.read_csv(path, sep=sep)
+    def plot_edc_it_power(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1,
+                          table: str = 'transducer_edc_report_events'):
+        from .analysis.results import read_results
+        from .visualization import plot_edc_power
+        df = read_results(path, table, sep)
         plot_edc_power(df['time'], df['edc_id'], df['it_power'],
                        stacked=stacked, alpha=alpha, nature='Demand (only IT)')
 
     @staticmethod
-    def plot_edc_cooling_power(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1):
-        df = pd.read_csv(path, sep=sep)
+    def plot_edc_cooling_power(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1,
+                               table: str = 'transducer_edc_report_events'):
+        from .analysis.results import read_results
+        from .visualization import plot_edc_power
+        df = read_results(path, table, sep)
         plot_edc_power(df['time'], df['edc_id'], df['cooling_power'],
                        stacked=stacked, alpha=alpha, nature='Demand (only Cooling)')
 
     @staticmethod
-    def plot_edc_power_consumption(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1):
-        df = pd.read_csv(path, sep=sep)
+    def plot_edc_power_consumption(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1,
+                                   table: str = 'transducer_smart_grid_events'):
+        from .analysis.results import read_results
+        from .visualization import plot_edc_power
+        df = read_results(path, table, sep)
         plot_edc_power(df['time'], df['consumer_id'], df['power_consumption'],
                        stacked=stacked, alpha=alpha, nature='Consumption')
 
     @staticmethod
-    def plot_edc_power_storage(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1):
-        df = pd.read_csv(path, sep=sep)
+    def plot_edc_power_storage(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1,
+                               table: str = 'transducer_smart_grid_events'):
+        from .analysis.results import read_results
+        from .visualization import plot_edc_power
+        df = read_results(path, table, sep)
         plot_edc_power(df['time'], df['consumer_id'], df['power_storage'],
                        stacked=stacked, alpha=alpha, nature='Storage')
 
     @staticmethod
-    def plot_edc_power_generation(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1):
-        df = pd.read_csv(path, sep=sep)
+    def plot_edc_power_generation(path: str, sep: str = ',', stacked: bool = False, alpha: float = 1,
+                                  table: str = 'transducer_smart_grid_events'):
+        from .analysis.results import read_results
+        from .visualization import plot_edc_power
+        df = read_results(path, table, sep)
         plot_edc_power(df['time'], df['consumer_id'], df['power_generation'],
                        stacked=stacked, alpha=alpha, nature='Generation')
 
     @staticmethod
-    def plot_edc_energy_stored(path: str, sep: str = ',', alpha: float = 1):
-        df = pd.read_csv(path, sep=sep)
+    def plot_edc_energy_stored(path: str, sep: str = ',', alpha: float = 1,
+                               table: str = 'transducer_smart_grid_events'):
+        from .analysis.results import read_results
+        from .visualization import plot_edc_energy
+        df = read_results(path, table, sep)
         plot_edc_energy(df['time'], df['consumer_id'], df['energy_stored'], alpha=alpha)
 
     @staticmethod
-    def plot_network_bw(path: str, sep: str = ',', node_from: str = None, node_to: str = None, alpha: float = 1):
-        df = pd.read_csv(path, sep=sep)
+    def plot_network_bw(path: str, sep: str = ',', node_from: str = None, node_to: str = None, alpha: float = 1,
+                        table: str = 'transducer_network_events'):
+        from .analysis.results import read_results
+        from .visualization import plot_network_bw
+        df = read_results(path, table, sep, node_from=node_from, node_to=node_to)
         subtitle = None
         if node_from is not None:
-            df = df[df['node_from'] == node_from]
             subtitle = f'(from {node_from}'
         if node_to is not None:
-            df = df[df['node_to'] == node_to]
             subtitle = f'(to {node_to}' if subtitle is None else f'{subtitle} to {node_to}'
         if subtitle is not None:
             subtitle = f'{subtitle})'
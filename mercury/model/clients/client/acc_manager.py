@@ -2,7 +2,7 @@ from __future__ import annotations
 from math import inf
 from mercury.config.gateway import GatewaysConfig
 from mercury.config.network import DynamicNodeConfig, WiredNodeConfig
-from mercury.logger import logger as logging, logging_overhead
+from mercury.logger import log_event, INFO, WARNING
 from mercury.msg.client import SendPSS, ServiceActive, GatewayConnection
 from mercury.msg.network import NewNodeLocation
 from mercury.msg.packet.app_packet.acc_packet import *
@@ -65,28 +65,26 @@ class AccessManager(ExtendedAtomic):
 
     def deltint_extension(self):
         self.passivate(self.phase)
-        overhead = logging_overhead(self._clock, self.LOGGING_OVERHEAD)
         if self.phase == self.PHASE_DISCONNECTED:
-            self.deltint_disconnected(overhead)
+            self.deltint_disconnected()
         elif self.phase == self.PHASE_CONNECTED:
-            self.deltint_connected(overhead=overhead)
+            self.deltint_connected()
         if not self.msg_queue_empty():
             self.activate(self.phase)
 
     def deltext_extension(self, e):
-        overhead = logging_overhead(self._clock, self.LOGGING_OVERHEAD)
         self.update_active_srv()
-        msgs = self.filter_acc_msg(overhead)
+        msgs = self.filter_acc_msg()
         if self.phase == self.PHASE_DISCONNECTED:
-            self.deltint_disconnected(overhead)
+            self.deltint_disconnected()
         elif self.phase == self.PHASE_AWAIT_CONNECTION:
-            self.deltext_await_connection(msgs, overhead)
+            self.deltext_await_connection(msgs)
         elif self.phase == self.PHASE_CONNECTED:
-            self.deltext_connected(msgs, overhead)
+            self.deltext_connected(msgs)
         elif self.phase == self.PHASE_AWAIT_HO:
-            self.deltext_await_ho(msgs, overhead)
+            self.deltext_await_ho(msgs)
         elif self.phase == self.PHASE_AWAIT_DISCONNECTION:
-            self.deltext_await_disconnection(msgs, overhead)
+            self.deltext_await_disconnection(msgs)
         self.process_new_location()
         if not self.msg_queue_empty():
             self.sigma = 0
@@ -101,7 +99,7 @@ class AccessManager(ExtendedAtomic):
     def exit(self):
         pass
 
-    def deltint_disconnected(self, overhead: str):
+    def deltint_disconnected(self):
         self.phase = self.PHASE_DISCONNECTED
         if self.connection_req:
             if not self.wired:
@@ -113,10 +111,11 @@ class AccessManager(ExtendedAtomic):
                 else:
                     self.t_pss_window = self._clock + GatewaysConfig.PSS_WINDOW
                     if self.t_pss_window < self.t_end:
-                        logging.info(f'{overhead}{self.client_id} sniffing gateways...')
+                        log_event(INFO, self._clock, self.LOGGING_OVERHEAD, '%s sniffing gateways...', self.client_id)
                         self.add_msg_to_queue(self.output_send_pss, SendPSS(self.client_id, None))
             if self.next_gw is not None:
-                logging.info(f'{overhead}{self.client_id} connecting to gateway {self.next_gw}...')
+                log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                          '%s connecting to gateway %s...', self.client_id, self.next_gw)
                 self.aux_req = ConnectRequest(self.client_id, self.next_gw, self._clock)
                 self.aux_req.send(self._clock)
                 self.add_msg_to_queue(self.output_acc, self.aux_req)
@@ -124,7 +123,7 @@ class AccessManager(ExtendedAtomic):
         else:
             self.perceived_snr = dict()
 
-    def deltint_connected(self, overhead: str, connected: bool = True):
+    def deltint_connected(self, connected: bool = True):
         self.phase = self.PHASE_CONNECTED
         if self.connection_req:
             if not self.wired:
@@ -149,7 +148,8 @@ class AccessManager(ExtendedAtomic):
             if connected:
                 self.add_msg_to_queue(self.output_gateway, GatewayConnection(self.client_id, None))
                 self.add_msg_to_queue(self.output_connected, False)
-            logging.info(f'{overhead} {self.client_id} disconnecting from gateway {self.gateway}...')
+            log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                      ' %s disconnecting from gateway %s...', self.client_id, self.gateway)
             self.activate(self.PHASE_AWAIT_DISCONNECTION)
 
     def update_active_srv(self):
@@ -159,7 +159,7 @@ class AccessManager(ExtendedAtomic):
             elif msg.service_id in self.active_srv:
                 self.active_srv.remove(msg.service_id)
 
-    def filter_acc_msg(self, overhead: str):
+    def filter_acc_msg(self):
         if not self.wired:
             res = list()
             for msg in self.input_acc.values:
@@ -168,7 +168,8 @@ class AccessManager(ExtendedAtomic):
                     if gateway_id not in self.perceived_snr or self.perceived_snr[gateway_id] != snr:
                         if self._clock > self.t_pss_window or self.t_pss_window == inf:  # TODO revisar esto
                             self.t_pss_window = self._clock + GatewaysConfig.PSS_WINDOW
-                        logging.info(f'{overhead}{self.client_id}<---{gateway_id}: PSS message (SNR = {snr})')
+                        log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                                  '%s<---%s: PSS message (SNR = %s)', self.client_id, gateway_id, snr)
                         self.perceived_snr[gateway_id] = snr
                 else:
                     res.append(msg)
@@ -186,38 +187,41 @@ class AccessManager(ExtendedAtomic):
             elif self.phase == self.PHASE_AWAIT_CONNECTION or self.phase == self.PHASE_AWAIT_HO:
                 self.add_msg_to_queue(self.output_send_pss, SendPSS(self.client_id, self.next_gw))
 
-    def deltext_await_connection(self, msgs: Iterable[AppPacket], overhead: str):
+    def deltext_await_connection(self, msgs: Iterable[AppPacket]):
         for msg in msgs:
             if isinstance(msg, ConnectResponse) and msg.request == self.aux_req:
                 self.aux_req = None
                 msg.receive(self._clock)
                 if not self.wired:
                     self.next_gw = None
-                log_msg = f'{overhead}{self.client_id}<---{msg.gateway_id}: connect response: {msg.response}'
+                log_msg = '%s<---%s: connect response: %s'
+                log_args = self.client_id, msg.gateway_id, msg.response
                 if msg.response:
                     self.gateway = msg.gateway_id
                     if self.connection_req:
-                        logging.info(log_msg)
+                        log_event(INFO, self._clock, self.LOGGING_OVERHEAD, log_msg, *log_args)
                         self.add_msg_to_queue(self.output_connected, True)
                         self.add_msg_to_queue(self.output_gateway, GatewayConnection(self.client_id, self.gateway))
                     else:
-                        logging.info(f'{log_msg}, but connection is not required anymore. Disconnecting...')
-                    self.deltint_connected(log_msg, False)
+                        log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                                  f'{log_msg}, but connection is not required anymore. Disconnecting...', *log_args)
+                    self.deltint_connected(False)
                 else:
                     self.perceived_snr = dict()
                     self.t_pss_window = self._clock
-                    logging.warning(log_msg)
-                    self.deltint_disconnected(overhead)
+                    log_event(WARNING, self._clock, self.LOGGING_OVERHEAD, log_msg, *log_args)
+                    self.deltint_disconnected()
                 return
 
-    def deltext_connected(self, msgs: Iterable[AppPacket], overhead: str):
+    def deltext_connected(self, msgs: Iterable[AppPacket]):
         if not self.wired:
             for msg in msgs:
                 if isinstance(msg, StartHandOver):
                     assert msg.gateway_from == self.gateway
                     msg.receive(self._clock)
                     self.next_gw = msg.gateway_to
-                    logging.info(f'{overhead}{self.client_id}<---{self.gateway}: start HO to gateway {self.next_gw} request.')
+                    log_event(INFO, self._clock, self.LOGGING_OVERHEAD, '%s<---%s: start HO to gateway %s request.',
+                              self.client_id, self.gateway, self.next_gw)
                     msg = HandOverRequest(msg.ho_data, self._clock)
                     msg.send(self._clock)
                     self.add_msg_to_queue(self.output_acc, msg)
@@ -225,16 +229,17 @@ class AccessManager(ExtendedAtomic):
                     self.add_msg_to_queue(self.output_gateway, GatewayConnection(self.client_id, None))
                     self.activate(self.PHASE_AWAIT_HO)
                     return
-        self.deltint_connected(overhead)
+        self.deltint_connected()
 
-    def deltext_await_ho(self, msgs: Iterable[AppPacket], overhead: str):
+    def deltext_await_ho(self, msgs: Iterable[AppPacket]):
         for msg in msgs:
             if isinstance(msg, HandOverResponse):
                 assert msg.gateway_to == self.next_gw
                 assert msg.gateway_from == self.gateway
                 msg.receive(self._clock)
                 response = msg.response
-                logging.info(f'{overhead}{self.client_id}<---{self.next_gw}: HO from AP {self.gateway} response: {response}')
+                log_event(INFO, self._clock, self.LOGGING_OVERHEAD, '%s<---%s: HO from AP %s response: %s',
+                          self.client_id, self.next_gw, self.gateway, response)
                 if response:
                     self.gateway = self.next_gw
                 self.next_gw = None
@@ -244,25 +249,26 @@ class AccessManager(ExtendedAtomic):
                 if self.connection_req:
                     self.add_msg_to_queue(self.output_connected, True)
                     self.add_msg_to_queue(self.output_gateway, GatewayConnection(self.client_id, self.gateway))
-                self.deltint_connected(overhead, self.connection_req)
+                self.deltint_connected(self.connection_req)
                 return
 
-    def deltext_await_disconnection(self, msgs: Iterable[AppPacket], overhead: str):
+    def deltext_await_disconnection(self, msgs: Iterable[AppPacket]):
         for msg in msgs:
             if isinstance(msg, DisconnectResponse) and msg.request == self.aux_req:
                 msg.receive(self._clock)
                 gateway_id = msg.node_from
                 response = msg.response
-                log_msg = f'{overhead}{self.client_id}<---{gateway_id}: Disconnect response: {response}'
+                log_msg = '%s<---%s: Disconnect response: %s'
                 if response:
                     self.gateway = None
                     if self.connection_req:
                         log_msg = f'{log_msg}, but client requires to be connected again'
                     else:
                         self.perceived_snr = dict()
-                    logging.info(log_msg)
-                    self.deltint_disconnected(overhead)
+                    log_event(INFO, self._clock, self.LOGGING_OVERHEAD, log_msg, self.client_id, gateway_id, response)
+                    self.deltint_disconnected()
                 else:
-                    logging.warning(f'{log_msg}')
-                    self.deltint_connected(overhead, False)
+                    log_event(WARNING, self._clock, self.LOGGING_OVERHEAD,
+                              log_msg, self.client_id, gateway_id, response)
+                    self.deltint_connected(False)
                 return
@@ -2,11 +2,12 @@ from __future__ import annotations
 from collections import deque
 from mercury.config.client import SrvConfig
 from mercury.config.transducers import TransducersConfig
-from mercury.logger import logger as logging, logging_overhead
+from mercury.logger import logger, log_event, INFO, WARNING
 from mercury.msg.client import ServiceActive, GatewayConnection, ServiceReport
 from mercury.msg.packet.app_packet.srv_packet import *
 from mercury.plugin import AbstractFactory, SrvRequestGenerator, SrvActivityGenerator, SrvActivityWindowGenerator
-from random import uniform
+from mercury.utils.rng import stream
+from random import Random
 from xdevs.models import Port
 from ....common import ExtendedAtomic
 
@@ -56,15 +57,18 @@ class SrvManager(ExtendedAtomic):
         self.close_sess_missed_deadlines: int = 0
         self.t_sess: float = 0
 
-        guard_time = uniform(0, ServicesConfig.SRV_MAX_GUARD)
+        guard_time = stream(f'{self.name}_guard').uniform(0, ServicesConfig.SRV_MAX_GUARD)
         self.session: bool = self.srv_config.sess_required
-        activity_gen_config = {**self.srv_config.activity_gen_config, 't_start': self._clock + guard_time}
+        activity_gen_config = {**self.srv_config.activity_gen_config, 't_start': self._clock + guard_time,
+                               'rng': stream(f'{self.name}_activity')}
         self.activity_generator: SrvActivityGenerator = AbstractFactory.create_srv_activity_generator(
             self.srv_config.activity_gen_id, **activity_gen_config)
-        activity_window_config = {**self.srv_config.activity_window_config, 't_start': self._clock + guard_time}
+        activity_window_config = {**self.srv_config.activity_window_config, 't_start': self._clock + guard_time,
+                                  'rng': stream(f'{self.name}_window')}
         self.activity_window: SrvActivityWindowGenerator = AbstractFactory.create_srv_activity_window(
             self.srv_config.activity_window_id, **activity_window_config)
         self.req_generator: SrvRequestGenerator | None = None
+        self.req_rng: Random = stream(f'{self.name}_req')  # shared by the request generators of every window
 
         self.input_srv: Port[AppPacket] = Port(AppPacket, 'input_srv')
         self.input_gateway: Port[GatewayConnection] = Port(GatewayConnection, 'input_gateway')
@@ -108,16 +112,15 @@ class SrvManager(ExtendedAtomic):
             self.sigma = 0  # If message queue is not empty after the internal transition, it activates in its new phase
 
     def deltext_extension(self, e):
-        overhead = logging_overhead(self._clock, self.LOGGING_OVERHEAD)
-        self.check_connected_ap(overhead)
+        self.check_connected_ap()
         if self.phase == self.PHASE_INACTIVE:
             self.continuef(e)
         elif self.phase == self.PHASE_AWAIT_OPEN:
-            self.deltext_await_open(e, overhead)
+            self.deltext_await_open(e)
         elif self.phase == self.PHASE_ACTIVE:
-            self.deltext_active(e, overhead)
+            self.deltext_active(e)
         elif self.phase == self.PHASE_AWAIT_CLOSE:
-            self.deltext_await_close(e, overhead)
+            self.deltext_await_close(e)
         if not self.msg_queue_empty():
             self.sigma = 0
         self.prev_gateway = self.gateway_id
@@ -133,7 +136,7 @@ class SrvManager(ExtendedAtomic):
         pass
 
     def new_req_generator(self, t_start: float) -> SrvRequestGenerator:
-        req_gen_config = {**self.srv_config.req_gen_config, 't_start': t_start}
+        req_gen_config = {**self.srv_config.req_gen_config, 't_start': t_start, 'rng': self.req_rng}
         return AbstractFactory.create_srv_req_generator(self.srv_config.req_gen_id, **req_gen_config)
 
     def update_req_buffer(self):
@@ -221,46 +224,44 @@ class SrvManager(ExtendedAtomic):
                 self.sent_req.send_req(self._clock, self.gateway_id, self.server_id)
                 self.add_msg_to_queue(self.output_srv, self.sent_req)
 
-    def check_connected_ap(self, overhead: str):
+    def check_connected_ap(self):
         if self.input_gateway:
             self.gateway_id = self.input_gateway.get().gateway_id
-            logging.info(f'{overhead}{self.client_id} is now connected to gateway {self.gateway_id}')
+            log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                      '%s is now connected to gateway %s', self.client_id, self.gateway_id)
 
-    def deltext_await_open(self, e: float, overhead: str):
+    def deltext_await_open(self, e: float):
         for resp in self.input_srv.values:
             if isinstance(resp, OpenSessResponse) and resp.request == self.sent_req:
                 resp.receive(self._clock)
                 self.sent_req = None
                 server_id = resp.response
-                log_msg = f'{overhead}{self.client_id} received {resp.request} response: {resp}'
                 if server_id is not None:
-                    log_function = logging.info
                     if resp.deadline_met:
                         self.open_sess_met_deadlines += 1
                     else:
                         self.open_sess_missed_deadlines += 1
-                        log_function = logging.warning
-                        log_msg = f'{log_msg} (missed deadline)'
+                    log_level = INFO if resp.deadline_met else WARNING
                     self.aux_req = None
                     self.sessions.append((resp.deadline_met, None))
                     self.send_report(resp)
                     self.server_id = server_id
-                    log_msg = f'{log_msg}; delay: {resp.t_delay:.3f} seconds; miss ratio: {self.open_sess_miss_ratio:.3f}'
                     if self._clock < self.t_end:
                         self.t_window = min(self._clock + self.activity_window._compute_next_ta(), self.t_end)
                         self.req_generator = self.new_req_generator(self._clock)
                         self.update_req_buffer()
-                        log_function(log_msg)
+                        self.log_response(log_level, resp, True)
                         self.deltint_active()
                     else:
-                        log_function(f'{log_msg}, but client needs to be removed. Closing session...')
+                        self.log_response(log_level, resp, True, ', but client needs to be removed. Closing session...')
                         self.deltint_await_close()
                 elif self._clock < self.t_end:
-                    logging.warning(f'{log_msg}. Waiting cool down to try again...')
+                    self.log_response(WARNING, resp, False, '. Waiting cool down to try again...')
                     self.t_cool_down = self._clock + self.srv_config.cool_down
                     self.deltint_await_open()
                 else:
-                    logging.info(f'{log_msg}, but client needs to be removed. Moving to phase inactive...')
+                    self.log_response(INFO, resp, False,
+                                      ', but client needs to be removed. Moving to phase inactive...')
                     self.add_msg_to_queue(self.output_active, ServiceActive(self.client_id, self.service_id, False))
                     self.deltint_inactive()
                 return
@@ -269,37 +270,28 @@ class SrvManager(ExtendedAtomic):
         else:
             self.continuef(e)
 
-    def deltext_active(self, e, overhead):
+    def deltext_active(self, e):
         for resp in self.input_srv.values:
             if isinstance(resp, SrvResponse) and resp.request == self.sent_req:
                 resp.receive(self._clock)
                 self.sent_req = None
                 request = resp.request
                 response = resp.response
-                log_function = logging.info
-                log_msg = f'{overhead}{self.client_id} received {request} response: {resp}'
                 if response:
                     if resp.deadline_met:
                         self.srv_met_deadlines += 1
                     else:
-                        log_function = logging.warning
-                        log_msg = f'{log_msg} (missed deadline)'
                         self.srv_missed_deadlines += 1
                     self.send_report(resp)
-                    log_msg = f'{log_msg}; delay: {resp.t_delay:.3f} seconds; miss ratio: {self.srv_miss_ratio:.3f}'
+                    self.log_response(INFO if resp.deadline_met else WARNING, resp, True)
+                elif self._clock < self.t_window:
+                    self.req_buffer.appendleft(request)
+                    self.t_cool_down = self._clock + self.srv_config.cool_down
+                    self.log_response(WARNING, resp, False, '. Waiting cool down to try again...')
                 else:
-                    log_function = logging.warning
-                    if self._clock < self.t_window:
-                        log_msg = f'{log_msg}. Waiting cool down to try again...'
-                        self.req_buffer.appendleft(request)
-                        self.t_cool_down = self._clock + self.srv_config.cool_down
-                    else:
-                        self.req_n -= 1
-                        if self.session:
-                            log_msg = f'{log_msg}, but request window finished. Closing session...'
-                        else:
-                            log_msg = f'{log_msg}, but request window finished. Moving to phase inactive...'
-                log_function(log_msg)
+                    self.req_n -= 1
+                    self.log_response(WARNING, resp, False, ', but request window finished. Closing session...'
+                                      if self.session else ', but request window finished. Moving to phase inactive...')
                 self.deltint_active()
                 return
         if self.prev_gateway is None and self.gateway_id is not None:
@@ -307,34 +299,29 @@ class SrvManager(ExtendedAtomic):
         else:
             self.continuef(e)
 
-    def deltext_await_close(self, e: float, overhead: str):
+    def deltext_await_close(self, e: float):
         for resp in self.input_srv.values:
             if isinstance(resp, CloseSessResponse) and resp.request == self.sent_req:
                 resp.receive(self._clock)
                 self.sent_req = None
                 request = resp.request
                 response = resp.response
-                log_msg = f'{overhead}{self.client_id} received {request} response: {resp} seconds'
                 if response < 0:
-                    logging.warning(f'{log_msg}. Waiting cool down to try again...')
+                    self.log_response(WARNING, resp, False, '. Waiting cool down to try again...')
                     self.t_cool_down = self._clock + self.srv_config.cool_down
                     self.deltint_await_close()
                 else:
-                    log_function = logging.info
                     if resp.deadline_met:
                         self.close_sess_met_deadlines += 1
-                    if not resp.deadline_met:
+                    else:
                         self.close_sess_missed_deadlines += 1
-                        log_function = logging.warning
-                        log_msg = f'{log_msg} (missed deadline)'
                     self.aux_req = None
                     deadline_met, t_sess = self.sessions.pop()
                     assert t_sess is None
                     self.t_sess += response
                     self.sessions.append((deadline_met, response))
                     self.send_report(resp)
-                    log_msg = f'{log_msg}; delay: {resp.t_delay:.3f} seconds; miss ratio: {self.close_sess_miss_ratio:.3f}'
-                    log_function(log_msg)
+                    self.log_response(INFO if resp.deadline_met else WARNING, resp, True)
                     self.activity_generator.next_activity(self._clock)
                     if self.activity_generator.next_t <= self._clock < self.t_end:
                         self.deltint_await_open()
@@ -347,6 +334,31 @@ class SrvManager(ExtendedAtomic):
         else:
             self.continuef(e)
 
+    def log_response(self, level: int, resp: SrvRelatedResponse, served: bool, outcome: str = ''):
+        """
+        Logs the reception of a response. Messages and miss ratios are only computed if the logger level requires it.
+        :param level: logging level of the event.
+        :param resp: received response.
+        :param served: if True, the server accepted the request, and the delay and the miss ratio are logged.
+        :param outcome: description of what the client does next (appended to the message).
+        """
+        if not logger.isEnabledFor(level):
+            return
+        log_msg = '%s received %s response: %s seconds' if isinstance(resp, CloseSessResponse) \
+            else '%s received %s response: %s'
+        log_args = [self.client_id, resp.request, resp]
+        if served:
+            if isinstance(resp, OpenSessResponse):
+                miss_ratio = self.open_sess_miss_ratio
+            elif isinstance(resp, CloseSessResponse):
+                miss_ratio = self.close_sess_miss_ratio
+            else:
+                miss_ratio = self.srv_miss_ratio
+            log_msg = f'{log_msg}{"" if resp.deadline_met else " (missed deadline)"}; delay: %.3f seconds; ' \
+                      'miss ratio: %.3f'
+            log_args += [resp.t_delay, miss_ratio]
+        log_event(level, self._clock, self.LOGGING_OVERHEAD, log_msg + outcome, *log_args)
+
     def send_report(self, response: SrvRelatedResponse):
         if TransducersConfig.LOG_SRV:
             acc_met_deadlines = -1
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import heapq
 from abc import ABC, abstractmethod
 from math import inf
 from mercury.config.client import ClientConfig
@@ -9,16 +10,21 @@ from mercury.msg.network import NewNodeLocation
 from mercury.msg.packet import AppPacket, PhysicalPacket, PacketInterface
 from typing import Generic, Type
 from xdevs.models import Port
-from xdevs.sim import Coordinator, SimulationClock
+from xdevs.sim import SimulationClock
 from .client import ClientABC, Client, ClientShortcut, ClientLite
-from ...model.common import ExtendedAtomic
+from ...model.common import ExtendedAtomic, FastCoordinator
 
 
 class ClientsABC(ExtendedAtomic, ABC):
     def __init__(self):
         super().__init__('clients')
-        self.clients: dict[str, Coordinator] = dict()
+        self.clients: dict[str, FastCoordinator] = dict()
         self.root_clock: SimulationClock = SimulationClock()  # Root simulation clock shared among all the clients
+        # Only imminent clients are visited: (time of the next event, client number, client ID)
+        self.clients_queue: list[tuple[float, int, str]] = list()
+        self.clients_n: dict[str, int] = dict()
+        self.n_clients: int = 0
+        self.active_clients: set[str] = set()  # clients that changed their state during the current transition
 
         # Define common input/output ports
         self.input_create_client: Port[ClientConfig] = Port(ClientConfig, 'input_create_client')
@@ -46,6 +52,7 @@ class ClientsABC(ExtendedAtomic, ABC):
                 self.collect_output(self.clients[client_id].model)
             self.clients[client_id].deltfcn()
             self.clients[client_id].clear()
+            self.schedule_client(client_id)
         self.clients_internal()                 # resolve any internal event of existing clientss
         self.remove_clients()                   # remove outdated clientss
         self.hold_in('passive', self.next_sigma())
@@ -63,29 +70,52 @@ class ClientsABC(ExtendedAtomic, ABC):
         client_id: str = client_config.client_id
         if client_id in self.clients:
             raise ValueError(f'client with id {client_id} already exists')
-        client = Coordinator(self._create_client(client_config), self.root_clock)
+        client = FastCoordinator(self._create_client(client_config), self.root_clock)
         client.initialize()
         self.clients[client_id] = client
+        self.clients_n[client_id] = self.n_clients
+        self.n_clients += 1
+        self.schedule_client(client_id)
         self.add_msg_to_queue(self.output_create_client, client_config.node_config)
 
+    def schedule_client(self, client_id: str):
+        self.active_clients.add(client_id)
+        heapq.heappush(self.clients_queue, (self.clients[client_id].time_next, self.clients_n[client_id], client_id))
+
+    def scheduled(self, entry: tuple[float, int, str]) -> bool:
+        """:return: False if the entry of the clients queue is outdated (i.e., the client changed or was removed)."""
+        time_next, client_n, client_id = entry
+        return self.clients_n.get(client_id) == client_n and self.clients[client_id].time_next == time_next
+
     def clients_internal(self):
-        for client_id, client in self.clients.items():
+        imminent = set()
+        while self.clients_queue and self.clients_queue[0][0] <= self.root_clock.time:
+            entry = heapq.heappop(self.clients_queue)
+            if self.scheduled(entry):
+                imminent.add(entry[1:])
+        for _, client_id in sorted(imminent):  # clients are visited in the order they were created
+            client = self.clients[client_id]
             # we execute as many internal transitions as needed to get a sigma greater than zero
             while client.time_next <= self.root_clock.time:
                 client.lambdaf()                    # We trigger their lambdas...
                 self.collect_output(client.model)   # ... collect output messages to forward them...
                 client.deltfcn()                    # ... Compute the next client state...
                 client.clear()                      # ... and clear the output
+            self.schedule_client(client_id)
 
     def remove_clients(self):
-        trash = {client_id for client_id, client in self.clients.items() if client.model.ready_to_dump}
-        for client_id in trash:
+        trash = {client_id for client_id in self.active_clients if self.clients[client_id].model.ready_to_dump}
+        self.active_clients.clear()
+        for client_id in sorted(trash, key=self.clients_n.get):
             self.clients.pop(client_id)
+            self.clients_n.pop(client_id)
             self.add_msg_to_queue(self.output_remove_client, client_id)
 
     def next_sigma(self):
         if self.msg_queue_empty():
-            min_next_t_client = min((client.time_next for client in self.clients.values()), default=inf)
+            while self.clients_queue and not self.scheduled(self.clients_queue[0]):
+                heapq.heappop(self.clients_queue)
+            min_next_t_client = self.clients_queue[0][0] if self.clients_queue else inf
             return min_next_t_client - self.root_clock.time
         return 0
 
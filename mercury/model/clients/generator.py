@@ -1,5 +1,6 @@
 from __future__ import annotations
 from mercury.config.client import ClientConfig, ClientsConfig
+from mercury.utils.rng import stream
 from ..common.fsm import ExtendedAtomic, Port
 
 
@@ -8,7 +9,8 @@ class ClientGeneratorModel(ExtendedAtomic):
         from mercury.plugin.factory import AbstractFactory, ClientGenerator
         super().__init__('client_generator')
         self.generators: list[ClientGenerator] = list()
-        for generator_id, generator_config in clients_config.generators:
+        for i, (generator_id, generator_config) in enumerate(clients_config.generators):
+            generator_config = {**generator_config, 'rng': stream(f'client_generator_{i}')}
             self.generators.append(AbstractFactory.create_client_generator(generator_id, **generator_config))
         self.output_client_config: Port[ClientConfig] = Port(ClientConfig, 'output_client_config')
         self.add_out_port(self.output_client_config)
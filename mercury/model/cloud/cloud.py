@@ -25,7 +25,7 @@ class Cloud(Coupled, Generic[PacketInterface]):
         super().__init__(f'cloud_{self.cloud_id}')
 
         # GENERIC COMPONENTS (regardless of p_type)
-        self.cloud_pool: CloudPool = CloudPool(cloud_config)
+        self.cloud_pool: CloudPool = CloudPool(cloud_config, TransducersConfig.LOG_CLOUD)
         self.network_delay: CloudNetworkDelay = CloudNetworkDelay(p_type, cloud_config)
         self.add_component(self.cloud_pool)
         self.add_component(self.network_delay)
@@ -48,6 +48,7 @@ class Cloud(Coupled, Generic[PacketInterface]):
         self.add_coupling(self.network_delay.output_to_others, self.output_data)
         if TransducersConfig.LOG_CLOUD:
             self.add_coupling(self.cloud_pool.output_responses, self.cloud_profiler.input_srv)
+            self.add_coupling(self.cloud_pool.output_queue, self.cloud_profiler.input_queue)
             self.add_coupling(self.cloud_profiler.output_profile, self.output_profile)
 
         # MODEL SPECIFICATION (depending on p_type)
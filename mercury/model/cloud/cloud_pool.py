@@ -1,38 +1,101 @@
 from __future__ import annotations
-from mercury.logger import logger as logging, logging_overhead
+from heapq import heappop, heappush
+from mercury.logger import log_event, INFO
 from mercury.config.cloud import CloudConfig, CloudServiceConfig
+from mercury.msg.cloud import CloudQueueReport
 from mercury.msg.packet.app_packet.srv_packet import *
+from mercury.utils.timeline import EventTimeline
 from xdevs.models import Port
 from ..common import ExtendedAtomic
 
 
+class CloudServerPool:
+    def __init__(self, srv_config: CloudServiceConfig):
+        """
+        Pool of identical servers allocated to a cloud service (i.e., M/G/c queue).
+        Both acquiring a server and releasing it are O(log n), where n is the number of requests waiting in the queue.
+        :param srv_config: cloud service configuration.
+        """
+        self.n_servers: int | None = srv_config.n_servers
+        self.queue_policy: str = srv_config.queue_policy
+        self.n_busy: int = 0
+        self.queue: list[tuple[float, int, tuple[str, str]]] = list()
+        self._n_queued: int = 0  # it breaks ties in a FIFO basis
+
+    @property
+    def queue_len(self) -> int:
+        return len(self.queue)
+
+    def acquire(self, t: float, request: SrvRequest) -> bool:
+        """
+        Tries to allocate a server to a new request. If all the servers are busy, the request waits in the queue.
+        :param t: current time.
+        :param request: new service request.
+        :return: True if a server was allocated to the request.
+        """
+        if self.n_servers is None or self.n_busy < self.n_servers:
+            self.n_busy += 1
+            return True
+        priority = request.t_deadline if self.queue_policy == 'edf' else t
+        heappush(self.queue, (priority, self._n_queued, (request.service_id, request.client_id)))
+        self._n_queued += 1
+        return False
+
+    def release(self) -> tuple[str, str] | None:
+        """
+        Releases a server. If there are requests waiting in the queue, the server is allocated to the next one.
+        :return: (service ID, client ID) of the request that occupies the released server (if any).
+        """
+        if self.queue:
+            return heappop(self.queue)[2]
+        self.n_busy -= 1
+
+    def report(self, cloud_id: str, srv_id: str) -> CloudQueueReport:
+        return CloudQueueReport(cloud_id, srv_id, self.n_servers, self.n_busy, self.queue_len)
+
+
 class CloudPool(ExtendedAtomic):
 
     LOGGING_OVERHEAD: str = '                '
 
-    def __init__(self, cloud_config: CloudConfig):
+    def __init__(self, cloud_config: CloudConfig, queue_reports: bool = True):
+        """
+        Cloud pool of servers. It processes the requests of all the cloud services.
+        :param cloud_config: cloud configuration.
+        :param queue_reports: if true, it sends a report every time the queue of a service with finite servers changes.
+                              Reports should only be enabled if the output_queue port is coupled to another model.
+        """
         super().__init__(f'{cloud_config.cloud_id}_pool')
 
         self.cloud_id: str = cloud_config.cloud_id
         self.srv_config: dict[str, CloudServiceConfig] = cloud_config.srv_config
         self.sessions: dict[tuple[str, str], float] = dict()
         self.requests: dict[tuple[str, str], SrvRequest] = dict()
-        self.timeline: dict[float, list[tuple[str, str]]] = dict()
+        self.timeline: EventTimeline[tuple[str, str]] = EventTimeline()
+        self.server_pools: dict[str, CloudServerPool] = {srv_id: CloudServerPool(srv_config)
+                                                         for srv_id, srv_config in self.srv_config.items()}
+        self.queue_reports: bool = queue_reports
+        self.report_required: list[str] = list()
 
         self.input_requests: Port[AppPacket] = Port(AppPacket, 'in_requests')
         self.output_responses: Port[SrvRelatedResponse] = Port(SrvRelatedResponse, 'out_responses')
+        self.output_queue: Port[CloudQueueReport] = Port(CloudQueueReport, 'out_queue')
         self.add_in_port(self.input_requests)
         self.add_out_port(self.output_responses)
+        self.add_out_port(self.output_queue)
 
     def deltint_extension(self):
-        overhead = logging_overhead(self._clock, CloudPool.LOGGING_OVERHEAD)
-        for (client_id, service_id) in self.timeline.pop(self._clock, list()):
-            request = self.requests.pop((client_id, service_id))
-            self.send_response(overhead, SrvResponse(request, True, self._clock))
+        for (service_id, client_id) in self.timeline.pop_until(self._clock):
+            request = self.requests.pop((service_id, client_id))
+            self.send_response(SrvResponse(request, True, self._clock))
+            next_request = self.server_pools[service_id].release()
+            if next_request is not None:
+                self.start_processing(next_request)
+            self.update_queue(service_id)
+        self.send_queue_reports()
         self.sigma = self.next_sigma()
 
     def deltext_extension(self, e):
-        overhead = logging_overhead(self._clock, CloudPool.LOGGING_OVERHEAD)
         for msg in self.input_requests.values:
             msg.receive(self._clock)
             if isinstance(msg, OpenSessRequest):
@@ -44,7 +107,8 @@ class CloudPool(ExtendedAtomic):
             else:
                 raise ValueError('Invalid message type!')
             if response is not None:
-                self.send_response(overhead, response)
+                self.send_response(response)
+        self.send_queue_reports()
         self.sigma = self.next_sigma()
 
     def lambdaf_extension(self):
@@ -76,11 +140,10 @@ class CloudPool(ExtendedAtomic):
         if srv_config.sess_required and (service_id, client_id) not in self.sessions:
             return SrvResponse(request, False, self._clock, 'Bad cloud mapping: required session does not exist')
         if (service_id, client_id) not in self.requests:
-            proc_t = srv_config.proc_t_model.proc_time() + self._clock
-            if proc_t not in self.timeline:
-                self.timeline[proc_t] = list()
-            self.timeline[proc_t].append((service_id, client_id))
             self.requests[(service_id, client_id)] = request
+            if self.server_pools[service_id].acquire(self._clock, request):
+                self.start_processing((service_id, client_id))
+            self.update_queue(service_id)
         elif self.requests[(service_id, client_id)] != request:
             return SrvResponse(request, False, self._clock, 'Cloud is busy with a different request of the same client')
 
@@ -94,10 +157,25 @@ class CloudPool(ExtendedAtomic):
         t_open = self.sessions.pop((service_id, client_id))
         return CloseSessResponse(request, self._clock - t_open, self._clock)
 
-    def send_response(self, overhead: str, response: SrvRelatedResponse):
+    def start_processing(self, request_key: tuple[str, str]):
+        service_id, _ = request_key
+        proc_t = self.srv_config[service_id].proc_t_model.proc_time() + self._clock
+        self.timeline.push(proc_t, request_key)
+
+    def update_queue(self, service_id: str):
+        if self.queue_reports and self.srv_config[service_id].n_servers is not None \
+                and service_id not in self.report_required:
+            self.report_required.append(service_id)
+
+    def send_queue_reports(self):
+        for service_id in self.report_required:
+            self.add_msg_to_queue(self.output_queue, self.server_pools[service_id].report(self.cloud_id, service_id))
+        self.report_required.clear()
+
+    def send_response(self, response: SrvRelatedResponse):
         response.send(self._clock)
         self.add_msg_to_queue(self.output_responses, response)
-        logging.info(f'{overhead}{self.cloud_id} response: {response}')
+        log_event(INFO, self._clock, self.LOGGING_OVERHEAD, '%s response: %s', self.cloud_id, response)
 
     def next_sigma(self):
-        return min(self.timeline, default=inf) - self._clock if self.msg_queue_empty() else 0
+        return self.timeline.time_advance(self._clock) if self.msg_queue_empty() else 0
@@ -2,7 +2,8 @@ from __future__ import annotations
 from math import inf
 from mercury.config.cloud import CloudConfig
 from mercury.msg.packet import PacketInterface, AppPacket
-from random import uniform
+from mercury.utils.rng import stream
+from random import Random
 from typing import Generic, Type, NoReturn
 from xdevs.models import Port
 from ..common.fsm import ExtendedAtomic
@@ -22,6 +23,8 @@ class CloudNetworkDelay(ExtendedAtomic, Generic[PacketInterface]):
         self.loss_p = 0 if p_type == AppPacket else delay_config.pop('loss_p', 0)
         if self.loss_p < 0 or self.loss_p > 1:
             raise ValueError('invalid loss probability value')
+        self.loss_rng: Random = stream(f'{cloud_id}_loss')
+        delay_config = {**delay_config, 'rng': stream(f'{cloud_id}_delay')}
         self.network_delay: CloudNetworkDelay = AbstractFactory.create_cloud_net_delay(delay_id, **delay_config)
 
         self.input_data: Port[PacketInterface] = Port(p_type, "input_data")
@@ -37,7 +40,7 @@ class CloudNetworkDelay(ExtendedAtomic, Generic[PacketInterface]):
 
     def deltext_extension(self, e):
         for msg in self.input_data.values:
-            if self.loss_p == 0 or uniform(0, 1) > self.loss_p:  # input messages can get lost!
+            if self.loss_p == 0 or self.loss_rng.uniform(0, 1) > self.loss_p:  # input messages can get lost!
                 t_out = self._clock + self.network_delay.delay(msg.size)
                 if t_out not in self.msg_buffer:
                     self.msg_buffer[t_out] = list()
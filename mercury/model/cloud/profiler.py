@@ -1,5 +1,5 @@
 from __future__ import annotations
-from mercury.msg.cloud import CloudProfileReport
+from mercury.msg.cloud import CloudProfileReport, CloudQueueReport
 from mercury.msg.packet.app_packet.srv_packet import SrvRelatedResponse
 from mercury.msg.profile import CloudProfile
 from ..common import ExtendedAtomic
@@ -13,11 +13,15 @@ class CloudProfiler(ExtendedAtomic):
         self.report_required = False
         self.cloud_profile: CloudProfile = CloudProfile(cloud_id, srv_profiling_windows)
         self.prev_reports: dict[tuple[str, str, str], CloudProfileReport] = dict()
+        self.queue_reports: dict[str, CloudQueueReport] = dict()
+        self.queue_updated: dict[str, None] = dict()
 
         self.input_srv: Port[SrvRelatedResponse] = Port(SrvRelatedResponse, 'input_srv')
+        self.input_queue: Port[CloudQueueReport] = Port(CloudQueueReport, 'input_queue')
         self.output_profile: Port[CloudProfileReport] = Port(CloudProfileReport, 'output_profile_report')
         self.output_srv: Port[SrvRelatedResponse] = Port(SrvRelatedResponse, 'output_srv')
         self.add_in_port(self.input_srv)
+        self.add_in_port(self.input_queue)
         self.add_out_port(self.output_profile)
         self.add_out_port(self.output_srv)
 
@@ -41,21 +45,34 @@ class CloudProfiler(ExtendedAtomic):
             for response in self.input_srv.values:
                 self.cloud_profile.push(self._clock, response)
                 self.add_msg_to_queue(self.output_srv, response)
+        if self.input_queue:
+            self.report_required = True
+            for queue_report in self.input_queue.values:
+                self.queue_reports[queue_report.srv_id] = queue_report
+                if queue_report.srv_id in self.cloud_profile.profiles:
+                    self.queue_updated[queue_report.srv_id] = None
         self.deltint_extension()
 
     def lambdaf_extension(self):
         pass
 
     def send_profile(self):
-        for srv_id, srv_profile in self.cloud_profile.profiles.items():
-            n_clients = srv_profile.n_clients
-            for req_type, profile in srv_profile.profiles.items():
+        updated = dict(self.cloud_profile.pop_updated())
+        # Changes in the queue of a service must be reported for all its profiling windows
+        for srv_id in self.queue_updated:
+            for req_type, profile in self.cloud_profile.profiles[srv_id].profiles.items():
                 for result, window in profile.profiles.items():
-                    new_report = CloudProfileReport(self.cloud_id, srv_id, n_clients, req_type, result, window.report())
-                    prev_report = self.prev_reports.get((srv_id, req_type, result))
-                    if prev_report is None or new_report != prev_report:
-                        self.prev_reports[(srv_id, req_type, result)] = new_report
-                        self.add_msg_to_queue(self.output_profile, new_report)
+                    updated.setdefault((srv_id, req_type, result), window)
+        self.queue_updated.clear()
+        for (srv_id, req_type, result), window in updated.items():
+            n_clients = self.cloud_profile.profiles[srv_id].n_clients
+            queue_report = self.queue_reports.get(srv_id)
+            new_report = CloudProfileReport(self.cloud_id, srv_id, n_clients, req_type,
+                                            result, window.report(), queue_report)
+            prev_report = self.prev_reports.get((srv_id, req_type, result))
+            if prev_report is None or new_report != prev_report:
+                self.prev_reports[(srv_id, req_type, result)] = new_report
+                self.add_msg_to_queue(self.output_profile, new_report)
 
     def next_sigma(self):
         return self.cloud_profile.t_next - self._clock if self.msg_queue_empty() else 0
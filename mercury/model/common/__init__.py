@@ -1,3 +1,5 @@
+from .coordinator import FastCoordinator
 from .fsm import ExtendedAtomic
+from .hierarchy import atomics, destinations, flatten
 from .multiplexer import Multiplexer
 from .net_manager import NetworkManager
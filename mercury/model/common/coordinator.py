@@ -0,0 +1,157 @@
+from __future__ import annotations
+import heapq
+import itertools
+from collections import defaultdict
+from math import inf
+from xdevs.models import Atomic, Coupled, Port
+from xdevs.sim import Coordinator, SimulationClock, Simulator
+from xdevs.transducers import Transducer
+from .hierarchy import atomics, destinations
+
+
+class FastCoordinator(Coordinator):
+    def __init__(self, model: Coupled, clock: SimulationClock | None = None):
+        """
+        Root xDEVS coordinator that only visits active atomic models. The generic coordinator visits every
+        component and port of the hierarchy at every simulation step. Instead, this coordinator keeps the
+        atomic models in a priority queue sorted by the time of their next internal event, follows the couplings
+        of the ports that actually contain messages, and only clears the ports it used. Thus, passive models
+        (e.g., idle gateways or processing units) do not slow down the simulation.
+        Atomic models are visited in the same order as with the generic coordinator (or with a flat model).
+        The model must not be modified during the simulation, and the time of the next event of atomic models
+        can only change during their own transitions.
+        :param model: root coupled model.
+        """
+        if model.parent is not None:
+            raise ValueError('only root models can be simulated with the fast coordinator')
+        super().__init__(model, clock)
+        # {atomic output port or root input port: destination ports (atomic input ports, root output ports,
+        # and ports of coupled models that are observed by transducers)}
+        self.couplings: dict[Port, list[Port]] = dict()
+        self._indices: dict[Atomic, int] = dict()
+        self._queue: list[tuple[float, int]] = list()  # (time of the next event, index of the simulator)
+        self._observed: dict[Port, list[Transducer]] = dict()  # ports of coupled models observed by transducers
+        self._imminent: set[int] = set()
+        self._receivers: set[int] = set()
+        self._active: list[Simulator] = list()
+        self._used_ports: list[Port] = list()
+
+    def initialize(self):
+        self._build_hierarchy()
+        for i, simulator in enumerate(self.simulators):
+            simulator.initialize()
+            self._schedule(i)
+        self.time_last = self.clock.time
+        self.time_next = self.time_last + self.ta()
+        for transducer in self._transducers:
+            transducer.initialize()
+
+    def _build_hierarchy(self):
+        ports_to_transducers: dict[Port, list[Transducer]] = defaultdict(list)
+        models_to_transducers: dict[Atomic, list[Transducer]] = defaultdict(list)
+        for transducer in self._transducers:
+            for model in transducer.target_components:
+                models_to_transducers[model].append(transducer)
+            for port in transducer.target_ports:
+                ports_to_transducers[port].append(transducer)
+        self.event_transducers_mapping = ports_to_transducers
+        self.state_transducers_mapping = models_to_transducers
+
+        for i, atomic in enumerate(atomics(self.model)):
+            simulator = Simulator(atomic, self.clock, event_transducers_mapping=self.event_transducers_mapping,
+                                  state_transducers_mapping=self.state_transducers_mapping)
+            self.simulators.append(simulator)
+            self._indices[atomic] = i
+            for port in atomic.in_ports:
+                if port.serve:
+                    self.ports_to_serve[f'{atomic.name}.{port.name}'] = port
+        # Transducers of coupled models are triggered in the same order as with the generic coordinator.
+        # Like the generic coordinator, we do not trigger the transducers of the root ports
+        self._observed = {port: ports_to_transducers[port] for coupled in _coupled_models(self.model)
+                          if coupled is not self.model for port in itertools.chain(coupled.in_ports, coupled.out_ports)
+                          if port in ports_to_transducers}
+        for atomic in self._indices:
+            for port in atomic.out_ports:
+                self._add_couplings(port)
+        for port in self.model.in_ports:
+            self._add_couplings(port)
+
+    def _add_couplings(self, port: Port):
+        through: list[Port] = list()
+        ports_to = destinations(port, through)
+        ports_to.extend(port_to for port_to in dict.fromkeys(through) if port_to in self._observed)
+        if ports_to:
+            self.couplings[port] = ports_to
+
+    def _schedule(self, i: int):
+        time_next = self.simulators[i].time_next
+        if time_next < inf:
+            heapq.heappush(self._queue, (time_next, i))
+
+    def ta(self) -> float:
+        # Entries become outdated when the time of the next event of a model changes
+        while self._queue and self.simulators[self._queue[0][1]].time_next != self._queue[0][0]:
+            heapq.heappop(self._queue)
+        return (self._queue[0][0] if self._queue else inf) - self.clock.time
+
+    def _pop_imminent(self):
+        while self._queue and self._queue[0][0] <= self.clock.time:
+            time_next, i = heapq.heappop(self._queue)
+            if self.simulators[i].time_next == time_next == self.clock.time:
+                self._imminent.add(i)
+
+    def _propagate(self, port: Port):
+        for port_to in self.couplings.get(port, ()):
+            port_to.add_to_bag(port)
+            i = self._indices.get(port_to.parent)
+            if i is None:
+                self._used_ports.append(port_to)
+            else:
+                self._receivers.add(i)
+
+    def lambdaf(self):
+        self._pop_imminent()
+        for i in sorted(self._imminent):
+            simulator = self.simulators[i]
+            simulator.lambdaf()
+            for port in simulator.model.used_out_ports:
+                self._propagate(port)
+
+    def deltfcn(self):
+        self._pop_imminent()  # models may also be imminent when messages are injected
+        for port in self.model.used_in_ports:
+            self._propagate(port)
+        for i in sorted(self._imminent | self._receivers):
+            simulator = self.simulators[i]
+            simulator.deltfcn()
+            self._active.append(simulator)
+            self._schedule(i)
+        if self._used_ports and self._observed:
+            for port, transducers in self._observed.items():
+                if port:  # only ports that received messages during this step are not empty
+                    for transducer in transducers:
+                        transducer.add_imminent_port(port)
+        self.time_last = self.clock.time
+        self.time_next = self.time_last + self.ta()
+
+    def clear(self):
+        for simulator in self._active:
+            simulator.clear()
+        for port in self._used_ports:
+            port.clear()
+        for port in self.model.in_ports:
+            port.clear()
+        self._imminent.clear()
+        self._receivers.clear()
+        self._active.clear()
+        self._used_ports.clear()
+
+
+def _coupled_models(model: Coupled) -> list[Coupled]:
+    """:return: coupled models of the hierarchy in the order in which their coordinators finish transitions."""
+    res: list[Coupled] = list()
+    for child in model.components:
+        if isinstance(child, Coupled):
+            res.extend(_coupled_models(child))
+    res.append(model)
+    return res
@@ -0,0 +1,82 @@
+from __future__ import annotations
+from xdevs.models import Atomic, Component, Coupled, Coupling, Port
+
+
+def atomics(component: Component) -> list[Atomic]:
+    """
+    :param component: xDEVS component.
+    :return: list with all the atomic models of the component. They are sorted in the same order in which xDEVS
+    coordinators visit them (i.e., the atomic models of coupled children first, and then the atomic children).
+    """
+    if isinstance(component, Atomic):
+        return [component]
+    res: list[Atomic] = [atomic for child in component.components if isinstance(child, Coupled)
+                         for atomic in atomics(child)]
+    res.extend(child for child in component.components if isinstance(child, Atomic))
+    return res
+
+
+def destinations(port: Port, through: list[Port] | None = None) -> list[Port]:
+    """
+    Follows the couplings of a port to find the final destinations of its messages.
+    :param port: xDEVS port.
+    :param through: if not None, the ports of coupled models that forward the messages are appended to this list.
+    :return: list with the input ports of atomic models and the output ports of the root model that receive the
+    messages of the port.
+    """
+    res: list[Port] = list()
+    pending: list[Port] = [port]
+    while pending:
+        port = pending.pop()
+        component = port.parent
+        if port in component.in_ports:
+            if isinstance(component, Atomic):
+                res.append(port)
+                continue
+            pending.extend(component.eic.get(port, dict()))
+        elif component.parent is None:
+            res.append(port)
+            continue
+        else:
+            pending.extend(component.parent.ic.get(port, dict()))
+            pending.extend(component.parent.eoc.get(port, dict()))
+        if through is not None and isinstance(component, Coupled) and component.parent is not None:
+            through.append(port)
+    return res
+
+
+def flatten(model: Coupled) -> dict[Port, list[Port]]:
+    """
+    Flattens a coupled model: atomic models become children of the model, and couplings connect them directly.
+    Thus, messages do not traverse the ports of intermediate coupled models. Atomic models are sorted as they were
+    visited before flattening, so simultaneous messages keep their order.
+    :param model: root coupled model.
+    :return: {port of a removed coupled model: output ports of the atomic models that sent messages through it}.
+    """
+    if model.parent is not None:
+        raise ValueError('only root models can be flattened')
+    atomic_models = atomics(model)
+    couplings: list[tuple[Port, Port]] = list()
+    sources: dict[Port, list[Port]] = dict()
+    for port in model.in_ports:
+        couplings.extend((port, port_to) for port_to in destinations(port))
+    for atomic in atomic_models:
+        for port in atomic.out_ports:
+            through: list[Port] = list()
+            couplings.extend((port, port_to) for port_to in destinations(port, through))
+            for coupled_port in through:
+                sources.setdefault(coupled_port, list()).append(port)
+
+    model.components = list()
+    model.eic, model.ic, model.eoc = dict(), dict(), dict()
+    for atomic in atomic_models:
+        model.add_component(atomic)
+    for port_from, port_to in couplings:
+        if port_from.parent is model:
+            coupling_set = model.eic
+        elif port_to.parent is model:
+            coupling_set = model.eoc
+        else:
+            coupling_set = model.ic
+        coupling_set.setdefault(port_from, dict())[port_to] = Coupling(port_from, port_to)
+    return sources
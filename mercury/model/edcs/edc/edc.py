@@ -5,6 +5,7 @@ from mercury.msg.edcs import EdgeDataCenterReport, EDCProfileReport
 from mercury.msg.packet import AppPacket, NetworkPacket, PacketInterface, PhysicalPacket
 from mercury.msg.smart_grid import EnergyDemand
 from mercury.utils.amf import AccessManagementFunction
+from mercury.utils.report_board import EDCReportBoard
 from typing import Generic, Type
 from xdevs.models import Coupled, Port
 from .dyn_manager import EDCDynamicManager
@@ -18,7 +19,8 @@ from ...common.net_manager import NetworkManager
 
 class EdgeDataCenter(Coupled, Generic[PacketInterface]):
     def __init__(self, p_type: Type[PacketInterface], edc_id: str, edge_fed_config: EdgeFederationConfig,
-                 gws_config: GatewaysConfig, srv_priority: list[str], amf: AccessManagementFunction):
+                 gws_config: GatewaysConfig, srv_priority: list[str], amf: AccessManagementFunction,
+                 report_board: EDCReportBoard | None = None):
         """
         Edge data center model
         :param p_type: data ports type.
@@ -26,6 +28,7 @@ class EdgeDataCenter(Coupled, Generic[PacketInterface]):
         :param edge_fed_config: Edge federation configuration.
         :param srv_priority: service priority list.
         :param amf: Reference to the Access Management Function. It is used to locate clients in the network.
+        :param report_board: Reference to the federation report board. If None, EDCs exchange report packets.
         """
         self.edc_id: str = edc_id
         edc_config: EdgeDataCenterConfig = edge_fed_config.edcs_config[self.edc_id]
@@ -36,7 +39,7 @@ class EdgeDataCenter(Coupled, Generic[PacketInterface]):
         # GENERIC COMPONENTS (regardless of p_type)
         self.r_manager: EDCResourceManager = EDCResourceManager(edc_config, srv_priority, edge_fed_config.cloud_id)
         self.edc_profiler: EDCProfiler = EDCProfiler(self.edc_id, edge_fed_config.srv_profiling_windows)
-        self.edc_inf: EDCInterface = EDCInterface(self.edc_id, edge_fed_config, gws_config, amf)
+        self.edc_inf: EDCInterface = EDCInterface(self.edc_id, edge_fed_config, gws_config, amf, report_board)
         for component in self.r_manager, self.edc_profiler, self.edc_inf:
             self.add_component(component)
         if self.dynamic:
@@ -53,7 +56,6 @@ class EdgeDataCenter(Coupled, Generic[PacketInterface]):
         self.add_in_port(self.input_data)
         for out_port in self.output_data, self.output_edc_report, self.output_profile_report:
             self.add_out_port(out_port)
-        self.add_out_port(self.output_edc_report)
         if self.smart_grid:
             self.input_sg_report: Port[EnergyDemand] = Port(EnergyDemand, 'input_sg_report')
             self.output_sg_report: Port[EnergyDemand] = Port(EnergyDemand, 'output_sg_report')
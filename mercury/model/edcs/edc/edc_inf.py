@@ -1,13 +1,14 @@
 from __future__ import annotations
 from mercury.config.edcs import EdgeFederationConfig
 from mercury.config.gateway import GatewaysConfig
-from mercury.logger import logger as logging, logging_overhead
+from mercury.logger import log_event, INFO, WARNING
 from mercury.msg.edcs import EdgeDataCenterReport
 from mercury.msg.packet.app_packet import AppPacket
 from mercury.msg.packet.app_packet.edc_packet import EDCReportPacket
 from mercury.msg.packet.app_packet.srv_packet import SrvRelatedRequest, \
     SrvRelatedResponse, SrvRequest, SrvResponse, OpenSessRequest, OpenSessResponse
 from mercury.utils.amf import AccessManagementFunction
+from mercury.utils.report_board import EDCReportBoard
 from xdevs.models import Port
 from ...common import ExtendedAtomic
 
@@ -16,21 +17,23 @@ class EDCInterface(ExtendedAtomic):
     LOGGING_OVERHEAD = '        '
 
     def __init__(self, edc_id: str, edge_fed_config: EdgeFederationConfig,
-                 gws_config: GatewaysConfig, amf: AccessManagementFunction):
+                 gws_config: GatewaysConfig, amf: AccessManagementFunction, report_board: EDCReportBoard | None = None):
         """
         Data Center Interface implementation for xDEVS
         :param edc_id: ID of the corresponding edge data center.
         :param edge_fed_config: edge federation configuration parameters.
         :param gws_config: configuration of the gateways in the RAN.
         :param amf: Reference to the Access Management Function. It is used to locate clients in the network.
+        :param report_board: Reference to the federation report board. If None, EDCs exchange report packets.
         """
         from mercury.plugin import AbstractFactory, ServerMappingStrategy
 
         self.edc_id: str = edc_id
         self.edge_fed_config: EdgeFederationConfig = edge_fed_config
+        self.report_board: EDCReportBoard | None = report_board
         self.mapper: ServerMappingStrategy = AbstractFactory.create_edc_server_mapping(
-            edge_fed_config.mapping_id, **edge_fed_config.mapping_config,
-            edc_id=self.edc_id, amf=amf, gws_config=gws_config, edge_fed_config=edge_fed_config
+            edge_fed_config.mapping_id, **edge_fed_config.mapping_config, edc_id=self.edc_id, amf=amf,
+            gws_config=gws_config, edge_fed_config=edge_fed_config, report_board=report_board
         )
         self.edc_report: EdgeDataCenterReport | None = None
         super().__init__(name=f'edc_{self.edc_id}_inf')
@@ -52,11 +55,15 @@ class EDCInterface(ExtendedAtomic):
         if self.input_report:
             self.edc_report = self.input_report.get()
             self.mapper.update_edc_report(self.edc_report)
-            for edc_id in self.edge_fed_config.edcs_config:
-                if edc_id != self.edc_id:
-                    edc_report_packet = EDCReportPacket(edc_id, self.edc_report, self._clock)
-                    edc_report_packet.send(self._clock)
-                    self.add_msg_to_queue(self.output_app, edc_report_packet)
+            edc_report = self.edc_report.delta_report()  # Other EDCs only receive the services that changed
+            if self.report_board is not None:
+                self.report_board.publish(self._clock, edc_report)
+            else:
+                for edc_id in self.edge_fed_config.edcs_config:
+                    if edc_id != self.edc_id:
+                        edc_report_packet = EDCReportPacket(edc_id, edc_report, self._clock)
+                        edc_report_packet.send(self._clock)
+                        self.add_msg_to_queue(self.output_app, edc_report_packet)
         for msg in self.input_srv.values:
             self.add_msg_to_queue(self.output_app, msg)
         srv_reqs: list[SrvRelatedRequest] = list()
@@ -66,9 +73,16 @@ class EDCInterface(ExtendedAtomic):
                 self.mapper.update_edc_report(msg.edc_report)
             elif isinstance(msg, SrvRelatedRequest):
                 srv_reqs.append(msg)
-        overhead = logging_overhead(self._clock, self.LOGGING_OVERHEAD)
-        for msg in srv_reqs:
-            self.process_srv_request(overhead, msg)
+        if srv_reqs and self.report_board is not None:
+            self.report_board.update(self._clock)
+        if srv_reqs:
+            unmapped = [req for req in srv_reqs if req.server_id != self.edc_id]
+            server_ids = iter(self.mapper.map_servers(unmapped))  # Requests are mapped in a single batch
+            for req in srv_reqs:
+                if req.server_id == self.edc_id:  # Request is already attached to this server
+                    self.add_msg_to_queue(self.output_srv, req)
+                else:
+                    self.process_srv_request(req, next(server_ids))
         self.passivate() if self.msg_queue_empty() else self.activate()
 
     def lambdaf_extension(self):
@@ -80,32 +94,36 @@ class EDCInterface(ExtendedAtomic):
     def exit(self):
         pass
 
-    def process_srv_request(self, overhead: str, req: SrvRelatedRequest):
-        if req.server_id == self.edc_id:  # Request is already attached to this server
-            self.add_msg_to_queue(self.output_srv, req)
-        else:
-            server_id = self.mapper.map_server(req)
-            log_msg = f'{overhead}{self.edc_id}: request {req} server map: {server_id}'
-            if server_id is None:
-                if self.edge_fed_config.cloud_id is not None:
-                    log_msg = f'{log_msg}. Sending to cloud {self.edge_fed_config.cloud_id}'
-                    req.set_server(self.edge_fed_config.cloud_id)
-                    self.add_msg_to_queue(self.output_app, req)
-                else:
-                    req.receive(self._clock)
-                    if isinstance(req, SrvRequest):
-                        output = SrvResponse(req, False, self._clock, 'No available server')
-                    elif isinstance(req, OpenSessRequest):
-                        output = OpenSessResponse(req, None, self._clock, 'No available server')
-                    else:
-                        raise TypeError(f'unknown data type: {type(req)}')
-                    output.send(self._clock)
-                    self.add_msg_to_queue(self.output_app, output)
-                logging.warning(log_msg)
+    def process_srv_request(self, req: SrvRelatedRequest, server_id: str | None):
+        """
+        Forwards a service-related request to the server selected by the server mapping strategy.
+        :param req: service-related request.
+        :param server_id: ID of the selected server. If None, there is no available EDC for the request.
+        """
+        if server_id is None:
+            if self.edge_fed_config.cloud_id is not None:
+                log_event(WARNING, self._clock, self.LOGGING_OVERHEAD,
+                          '%s: request %s server map: %s. Sending to cloud %s',
+                          self.edc_id, req, server_id, self.edge_fed_config.cloud_id)
+                req.set_server(self.edge_fed_config.cloud_id)
+                self.add_msg_to_queue(self.output_app, req)
             else:
-                logging.info(log_msg)
-                req.set_server(server_id)
-                if server_id == self.edc_id:  # Request is already attached to this server
-                    self.add_msg_to_queue(self.output_srv, req)
+                log_event(WARNING, self._clock, self.LOGGING_OVERHEAD,
+                          '%s: request %s server map: %s', self.edc_id, req, server_id)
+                req.receive(self._clock)
+                if isinstance(req, SrvRequest):
+                    output = SrvResponse(req, False, self._clock, 'No available server')
+                elif isinstance(req, OpenSessRequest):
+                    output = OpenSessResponse(req, None, self._clock, 'No available server')
                 else:
-                    self.add_msg_to_queue(self.output_app, req)
+                    raise TypeError(f'unknown data type: {type(req)}')
+                output.send(self._clock)
+                self.add_msg_to_queue(self.output_app, output)
+        else:
+            log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                      '%s: request %s server map: %s', self.edc_id, req, server_id)
+            req.set_server(server_id)
+            if server_id == self.edc_id:  # Request is already attached to this server
+                self.add_msg_to_queue(self.output_srv, req)
+            else:
+                self.add_msg_to_queue(self.output_app, req)
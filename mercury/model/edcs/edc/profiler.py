@@ -49,7 +49,7 @@ class EDCProfiler(ExtendedAtomic):
                 edc_report = edc_report.energy_demand
             if not isinstance(edc_report, EdgeDataCenterReport):
                 raise ValueError('unexpected report type')
-            self.edc_report = edc_report
+            self.edc_report = edc_report.merge(self.edc_report)
             self.edc_report.edc_profile = self.edc_profile
             self.add_msg_to_queue(self.output_edc_report, self.edc_report)
         # Then, we update the EDC profile
@@ -64,15 +64,13 @@ class EDCProfiler(ExtendedAtomic):
         pass
 
     def send_profile(self):
-        for srv_id, srv_profile in self.edc_profile.profiles.items():
-            n_clients = srv_profile.n_clients
-            for req_type, profile in srv_profile.profiles.items():
-                for result, window in profile.profiles.items():
-                    new_report = EDCProfileReport(self.edc_id, srv_id, n_clients, req_type, result, window.report())
-                    prev_report = self.prev_reports.get((srv_id, req_type, result))
-                    if prev_report is None or new_report != prev_report:
-                        self.prev_reports[(srv_id, req_type, result)] = new_report
-                        self.add_msg_to_queue(self.output_profile_report, new_report)
+        for (srv_id, req_type, result), window in self.edc_profile.pop_updated():
+            n_clients = self.edc_profile.profiles[srv_id].n_clients
+            new_report = EDCProfileReport(self.edc_id, srv_id, n_clients, req_type, result, window.report())
+            prev_report = self.prev_reports.get((srv_id, req_type, result))
+            if prev_report is None or new_report != prev_report:
+                self.prev_reports[(srv_id, req_type, result)] = new_report
+                self.add_msg_to_queue(self.output_profile_report, new_report)
 
     def next_sigma(self):
         return self.edc_profile.t_next - self._clock if self.msg_queue_empty() else 0
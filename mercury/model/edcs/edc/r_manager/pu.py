@@ -1,21 +1,148 @@
 from __future__ import annotations
-from math import floor
+from heapq import heappop, heappush
+from itertools import count
+from math import floor, isclose, isfinite
 from mercury.config.edcs import ProcessingUnitConfig
 from mercury.msg.edcs import ProcessingUnitReport
 from mercury.msg.packet.app_packet.srv_packet import *
+from mercury.utils.rng import stream
 from typing import Any
 
 
+class ProcessorSharing:
+    def __init__(self):
+        """
+        Virtual-time processor-sharing engine. All the running processes progress at the same rate, which only
+        depends on the number of running processes. Instead of restarting every process when this rate changes,
+        the engine keeps a virtual clock with the progress made by any running process so far. Each process stores
+        the virtual time at which it finishes in a heap. Thus, starting, stopping, and finishing processes is O(log n).
+        """
+        self.t_last: float = 0
+        self.t_anchor: float = 0  # time at which the processing time changed for the last time
+        self.v_anchor: float = 0  # virtual time at t_anchor
+        self.proc_t: float = inf  # time required for completing a process with the current number of running processes
+        # {process: (virtual finish time, sequence number, start time, remaining progress at start time)}
+        self.processes: dict[SrvRequestProcess, tuple[float, int, float, float]] = dict()
+        self.v_sum: float = 0  # sum of the virtual finish times of all the running processes
+        self._heap: list[tuple[float, int, SrvRequestProcess]] = list()
+        self._seq = count()
+
+    def __len__(self) -> int:
+        return len(self.processes)
+
+    @property
+    def v_clock(self) -> float:
+        """:return: current virtual time (i.e., progress made by any running process since the engine was reset)."""
+        if 0 < self.proc_t < inf:
+            return self.v_anchor + (self.t_last - self.t_anchor) / self.proc_t
+        return self.v_anchor
+
+    @property
+    def remaining(self) -> float:
+        """:return: sum of the remaining progress of all the running processes."""
+        return self.v_sum - len(self.processes) * self.v_clock if self.processes else 0
+
+    @property
+    def next_t(self) -> float:
+        """:return: time at which the next running process finishes if nothing changes."""
+        process = self._head()
+        return inf if process is None else self.t_finish(process)
+
+    def advance(self, t: float):
+        """
+        Advances the clock of the engine.
+        :param t: current time.
+        """
+        if t < self.t_last:
+            raise AssertionError('new time is previous to last time')
+        self.t_last = t
+
+    def set_proc_t(self, proc_t: float):
+        """
+        Sets the processing time of the running processes. The engine must be advanced to the current time first.
+        :param proc_t: time required for completing a process with the current number of running processes.
+        """
+        if proc_t != self.proc_t:
+            self.v_anchor = self.v_clock
+            self.t_anchor = self.t_last
+            self.proc_t = proc_t
+
+    def progress(self, process: SrvRequestProcess) -> float:
+        v_finish, _, t_start, remaining = self.processes[process]
+        if t_start >= self.t_anchor and 0 < self.proc_t < inf:  # processing time did not change since start
+            return min(1 - remaining + (self.t_last - t_start) / self.proc_t, 1)
+        return min(1 - (v_finish - self.v_clock), 1)
+
+    def t_finish(self, process: SrvRequestProcess) -> float:
+        v_finish, _, t_start, remaining = self.processes[process]
+        if t_start >= self.t_anchor:  # processing time did not change since start
+            return t_start + self.proc_t * remaining
+        return self.t_anchor + self.proc_t * (v_finish - self.v_anchor)
+
+    def start(self, process: SrvRequestProcess):
+        """
+        Starts running a process.
+        :param process: process to be started.
+        """
+        seq, remaining = next(self._seq), 1 - process.progress
+        v_finish = self.v_clock + remaining
+        self.processes[process] = v_finish, seq, self.t_last, remaining
+        self.v_sum += v_finish
+        heappush(self._heap, (v_finish, seq, process))
+        process.t_last = self.t_last
+        process.engine = self
+
+    def stop(self, process: SrvRequestProcess) -> float:
+        """
+        Stops running a process.
+        :param process: process to be stopped.
+        :return: progress of the process.
+        """
+        progress = self.progress(process)
+        self.v_sum -= self.processes.pop(process)[0]
+        process.engine = None
+        process.progress = progress
+        process.t_finish = inf
+        process.t_burst += self.t_last - process.t_last
+        process.t_last = self.t_last
+        if not self.processes:  # we reset the engine to keep virtual times small
+            self.t_anchor, self.v_anchor, self.proc_t, self.v_sum = self.t_last, 0, inf, 0
+            self._heap = list()
+        return progress
+
+    def pop_finished(self) -> list[SrvRequestProcess]:
+        """:return: list with all the finished processes. They are sorted by virtual finish time."""
+        finished: list[SrvRequestProcess] = list()
+        process = self._head()
+        while process is not None and self.t_last >= self.t_finish(process):
+            heappop(self._heap)
+            finished.append(process)
+            process = self._head()
+        for process in finished:
+            self.stop(process)
+            process.progress = 1
+        return finished
+
+    def _head(self) -> SrvRequestProcess | None:
+        while self._heap and self.processes.get(self._heap[0][2], (None, None))[1] != self._heap[0][1]:
+            heappop(self._heap)  # we lazily remove stopped processes from the heap
+        return self._heap[0][2] if self._heap else None
+
+
 class ProcessingUnit:
 
+    PROCESSOR_SHARING: bool = True  # If true, deterministic processing units run on a virtual-time engine
+    CHECK_CONSISTENCY: bool = False  # If true, incrementally maintained queue times are checked (only for testing)
+    QUEUE_TIME_TOL: float = 1e-9  # maximum rounding error of incrementally maintained queue times
+
     PHASE_OFF = 'off'
     PHASE_ON = 'on'
     PHASE_TO_ON = 'to_on'
     PHASE_TO_OFF = 'to_off'
 
     def __init__(self, edc_id: str, pu_id: str, pu_config: ProcessingUnitConfig, edc_temp: float, standby: bool):
-        from mercury.plugin import AbstractFactory, ProcessingUnitScheduler, \
-            ProcessingUnitPowerModel, ProcessingUnitTemperatureModel
+        from mercury.plugin import AbstractFactory, ProcessingUnitScheduler, ProcessingUnitPowerModel, \
+            ProcessingUnitProcTimeModel, ProcessingUnitTemperatureModel
         self.update: bool = False
         self.last_t: float = 0
         self.next_t: float = inf
@@ -34,6 +161,11 @@ class ProcessingUnit:
         self.ready_close_sess: dict[str, CloseSessRequest] = dict()
         self.ready_srv_reqs: dict[tuple[str, str], SrvRequestProcess] = dict()
         self.running_processes: list[SrvRequestProcess] = list()
+        self.new_processes: list[SrvRequestProcess] = list()
+        self.reschedule: bool = False
+        # Expected remaining time of ready processes that are not running in the virtual-time engine
+        self.pending_work: float = 0
+        self.n_pending: int = 0
 
         self.scheduler: ProcessingUnitScheduler = AbstractFactory.create_edc_pu_scheduler(pu_config.scheduling_id, **pu_config.scheduling_config)
         power_config: dict[str, Any] = {**self.pu_config.default_power_config, 'max_parallel_tasks': 1}
@@ -41,9 +173,18 @@ class ProcessingUnit:
         temp_config: dict[str, Any] = {**self.pu_config.temperature_config, 'edc_temp': edc_temp}
         self.temp_model: ProcessingUnitTemperatureModel = AbstractFactory.create_edc_pu_temp(self.pu_config.temperature_id, **temp_config)
         self.srv_power_models: dict[str, ProcessingUnitPowerModel] = dict()
+        # Every PU draws processing times from its own random stream, even if it shares its type with other PUs
+        self.srv_proc_t_models: dict[str, ProcessingUnitProcTimeModel] = dict()
         for service_id, srv_config in self.pu_config.srv_configs.items():
             power_config: dict[str, Any] = {**srv_config.power_config, 'max_parallel_tasks': srv_config.max_parallel_tasks}
             self.srv_power_models[service_id] = AbstractFactory.create_edc_pu_pwr(srv_config.power_id, **power_config)
+            proc_t_config: dict[str, Any] = {**srv_config.proc_t_config,
+                                             'rng': stream(f'{edc_id}_{pu_id}_{service_id}_proc_t')}
+            self.srv_proc_t_models[service_id] = AbstractFactory.create_edc_pu_proc_t(srv_config.proc_t_id, **proc_t_config)
+        self.engine: ProcessorSharing | None = None
+        if ProcessingUnit.PROCESSOR_SHARING and all(srv_config.proc_t_model.deterministic
+                                                    for srv_config in self.pu_config.srv_configs.values()):
+            self.engine = ProcessorSharing()
 
     def __lt__(self, other: ProcessingUnit):
         return self.pu_id < other.pu_id
@@ -54,6 +195,61 @@ class ProcessingUnit:
 
     @property
     def queue_time(self):  # TODO calculo el tiempo estimado hasta aceptar una tarea nueva
+        time = self.phase_time
+        if self.service_id is not None:
+            if len(self.sessions) >= self.max_parallel_tasks:
+                time = inf
+        else:
+            time += self.ready_work
+            if ProcessingUnit.CHECK_CONSISTENCY:
+                expected = self._queue_time()
+                tol = ProcessingUnit.QUEUE_TIME_TOL
+                if not isclose(time, expected, rel_tol=tol, abs_tol=tol):
+                    raise AssertionError(f'PU {self.pu_id}: queue time ({time}) does not match ({expected})')
+        return time
+
+    @property
+    def phase_time(self) -> float:
+        """:return: time required for the PU to be switched on."""
+        if self.phase == ProcessingUnit.PHASE_OFF:
+            return self.pu_config.t_on
+        elif self.phase == ProcessingUnit.PHASE_TO_ON:
+            return self.next_t - self.last_t
+        elif self.phase == ProcessingUnit.PHASE_TO_OFF:
+            return self.next_t - self.last_t + self.pu_config.t_on
+        return 0
+
+    @property
+    def ready_work(self) -> float:
+        """:return: expected remaining time of all the ready processes. It is maintained incrementally."""
+        work = self.pending_work
+        if self.engine is not None and self.running_processes:
+            work += self.expected_proc_time(self.running_processes[0].service_id) * self.engine.remaining
+        return work
+
+    def expected_proc_time(self, service_id: str) -> float:
+        return self.pu_config.srv_configs[service_id].proc_t_model.expected_proc_time
+
+    def _add_pending(self, process: SrvRequestProcess):
+        self.pending_work += self.expected_proc_time(process.service_id) * (1 - process.progress)
+        self.n_pending += 1
+
+    def _remove_pending(self, process: SrvRequestProcess):
+        self.n_pending -= 1
+        if self.n_pending > 0:
+            self.pending_work -= self.expected_proc_time(process.service_id) * (1 - process.progress)
+        else:  # we reset the pending work to avoid accumulating rounding errors
+            self.pending_work = 0
+
+    def _reset_pending(self):
+        """It computes the expected remaining time of all the ready processes from scratch."""
+        self.pending_work, self.n_pending = 0, 0
+        for process in self.ready_srv_reqs.values():
+            if process.engine is None:
+                self._add_pending(process)
+
+    def _queue_time(self):
+        """Reference (non-incremental) implementation of queue_time. It is used for checking consistency."""
         time = 0
         if self.phase == ProcessingUnit.PHASE_OFF:
             time = self.pu_config.t_on
@@ -95,6 +291,8 @@ class ProcessingUnit:
         if srv_config is not None:  # solo aceptamos tareas compatibles con la PU
             proc_t: float = srv_config.proc_t_model.expected_proc_time
             t_delta: float = srv_config.t_deadline - self.queue_time
+            if self._near_boundary(t_delta, proc_t):  # rounding errors could change the result
+                t_delta = srv_config.t_deadline - self._queue_time()
             if t_delta >= proc_t:  # solo aceptamos tareas a las que podemos cumplir el deadline
                 if srv_config.sess_required:  # solo podemos abrir sesiones en PUs vacías o con sesiones de la misma app
                     if self.service_id == service_id or self.service_id is None and not self.ready_srv_reqs:
@@ -105,6 +303,22 @@ class ProcessingUnit:
                     return srv_config.max_parallel_tasks
         return 0
 
+    @staticmethod
+    def _near_boundary(t_delta: float, proc_t: float) -> bool:
+        """
+        Checks if the number of tasks that fit in t_delta could change due to rounding errors of the queue time.
+        The incrementally maintained queue time may differ from the reference one in the last bits. Far from
+        integer multiples of the processing time, these differences do not change the number of additional tasks.
+        :param t_delta: time left before the deadline of a new task, computed with the incremental queue time.
+        :param proc_t: expected processing time of the task.
+        :return: true if the reference queue time must be used for computing the number of additional tasks.
+        """
+        if not isfinite(t_delta):
+            return False
+        n_tasks = round(t_delta / proc_t) if proc_t > 0 else 0
+        return isclose(t_delta, n_tasks * proc_t, rel_tol=ProcessingUnit.QUEUE_TIME_TOL,
+                       abs_tol=ProcessingUnit.QUEUE_TIME_TOL)
+
     def max_n_tasks(self, service_id: str) -> int:  # TODO si estuviese idle y vacío, ¿cuántas tareas puedo aceptar?
         srv_config = self.pu_config.srv_configs.get(service_id)
         if srv_config is None:
@@ -161,6 +375,9 @@ class ProcessingUnit:
         # elif (request.service_id, request.client_id) not in self.ready_srv_reqs:
         if (request.service_id, request.client_id) not in self.ready_srv_reqs:
             self.ready_srv_reqs[(request.service_id, request.client_id)] = request
+            self.new_processes.append(request)
+            self._add_pending(request)
+            self.reschedule = True
             self.update = True
         elif self.ready_srv_reqs[(request.service_id, request.client_id)] != request:
             return SrvResponse(request.request, False, self.last_t, 'PU is busy with a different request of the same client')
@@ -180,33 +397,63 @@ class ProcessingUnit:
             _, srv_responses, _ = self._stop_execution()
             pending_processes = self.ready_srv_reqs
             self.ready_srv_reqs = dict()  # TODO ver lo de las sesiones
+            self._reset_pending()
             return srv_responses, pending_processes
 
     def _stop_execution(self) -> list[SrvResponse]:
         processed: list[SrvResponse] = list()
-        for process in self.running_processes:
-            if process.stop(self.last_t) >= 1:
-                self.ready_srv_reqs.pop((process.service_id, process.client_id))
-                processed.append(SrvResponse(process.request, True, self.last_t))
+        if self.engine is not None:
+            processed = self._finish_execution()
+            for process in self.running_processes:
+                self.engine.stop(process)
+                self._add_pending(process)
+        else:
+            for process in self.running_processes:
+                if process.stop(self.last_t) >= 1:
+                    self.ready_srv_reqs.pop((process.service_id, process.client_id))
+                    processed.append(SrvResponse(process.request, True, self.last_t))
         self.running_processes = list()
+        self.new_processes = list()
+        self.reschedule = True
         self.next_t = inf
         return processed
 
+    def _finish_execution(self) -> list[SrvResponse]:
+        """
+        Virtual-time counterpart of _stop_execution. Running processes that did not finish yet are not stopped.
+        :return: list of responses of the processes that finished.
+        """
+        self.engine.advance(self.last_t)
+        finished = self.engine.pop_finished()
+        if not finished:
+            return list()
+        if len(finished) > 1:  # responses are sent in the same order as processes were started
+            order = {process: i for i, process in enumerate(self.running_processes)}
+            finished.sort(key=order.get)
+        self.running_processes = [process for process in self.running_processes if process.engine is not None]
+        self.reschedule = True
+        processed: list[SrvResponse] = list()
+        for process in finished:
+            self.ready_srv_reqs.pop((process.service_id, process.client_id))
+            processed.append(SrvResponse(process.request, True, self.last_t))
+        return processed
+
     def _start_execution(self) -> tuple[list[OpenSessResponse], list[SrvResponse], list[CloseSessResponse]]:
         if self.phase != ProcessingUnit.PHASE_ON:
             return list(), list(), list()
+        if self.engine is not None:
+            return self._start_virtual_execution()
         opened, closed = list(), list()
         processed = self._stop_execution()
         ta: float = inf
         service_id = self.service_id
         if service_id is not None:
-            srv_config = self.pu_config.srv_configs[self.service_id]
             for request in self.ready_open_sess.values():
                 opened.append(OpenSessResponse(request, self.edc_id, self.last_t))
             self.ready_open_sess = dict()
             n_tasks = len(self.ready_srv_reqs)
             for process in self.ready_srv_reqs.values():
-                ta = min(process.start(self.last_t, srv_config.proc_t_model.proc_time(n_tasks)), ta)
+                ta = min(process.start(self.last_t, self.srv_proc_t_models[service_id].proc_time(n_tasks)), ta)
                 self.running_processes.append(process)
             for request in self.ready_close_sess.values():
                 closed.append(CloseSessResponse(request, self.last_t - self.sessions.pop(request.client_id), self.last_t))
@@ -220,10 +467,53 @@ class ProcessingUnit:
             n_tasks = len(self.running_processes)
             if n_tasks > 0:
                 service_id = self.running_processes[0].service_id
-                srv_config = self.pu_config.srv_configs.get(service_id)
                 for process in self.running_processes:
-                    ta = min(process.start(self.last_t, srv_config.proc_t_model.proc_time(n_tasks)), ta)
+                    ta = min(process.start(self.last_t, self.srv_proc_t_models[service_id].proc_time(n_tasks)), ta)
         self.next_t = self.last_t + ta
+        self._reset_pending()  # progress of processes only changes when they are restarted
+        return opened, processed, closed
+
+    def _start_virtual_execution(self) -> tuple[list[OpenSessResponse], list[SrvResponse], list[CloseSessResponse]]:
+        """
+        Virtual-time counterpart of _start_execution. Only processes that finish, arrive, or are (de)scheduled
+        are updated. The rest of the running processes keep running in the virtual-time engine.
+        """
+        opened, closed = list(), list()
+        processed = self._finish_execution()
+        if self.service_id is not None:
+            for request in self.ready_open_sess.values():
+                opened.append(OpenSessResponse(request, self.edc_id, self.last_t))
+            self.ready_open_sess = dict()
+            for process in self.new_processes:  # In sessions, all the pending requests are processed in parallel
+                self._remove_pending(process)
+                self.engine.start(process)
+                self.running_processes.append(process)
+            if self.running_processes:
+                self.engine.set_proc_t(self.srv_proc_t_models[self.service_id].proc_time(len(self.running_processes)))
+            for request in self.ready_close_sess.values():
+                closed.append(CloseSessResponse(request, self.last_t - self.sessions.pop(request.client_id), self.last_t))
+            self.ready_close_sess = dict()
+            if not self.sessions:
+                self.service_id = None
+                self.max_parallel_tasks = None
+                self.stream = None
+        elif self.reschedule or self.scheduler.dynamic:
+            scheduled = self.scheduler.select_tasks(self.last_t, self.pu_config, self.ready_srv_reqs.values())
+            scheduled_set = set(scheduled)
+            for process in self.running_processes:
+                if process not in scheduled_set:
+                    self.engine.stop(process)
+                    self._add_pending(process)
+            for process in scheduled:
+                if process.engine is None:
+                    self._remove_pending(process)
+                    self.engine.start(process)
+            self.running_processes = scheduled
+            if scheduled:
+                self.engine.set_proc_t(self.srv_proc_t_models[scheduled[0].service_id].proc_time(len(scheduled)))
+        self.new_processes = list()
+        self.reschedule = False
+        self.next_t = self.engine.next_t
         return opened, processed, closed
 
     def compute_power(self, status: bool, srv_id: str | None, n_tasks: int) -> float:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from mercury.config.edcs import EdgeDataCenterConfig
-from mercury.logger import logger as logging, logging_overhead
+from mercury.logger import log_event, INFO, WARNING
 from mercury.msg.edcs import *
 from mercury.msg.packet.app_packet.srv_packet import *
 from xdevs.models import Port
@@ -40,6 +40,16 @@ class EDCResourceManager(ExtendedAtomic):
         }
         self.req_map: dict[str, dict[str, ProcessingUnit]] = dict()  # {service ID: {client ID: Processing Unit}}
         self.report_required: bool = False
+        self.delta_reports: bool = self.edc_config.r_mngr_config.delta_reports
+        self.report_quantum: float = self.edc_config.r_mngr_config.report_quantum
+        self.t_next_report: float = 0
+        # Incremental slicing status (only used for delta reports)
+        self.pu_srv: dict[str, str | None] = {pu_id: None for pu_id in self.pus}  # {PU ID: ID of the sliced service}
+        self.pu_tasks: dict[str, dict[str, tuple[int, int]]] = dict()  # {PU ID: {service ID: (max., additional)}}
+        self.srv_tasks: dict[str, list[int]] = dict()  # {service ID: [slice size, slice av., free size, free av.]}
+        self.updated_pus: set[str] = set()
+        self.updated_srvs: set[str] = set()
+        self.report: EdgeDataCenterReport | None = None  # report to be sent in the next output function
 
         self.input_config: Port[NewEDCConfig] = Port(NewEDCConfig, 'input_config')
         self.input_srv: Port[SrvRelatedRequest] = Port(SrvRelatedRequest, 'input_srv')
@@ -60,31 +70,32 @@ class EDCResourceManager(ExtendedAtomic):
         return self.cooler.cooling_power
 
     def initialize(self):
-        overhead = logging_overhead(self._clock, EDCResourceManager.LOGGING_OVERHEAD)
-        self.new_mapping(overhead, self.edc_config.r_mngr_config.mapping_id,
-                         **self.edc_config.r_mngr_config.mapping_config)
-        self.slice_resources(overhead, self.edc_config.r_mngr_config.edc_slicing, True)
+        self.new_mapping(self.edc_config.r_mngr_config.mapping_id, **self.edc_config.r_mngr_config.mapping_config)
+        self.slice_resources(self.edc_config.r_mngr_config.edc_slicing, True)
         self.sigma = self.next_sigma()
+        self.report = self.next_report()
 
     def exit(self):
         pass
 
     def deltint_extension(self):
-        self.report_required = False
-        overhead = logging_overhead(self._clock, EDCResourceManager.LOGGING_OVERHEAD)
-        self.update_t(overhead)
+        if self.report_required and self._clock >= self.t_next_report:
+            self.report_required = False
+            self.t_next_report = self._clock + self.report_quantum
+            self.updated_srvs.clear()  # the last report already included these services
+        self.update_t()
         self.sigma = self.next_sigma()
+        self.report = self.next_report()
 
     def deltext_extension(self, e):
-        overhead = logging_overhead(self._clock, EDCResourceManager.LOGGING_OVERHEAD)
         for msg in self.input_config.values:
             if isinstance(msg, NewEDCMapping):
-                self.new_mapping(overhead, msg.mapping_id, **msg.mapping_config)
+                self.new_mapping(msg.mapping_id, **msg.mapping_config)
             elif isinstance(msg, NewEDCSlicing):
                 self.expected_slicing = msg.slicing
-                self.slice_resources(overhead, self.expected_slicing, self._clock <= 0)
+                self.slice_resources(self.expected_slicing, self._clock <= 0)
         if self.input_srv:
-            self.update_t(overhead, True)  # first, we update the status of the processed tasks
+            self.update_t(True)  # first, we update the status of the processed tasks
             for request in self.input_srv.values:
                 request.receive(self._clock)
                 response: SrvRelatedResponse | None = None
@@ -96,72 +107,117 @@ class EDCResourceManager(ExtendedAtomic):
                 elif isinstance(request, CloseSessRequest):
                     response = self.map_close_session(request)
                 if isinstance(response, SrvRelatedResponse):
-                    self.send_response(overhead, response)
+                    self.send_response(response)
                 elif isinstance(response, SrvRelatedRequest):
-                    self.send_to_cloud(overhead, response)
-            self.update_t(overhead)  # Once we have processed all the new requests, we update the PUs again
+                    self.send_to_cloud(response)
+            self.update_t()  # Once we have processed all the new requests, we update the PUs again
         self.sigma = self.next_sigma()
+        self.report = self.next_report()
 
     def lambdaf_extension(self):
-        if self.report_required:
-            slicing: dict[str, SrvSlicingReport] = dict()
-            _, free_pus = self.pu_slices.get(None, (0, dict()))
-            for srv_id in self.srv_priority:
-                slice_size, slice_available = 0, 0
-                _, pus = self.pu_slices.get(srv_id, (0, dict()))
-                for pu in pus.values():
-                    slice_size += pu.max_n_tasks(srv_id)
-                    slice_available += pu.additional_tasks(srv_id)
-                free_size, free_available = 0, 0
-                for pu in free_pus.values():
-                    free_size += pu.max_n_tasks(srv_id)
-                    free_available += pu.additional_tasks(srv_id)
-                slicing[srv_id] = SrvSlicingReport(self.expected_slicing.get(srv_id, 0), slice_size,
-                                                   slice_available, free_size, free_available)
-            self.output_report.add(EdgeDataCenterReport(self.edc_id, slicing, self.it_power, self.cooling_power))
-
-    def new_mapping(self, overhead: str, mapping_id: str, **kwargs):
+        if self.report is not None:
+            self.output_report.add(self.report)
+
+    def next_report(self) -> EdgeDataCenterReport | None:
+        """
+        Computes the report to be sent when the next internal transition is triggered.
+        :return: EDC report. If no report is required for the next internal transition, it returns None.
+        """
+        if not self.report_required or self._clock + self.sigma < self.t_next_report:
+            return None
+        if self.delta_reports:
+            return EdgeDataCenterReport(self.edc_id, self.delta_slicing(), self.it_power, self.cooling_power, True)
+        slicing: dict[str, SrvSlicingReport] = dict()
+        _, free_pus = self.pu_slices.get(None, (0, dict()))
+        for srv_id in self.srv_priority:
+            slice_size, slice_available = 0, 0
+            _, pus = self.pu_slices.get(srv_id, (0, dict()))
+            for pu in pus.values():
+                slice_size += pu.max_n_tasks(srv_id)
+                slice_available += pu.additional_tasks(srv_id)
+            free_size, free_available = 0, 0
+            for pu in free_pus.values():
+                free_size += pu.max_n_tasks(srv_id)
+                free_available += pu.additional_tasks(srv_id)
+            slicing[srv_id] = SrvSlicingReport(self.expected_slicing.get(srv_id, 0), slice_size,
+                                               slice_available, free_size, free_available)
+        return EdgeDataCenterReport(self.edc_id, slicing, self.it_power, self.cooling_power)
+
+    def delta_slicing(self) -> dict[str, SrvSlicingReport]:
+        """
+        Re-evaluates the PUs that changed since the last transition and updates the slicing status accordingly.
+        Services remain flagged as updated until the internal transition that sends the report.
+        :return: slicing reports of the services whose status changed since the last report.
+        """
+        for pu_id in self.updated_pus:
+            pu = self.pus[pu_id]
+            slice_id = self.pu_srv[pu_id]
+            i = 2 if slice_id is None else 0  # unassigned PUs contribute to the free resources of every service
+            for srv_id in self.srv_priority if slice_id is None else [slice_id]:
+                prev_size, prev_available = self.pu_tasks[pu_id].get(srv_id, (0, 0))
+                size, available = pu.max_n_tasks(srv_id), pu.additional_tasks(srv_id)
+                if size != prev_size or available != prev_available:
+                    self.pu_tasks[pu_id][srv_id] = size, available
+                    self.srv_tasks[srv_id][i] += size - prev_size
+                    self.srv_tasks[srv_id][i + 1] += available - prev_available
+                    self.updated_srvs.add(srv_id)
+        self.updated_pus.clear()
+        return {
+            srv_id: SrvSlicingReport(self.expected_slicing.get(srv_id, 0), *self.srv_tasks[srv_id])
+            for srv_id in self.srv_priority if srv_id in self.updated_srvs
+        }
+
+    def new_mapping(self, mapping_id: str, **kwargs):
         from mercury.plugin import AbstractFactory
-        logging.info(f'{overhead}EDC {self.edc_id}: new mapping function ({mapping_id})')
+        log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                  'EDC %s: new mapping function (%s)', self.edc_id, mapping_id)
         self.mapping = AbstractFactory.create_edc_pu_mapping(mapping_id, **kwargs)
 
-    def slice_resources(self, overhead: str, srv_slicing: dict[str, int], instantaneous: bool = False):
+    def slice_resources(self, srv_slicing: dict[str, int], instantaneous: bool = False):
         self.report_required = True
         pu_slices = self.slicer.slice_resources(srv_slicing)
         for srv_id in self.srv_priority:
             expected_slice = srv_slicing.get(srv_id, 0)
             slice_size, sliced_pus = pu_slices.get(srv_id, (0, list()))
-            msg = f'{overhead}EDC {self.edc_id} slice for service {srv_id}: {slice_size} (expected {expected_slice}) in {sliced_pus}'
-            logging.info(msg) if expected_slice <= slice_size else logging.warning(msg)
+            log_event(INFO if expected_slice <= slice_size else WARNING, self._clock, self.LOGGING_OVERHEAD,
+                      'EDC %s slice for service %s: %s (expected %s) in %s',
+                      self.edc_id, srv_id, slice_size, expected_slice, sliced_pus)
             for pu_id in sliced_pus:
-                self.set_standby(overhead, pu_id, True, instantaneous)
+                self.set_standby(pu_id, True, instantaneous)
         _, free_pus = pu_slices[None]
-        logging.info(f'{overhead}EDC {self.edc_id} unassigned PUs: {free_pus}')
+        log_event(INFO, self._clock, self.LOGGING_OVERHEAD, 'EDC %s unassigned PUs: %s', self.edc_id, free_pus)
         for pu_id in free_pus:
-            self.set_standby(overhead, pu_id, self.edc_config.r_mngr_config.standby, instantaneous)
+            self.set_standby(pu_id, self.edc_config.r_mngr_config.standby, instantaneous)
         self.pu_slices = {srv_id: (slice_size, {pu_id: self.pus[pu_id] for pu_id in pus})
                           for srv_id, (slice_size, pus) in pu_slices.items()}
-        self.update_t(overhead)
+        self.pu_srv = {pu_id: srv_id for srv_id, (_, pus) in self.pu_slices.items() for pu_id in pus}
+        self.pu_tasks = {pu_id: dict() for pu_id in self.pus}
+        self.srv_tasks = {srv_id: [0, 0, 0, 0] for srv_id in self.srv_priority}
+        self.updated_pus = set(self.pus)
+        self.updated_srvs = set(self.srv_priority)
+        self.update_t()
 
-    def update_t(self, overhead: str, force: bool = False):
+    def update_t(self, force: bool = False):
         it_power: float = 0
         self.report_required |= force
         for pu in self.pus.values():
             if force:
-                self.update_pu_t(overhead, pu)
+                self.update_pu_t(pu)
             while pu.update or pu.next_t <= self._clock:
                 self.report_required = True
-                self.update_pu_t(overhead, pu)
+                self.update_pu_t(pu)
             it_power += pu.power
         self.cooler.update_cooler(it_power)
 
-    def update_pu_t(self, overhead: str, pu: ProcessingUnit):
+    def update_pu_t(self, pu: ProcessingUnit):
+        if pu.update or pu.next_t <= self._clock:
+            self.updated_pus.add(pu.pu_id)
         status = pu.update_t(self._clock)
         if status is not None:
             for responses in status:
                 for response in responses:
                     self.report_required = True
-                    self.send_response(overhead, response)
+                    self.send_response(response)
                     # Check if we need to modify the request map
                     if isinstance(response, SrvResponse) and not response.request.sess_required \
                             or isinstance(response, CloseSessResponse) and response.response >= 0:
@@ -170,9 +226,12 @@ class EDCResourceManager(ExtendedAtomic):
                             self.req_map.pop(response.service_id)
 
     def next_sigma(self) -> float:
-        if self.report_required or not self.msg_queue_empty():
+        if not self.msg_queue_empty():
             return 0
-        return max(min((pu.next_t for pu in self.pus.values()), default=inf) - self._clock, 0)
+        next_t = min((pu.next_t for pu in self.pus.values()), default=inf)
+        if self.report_required:
+            next_t = min(next_t, self.t_next_report)
+        return max(next_t - self._clock, 0)
 
     def map_open_session(self, request: OpenSessRequest) -> OpenSessRequest | OpenSessResponse | None:
         new_map: bool = False
@@ -221,20 +280,23 @@ class EDCResourceManager(ExtendedAtomic):
             return CloseSessResponse(request, 0, self._clock, 'EDC mapping error: required session does not exist')
         return pu.add_close_session(request)
 
-    def send_response(self, overhead: str, response: SrvRelatedResponse):
+    def send_response(self, response: SrvRelatedResponse):
         response.send(self._clock)
         self.add_msg_to_queue(self.output_srv_response, response)
-        logging.info(f'{overhead}EDC {self.edc_id} response: {response}')
+        log_event(INFO, self._clock, self.LOGGING_OVERHEAD, 'EDC %s response: %s', self.edc_id, response)
 
-    def send_to_cloud(self, overhead: str, request: SrvRelatedRequest):
+    def send_to_cloud(self, request: SrvRelatedRequest):
         request.set_server(self.cloud_id)
         self.add_msg_to_queue(self.output_srv_request, request)
-        logging.warning(f'{overhead}EDC {self.edc_id} out of resources. Forwarding request {request} to cloud {self.cloud_id}')
+        log_event(WARNING, self._clock, self.LOGGING_OVERHEAD,
+                  'EDC %s out of resources. Forwarding request %s to cloud %s',
+                  self.edc_id, request, self.cloud_id)
 
-    def set_standby(self, overhead: str, pu_id: str, standby: bool, instantaneous: bool = False):
+    def set_standby(self, pu_id: str, standby: bool, instantaneous: bool = False):
         pu = self.pus[pu_id]
         if pu.standby != standby:
-            logging.info(f'{overhead}PU {pu_id} of EDC {self.edc_id} standby: {standby}')
+            log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                      'PU %s of EDC %s standby: %s', pu_id, self.edc_id, standby)
             pu.set_standby(standby, instantaneous)
 
     def map_task(self, service_id: str) -> ProcessingUnit | None:
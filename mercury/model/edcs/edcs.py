@@ -7,6 +7,7 @@ from mercury.config.gateway import GatewaysConfig
 from mercury.msg.edcs import EdgeDataCenterReport, EDCProfileReport
 from mercury.msg.packet import PacketInterface
 from mercury.utils.amf import AccessManagementFunction
+from mercury.utils.report_board import EDCReportBoard
 from .edc import EdgeDataCenter
 
 
@@ -27,9 +28,12 @@ class EdgeDataCenters(Coupled, Generic[PacketInterface]):
         srv_priority.extend(services)
 
         # Components
+        self.report_board: EDCReportBoard | None = None
+        if edge_fed_config.report_board:
+            self.report_board = EDCReportBoard(edge_fed_config.edcs_config, edge_fed_config.report_board_delay)
         self.edcs: dict[str, EdgeDataCenter[PacketInterface]] = dict()
         for edc_id in edge_fed_config.edcs_config:
-            edc = EdgeDataCenter(p_type, edc_id, edge_fed_config, gws_config, srv_priority, amf)
+            edc = EdgeDataCenter(p_type, edc_id, edge_fed_config, gws_config, srv_priority, amf, self.report_board)
             self.edcs[edc_id] = edc
             self.add_component(edc)
 
@@ -38,7 +42,6 @@ class EdgeDataCenters(Coupled, Generic[PacketInterface]):
         self.output_profile_report: Port[EDCProfileReport] = Port(EDCProfileReport, 'output_profile_report')
         for out_port in self.output_data, self.output_edc_report, self.output_profile_report:
             self.add_out_port(out_port)
-        self.add_out_port(self.output_edc_report)
         self.inputs_data: dict[str, Port[PacketInterface]] = dict()
         for edc_id, edc in self.edcs.items():
             self.inputs_data[edc_id] = Port(p_type, f'input_data_{edc_id}')
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from mercury.logger import logger as logging, logging_overhead
+from mercury.logger import log_event, DEBUG, INFO, WARNING
 from mercury.msg.network import ChannelShare
 from mercury.msg.packet import NetworkPacket
 from mercury.msg.packet.app_packet.srv_packet import SrvRelatedRequest
@@ -52,10 +52,8 @@ class AccessManager(ExtendedAtomic):
         self.passivate()
 
     def deltext_extension(self, e):
-        access_overhead: str = logging_overhead(self._clock, self.CLIENT_LOGGING_OVERHEAD)
-        xh_overhead: str = logging_overhead(self._clock, self.GATEWAY_LOGGING_OVERHEAD)
-        change: bool = self.process_app(access_overhead, xh_overhead)
-        self.process_net(access_overhead, xh_overhead)
+        change: bool = self.process_app()
+        self.process_net()
         if not self.wired:
             for client_id in self.input_send_pss.values:
                 msg = PSSMessage(self.gateway_id, client_id, self._clock)
@@ -75,124 +73,133 @@ class AccessManager(ExtendedAtomic):
     def exit(self):
         pass
 
-    def process_app(self, access_overhead: str, xh_overhead: str) -> bool:
+    def process_app(self) -> bool:
         change: bool = False
         for msg in self.input_app.values:
             if isinstance(msg, AccessPacket):
-                change |= self.process_app_access(msg, access_overhead, xh_overhead)
+                change |= self.process_app_access(msg)
             elif isinstance(msg, SrvRelatedRequest):
-                self.process_app_srv(msg, access_overhead)
+                self.process_app_srv(msg)
         return change
 
-    def process_net(self, access_overhead: str, xh_overhead: str):
+    def process_net(self):
         for msg in self.input_net.values:
             if msg.node_from in self.clients:
-                logging.debug(f'{access_overhead}{msg.node_from}--->{self.gateway_id}: network message')
+                log_event(DEBUG, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                          '%s--->%s: network message', msg.node_from, self.gateway_id)
                 self.add_msg_to_queue(self.output_xh_net, msg)
             elif msg.node_to in self.clients:
-                logging.debug(f'{xh_overhead}{self.gateway_id}<---{msg.node_from}: network message')
+                log_event(DEBUG, self._clock, self.GATEWAY_LOGGING_OVERHEAD,
+                          '%s<---%s: network message', self.gateway_id, msg.node_from)
                 self.add_msg_to_queue(self.output_access_net, msg)
             else:
-                logging.warning(f'{xh_overhead}{self.gateway_id}: network message from/to unknown node')
+                log_event(WARNING, self._clock, self.GATEWAY_LOGGING_OVERHEAD,
+                          '%s: network message from/to unknown node', self.gateway_id)
 
-    def process_app_access(self, msg: AccessPacket, access_overhead: str, xh_overhead: str) -> bool:
+    def process_app_access(self, msg: AccessPacket) -> bool:
         change: bool = False
         if isinstance(msg, ConnectRequest):
-            change |= self.connect_client(msg, access_overhead)
+            change |= self.connect_client(msg)
         elif isinstance(msg, DisconnectRequest):
-            change |= self.disconnect_client(msg, access_overhead)
+            change |= self.disconnect_client(msg)
         elif not self.wired:
             if isinstance(msg, RRCMessage) and msg.client_id in self.clients:
-                self.client_rrc(msg, access_overhead)
+                self.client_rrc(msg)
             elif isinstance(msg, HandOverRequest):
-                change |= self.start_client_ho(msg, access_overhead)
+                change |= self.start_client_ho(msg)
             elif isinstance(msg, HandOverFinished) and msg.client_id in self.clients_ho:
-                change |= self.finish_client_ho(msg, access_overhead)
+                change |= self.finish_client_ho(msg)
         return change
 
-    def process_app_srv(self, msg: SrvRelatedRequest, access_overhead: str):
-        log_msg = f'{access_overhead}{msg.node_from}--->{self.gateway_id}: service-related message'
+    def process_app_srv(self, msg: SrvRelatedRequest):
+        log_msg = '%s--->%s: service-related message'
         if msg.node_from not in self.clients:
-            logging.warning(f'{log_msg}, but client is not connected to gateway. Dropping message')
+            log_event(WARNING, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                      f'{log_msg}, but client is not connected to gateway. Dropping message',
+                      msg.node_from, self.gateway_id)
         elif msg.server_id is not None:
-            logging.warning(f'{log_msg}, but message was redirected to {msg.server_id}. Ignoring message')
+            log_event(WARNING, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                      f'{log_msg}, but message was redirected to %s. Ignoring message',
+                      msg.node_from, self.gateway_id, msg.server_id)
         else:
-            logging.info(f'{log_msg}. Redirecting to default server {self.default_server}')
+            log_event(INFO, self._clock, self.CLIENT_LOGGING_OVERHEAD, f'{log_msg}. Redirecting to default server %s',
+                      msg.node_from, self.gateway_id, self.default_server)
             msg.set_node_to(self.default_server)
             self.add_msg_to_queue(self.output_xh_app, msg)
 
-    def connect_client(self, req: ConnectRequest, access_overhead: str) -> bool:
+    def connect_client(self, req: ConnectRequest) -> bool:
         change: bool = False
         response = req.client_id in self.clients
-        log_function = logging.info
-        log_msg = f'{access_overhead}{req.client_id}--->{self.gateway_id}: connect request'
+        log_level, log_suffix = INFO, ''
         if response:
-            log_function = logging.warning
-            log_msg = f'{log_msg} (already connected)'
+            log_level, log_suffix = WARNING, ' (already connected)'
         else:
             response = self.amf.connect_client(req.client_id, self.gateway_id)
             if response:
                 change = True
                 self.clients.append(req.client_id)
             else:
-                log_function = logging.warning
-                log_msg = f'{log_msg} (request failed)'
-        log_function(log_msg)
+                log_level, log_suffix = WARNING, ' (request failed)'
+        log_event(log_level, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                  '%s--->%s: connect request%s', req.client_id, self.gateway_id, log_suffix)
         response = ConnectResponse(req, response, self._clock)
         response.send(self._clock)
         self.add_msg_to_queue(self.output_access_acc, response)
         return change
 
-    def disconnect_client(self, req: DisconnectRequest, access_overhead: str) -> bool:
+    def disconnect_client(self, req: DisconnectRequest) -> bool:
         change: bool = False
         response = req.client_id not in self.clients
-        log_function = logging.info
-        log_msg = f'{access_overhead}{req.client_id}--->{self.gateway_id}: disconnect request'
+        log_level, log_suffix = INFO, ''
         if response:
-            log_function = logging.warning
-            log_msg = f'{log_msg} (already disconnected)'
+            log_level, log_suffix = WARNING, ' (already disconnected)'
         else:
             response = self.amf.disconnect_client(req.client_id, self.gateway_id)
             if response:
                 change = True
                 self.clients.remove(req.client_id)
             else:
-                log_function = logging.warning
-                log_msg = f'{log_msg} (request failed)'
-        log_function(log_msg)
+                log_level, log_suffix = WARNING, ' (request failed)'
+        log_event(log_level, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                  '%s--->%s: disconnect request%s', req.client_id, self.gateway_id, log_suffix)
         response = DisconnectResponse(req, response, self._clock)
         response.send(self._clock)
         self.add_msg_to_queue(self.output_access_acc, response)
         return change
 
-    def start_client_ho(self, req: HandOverRequest, access_overhead: str) -> bool:
-        log_msg = f'{access_overhead}{req.client_id}--->{self.gateway_id}: HO from {req.gateway_from} request'
+    def start_client_ho(self, req: HandOverRequest) -> bool:
         change = self.amf.handover_client(req.client_id, req.gateway_from, self.gateway_id)
         if change:
-            logging.info(log_msg)
+            log_event(INFO, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                      '%s--->%s: HO from %s request', req.client_id, self.gateway_id, req.gateway_from)
             self.clients.append(req.client_id)
         else:
-            logging.warning(f'{log_msg} (HO failed)')
+            log_event(WARNING, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                      '%s--->%s: HO from %s request (HO failed)', req.client_id, self.gateway_id, req.gateway_from)
         response = HandOverResponse(req, change, self._clock)
         response.send(self._clock)
         self.add_msg_to_queue(self.output_access_acc, response)
         return change
 
-    def finish_client_ho(self, req: HandOverFinished, access_overhead: str) -> bool:
-        logging.info(f'{access_overhead}{req.client_id}--->{self.gateway_id}: HO finished. Result: {req.response}')
+    def finish_client_ho(self, req: HandOverFinished) -> bool:
+        log_event(INFO, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                  '%s--->%s: HO finished. Result: %s', req.client_id, self.gateway_id, req.response)
         self.clients_ho.pop(req.client_id)
         if req.response:
             self.clients.remove(req.client_id)
         return req.response
 
-    def client_rrc(self, rrc: RRCMessage, access_overhead: str):
-        log_msg = f'{access_overhead}{rrc.client_id}--->{self.gateway_id}: RRC message'
+    def client_rrc(self, rrc: RRCMessage):
         best_gateway = max(rrc.perceived_snr, key=rrc.perceived_snr.get)
         if best_gateway != self.gateway_id:
-            log_msg = f'{log_msg} (new best gateway {best_gateway}). Starting HO process'
+            log_event(INFO, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                      '%s--->%s: RRC message (new best gateway %s). Starting HO process',
+                      rrc.client_id, self.gateway_id, best_gateway)
             self.clients_ho[rrc.client_id] = best_gateway
             ho_data = HandOverData(rrc.client_id, self.gateway_id, best_gateway)
             start_ho = StartHandOver(ho_data, self._clock)
             start_ho.send(self._clock)
             self.add_msg_to_queue(self.output_access_acc, start_ho)
-        logging.info(log_msg)
+        else:
+            log_event(INFO, self._clock, self.CLIENT_LOGGING_OVERHEAD,
+                      '%s--->%s: RRC message', rrc.client_id, self.gateway_id)
@@ -2,7 +2,7 @@ from __future__ import annotations
 from mercury.config.edcs import EdgeFederationConfig
 from mercury.config.gateway import GatewaysConfig
 from mercury.config.network import DynamicNodeConfig, WiredNodeConfig, WirelessNodeConfig
-from mercury.logger import logger as logging, logging_overhead
+from mercury.logger import log_event, INFO
 from mercury.msg.network import NewNodeLocation
 from mercury.msg.packet import AppPacket
 from mercury.msg.packet.app_packet.srv_packet import SrvRelatedRequest
@@ -60,12 +60,12 @@ class GatewaysLite(ExtendedAtomic):
         self.passivate()
 
     def deltext_extension(self, e):
-        overhead = logging_overhead(self._clock, self.LOGGING_OVERHEAD)
         for client_id in self.input_remove_client.values:
             gateway_id = self.amf.get_client_gateway(client_id)
             self.amf.disconnect_client(client_id, gateway_id)
             self.clients.pop(client_id)
-            logging.info(f'{overhead}GatewaysLite: client {client_id} disconnected from gateway {gateway_id} and removed')
+            log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                      'GatewaysLite: client %s disconnected from gateway %s and removed', client_id, gateway_id)
 
         for node_config in self.input_create_client.values:
             self.clients[node_config.node_id] = node_config
@@ -76,7 +76,9 @@ class GatewaysLite(ExtendedAtomic):
             else:
                 raise TypeError(f'unknown data type for node_config ({type(node_config)})')
             self.amf.connect_client(node_config.node_id, gateway_id)
-            logging.info(f'{overhead}GatewaysLite: client {node_config.node_id} created and connected to gateway {gateway_id}')
+            log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                      'GatewaysLite: client %s created and connected to gateway %s',
+                      node_config.node_id, gateway_id)
 
         for msg in self.input_new_location.values:
             node_config = self.clients.get(msg.node_id)
@@ -86,7 +88,9 @@ class GatewaysLite(ExtendedAtomic):
                 new_gw = self.best_gw(msg.location)
                 if prev_gw != new_gw:
                     self.amf.handover_client(msg.node_id, prev_gw, new_gw)
-                    logging.info(f'{overhead}GatewaysLite: client {node_config.node_id} moved from gateway {prev_gw} to {new_gw}')
+                    log_event(INFO, self._clock, self.LOGGING_OVERHEAD,
+                              'GatewaysLite: client %s moved from gateway %s to %s',
+                              node_config.node_id, prev_gw, new_gw)
         super().deltext_extension(e)
 
         for msg in self.input_data.values:
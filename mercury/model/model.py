@@ -4,12 +4,14 @@ from mercury.config.client import ServicesConfig
 from mercury.config.config import MercuryConfig, GatewaysConfig
 from mercury.config.transducers import TransducersConfig
 from mercury.msg.packet import AppPacket, NetworkPacket, PhysicalPacket, PacketInterface
+import mercury.transducers  # noqa: F401 (Mercury transducers are registered in xDEVS on import)
 from mercury.utils.amf import AccessManagementFunction
 from typing import Any, Generic, Type
-from xdevs.models import Coupled
+from xdevs.models import Coupled, Port
 from xdevs.transducers import Transducer, Transducers
 from .clients import ClientsABC, Clients, ClientsShortcut, ClientsLite, ClientGeneratorModel
 from .cloud import Cloud
+from .common.hierarchy import flatten
 from .edcs import EdgeDataCenters
 from .gateways import GatewaysABC, Gateways, GatewaysShortcut, GatewaysLite
 from .network import AccessNetwork, AccessNetworkShortcut, CrosshaulNetwork, MobilityManager
@@ -44,17 +46,27 @@ class MercuryModelABC(Coupled, ABC, Generic[PacketInterface]):
         self.mobility: MobilityManager | None = None
         self.smart_grid: SmartGrid | None = None
         self.transducers: list[Transducer] = list()
+        # {port of a coupled model removed by flattening: output ports of atomic models that send messages through it}
+        self.port_sources: dict[Port, list[Port]] | None = None
 
     @property
     def built(self) -> bool:
         return self._built
 
+    @property
+    def flat(self) -> bool:
+        return self.port_sources is not None
+
     def add_transducers(self, transducer_id, transducer_type: str, transducer_config: dict[str, Any]):
         if transducer_id in self.transducers_config:
             raise ValueError("Transducer already defined")
         self.transducers_config[transducer_id] = (transducer_type, transducer_config)
 
-    def build(self):
+    def build(self, flatten: bool = False):
+        """
+        Builds the model.
+        :param flatten: if True, the coupled models of the scenario are flattened after building (see flatten_model).
+        """
         if self._built:
             raise ValueError('Model already built')
         self._add_components()
@@ -62,6 +74,34 @@ class MercuryModelABC(Coupled, ABC, Generic[PacketInterface]):
         self._add_common_couplings()
         self._add_transducers()
         self._built = True
+        if flatten:
+            self.flatten_model()
+
+    def flatten_model(self):
+        """
+        Flattens the model: all the atomic models become children of the Mercury model, and they are coupled directly.
+        Messages no longer traverse the ports of the coupled models (e.g., EDCs), which speeds up simulations.
+        Attributes of the model (e.g., edcs) still point to the coupled models, but their ports do not receive messages
+        anymore. Transducers that target these ports must be retargeted (see retarget).
+        """
+        if not self.built:
+            raise ValueError('the model must be built')
+        if self.flat:
+            raise ValueError('the model is already flat')
+        self.port_sources = flatten(self)
+        for transducer in self.transducers:
+            self.retarget(transducer)
+
+    def retarget(self, transducer: Transducer):
+        """
+        Replaces the target ports of a transducer that belong to coupled models removed by flattening
+        with the output ports of the atomic models that send messages through them.
+        :param transducer: transducer to be retargeted. If the model is not flat, it is not modified.
+        """
+        if self.flat:
+            for port in [port for port in transducer.target_ports if port in self.port_sources]:
+                transducer.target_ports.remove(port)
+                transducer.target_ports.update(self.port_sources[port])
 
     def _add_components(self):
         p_type = AppPacket if self._lite else self._p_type
@@ -167,6 +207,8 @@ class MercuryModelABC(Coupled, ABC, Generic[PacketInterface]):
                 transducer.add_event_field('window_n', int, lambda x: x.window.window_n)
                 transducer.add_event_field('window_acc_delay', float, lambda x: x.window.window_acc_delay)
                 transducer.add_event_field('window_mean_delay', float, lambda x: x.window.window_mean_delay)
+                transducer.add_event_field('queue_len', int, lambda x: x.queue_len)
+                transducer.add_event_field('utilization', float, lambda x: x.utilization)
                 self.transducers.append(transducer)
 
             if self.edcs is not None and TransducersConfig.LOG_EDC_REPORT:
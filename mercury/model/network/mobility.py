@@ -1,7 +1,7 @@
 from __future__ import annotations
 from math import inf
 from mercury.config.network import DynamicNodeConfig, WirelessNodeConfig
-from mercury.logger import logger as logging, logging_overhead
+from mercury.logger import log_event, INFO, ERROR
 from mercury.msg.network import NewNodeLocation
 from xdevs.models import Port
 from ..common import ExtendedAtomic
@@ -31,40 +31,40 @@ class MobilityManager(ExtendedAtomic):
         self.sigma = next_t - self._clock
 
     def deltext_extension(self, e):
-        overhead = logging_overhead(self._clock, self.LOGGING_OVERHEAD)
         for node_id in self.input_remove_node.values:
-            self.remove_node(overhead, node_id)
+            self.remove_node(node_id)
         for node_config in self.input_create_node.values:
-            self.create_node(overhead, node_config)
+            self.create_node(node_config)
         next_t = inf
         for config in self.wireless_nodes.values():
             if config.mobility.next_t < config.t_end:
                 next_t = min(next_t, config.mobility.next_t)
         self.sigma = next_t - self._clock
 
-    def remove_node(self, overhead: str, node_id: str):
+    def remove_node(self, node_id: str):
         self.wireless_nodes.pop(node_id, None)
-        logging.info(f'{overhead}MOBILITY MANAGER: node {node_id} removed')
+        log_event(INFO, self._clock, self.LOGGING_OVERHEAD, 'MOBILITY MANAGER: node %s removed', node_id)
 
-    def create_node(self, overhead: str, node_config: DynamicNodeConfig):
+    def create_node(self, node_config: DynamicNodeConfig):
         node_id = node_config.node_id
         if isinstance(node_config, WirelessNodeConfig):
             if node_config.mobility.next_t != self._clock:
                 next_t = node_config.mobility.next_t
-                logging.error(f'{overhead}MOBILITY MANAGER: time coherence error in node {node_id} ({next_t})')
+                log_event(ERROR, self._clock, self.LOGGING_OVERHEAD,
+                          'MOBILITY MANAGER: time coherence error in node %s (%s)', node_id, next_t)
                 raise AssertionError('time coherence error: new node was not created when required')
             self.wireless_nodes[node_config.node_id] = node_config
-        logging.info(f'{overhead}MOBILITY MANAGER: node {node_id} created')
+        log_event(INFO, self._clock, self.LOGGING_OVERHEAD, 'MOBILITY MANAGER: node %s created', node_id)
 
     def lambdaf_extension(self):
         clock = self._clock + self.sigma
-        overhead = logging_overhead(clock, self.LOGGING_OVERHEAD)
         for node_id, node_config in self.wireless_nodes.items():
             mobility = node_config.mobility
             if mobility.next_t <= clock < node_config.t_end:
                 while mobility.next_t <= clock:
                     mobility.advance()
-                logging.info(f'{overhead}MOBILITY MANAGER: node {node_id} moved to location {mobility.location}')
+                log_event(INFO, clock, self.LOGGING_OVERHEAD,
+                          'MOBILITY MANAGER: node %s moved to location %s', node_id, mobility.location)
                 self.output_new_location.add(NewNodeLocation(node_id, mobility.location))
 
     def initialize(self):
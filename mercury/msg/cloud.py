@@ -1,14 +1,50 @@
+from __future__ import annotations
 from .profile import WindowReport
 
 
+class CloudQueueReport:
+    def __init__(self, cloud_id: str, srv_id: str, n_servers: int | None, n_busy: int, queue_len: int):
+        """
+        Cloud service queue report.
+        :param cloud_id: ID of the cloud.
+        :param srv_id: ID of the service.
+        :param n_servers: number of servers allocated to the service. If None, the service has infinite capacity.
+        :param n_busy: number of servers that are currently processing a request.
+        :param queue_len: number of requests waiting for a server.
+        """
+        self.cloud_id: str = cloud_id
+        self.srv_id: str = srv_id
+        self.n_servers: int | None = n_servers
+        self.n_busy: int = n_busy
+        self.queue_len: int = queue_len
+
+    @property
+    def utilization(self) -> float | None:
+        return None if self.n_servers is None else self.n_busy / self.n_servers
+
+    def __eq__(self, other):
+        return isinstance(other, CloudQueueReport) and self.n_servers == other.n_servers \
+            and self.n_busy == other.n_busy and self.queue_len == other.queue_len
+
+
 class CloudProfileReport:
-    def __init__(self, cloud_id: str, srv_id: str, n_clients: int, req_type: str, result: str, window: WindowReport):
+    def __init__(self, cloud_id: str, srv_id: str, n_clients: int, req_type: str, result: str,
+                 window: WindowReport, queue: CloudQueueReport | None = None):
         self.cloud_id: str = cloud_id
         self.srv_id: str = srv_id
         self.n_clients: int = n_clients
         self.req_type: str = req_type
         self.result: str = result
         self.window: WindowReport = window
+        self.queue: CloudQueueReport | None = queue
+
+    @property
+    def queue_len(self) -> int:
+        return 0 if self.queue is None else self.queue.queue_len
+
+    @property
+    def utilization(self) -> float | None:
+        return None if self.queue is None else self.queue.utilization
 
     def __ne__(self, other):
-        return self.n_clients != self.n_clients or self.window != other.window
+        return self.n_clients != other.n_clients or self.window != other.window or self.queue != other.queue
@@ -111,21 +111,49 @@ class EDCProfileReport:
 
 
 class EdgeDataCenterReport(EnergyDemand):
-    def __init__(self, edc_id: str, slicing: dict[str, SrvSlicingReport], it_power: float, cooling_power: float):
+    def __init__(self, edc_id: str, slicing: dict[str, SrvSlicingReport], it_power: float,
+                 cooling_power: float, delta: bool = False, updated: set[str] | None = None):
         """
         Edge data center report message.
         :param edc_id: ID of the EDC.
         :param slicing: report of the resources allocated to the EDC for each service
         :param it_power: IT power consumption (in Watts).
         :param cooling_power: Cooling power consumption (in Watts).
+        :param delta: if True, slicing only contains the services that changed since the previous report of the EDC.
+        :param updated: services that changed since the previous report of the EDC. If None, all services may have changed.
         """
         super().__init__()
         self.edc_id: str = edc_id
         self.slicing: dict[str, SrvSlicingReport] = slicing
         self.it_power: float = it_power
         self.cooling_power: float = cooling_power
+        self.delta: bool = delta
+        self.updated: set[str] | None = set(slicing) if delta else updated
         self.edc_profile: EDCProfile | None = None
 
+    def merge(self, prev_report: EdgeDataCenterReport | None) -> EdgeDataCenterReport:
+        """
+        Completes a delta report with the slicing reports of the previous report of the EDC.
+        :param prev_report: previous (complete) report of the EDC.
+        :return: complete EDC report. If this report is not a delta report, it returns the report itself.
+        """
+        if not self.delta:
+            return self
+        slicing = dict() if prev_report is None else {**prev_report.slicing}
+        slicing.update(self.slicing)
+        report = EdgeDataCenterReport(self.edc_id, slicing, self.it_power, self.cooling_power, updated=self.updated)
+        report.consumption = self.consumption
+        return report
+
+    def delta_report(self) -> EdgeDataCenterReport:
+        """:return: delta report with the services that changed. If unknown, it returns the report itself."""
+        if self.delta or self.updated is None:
+            return self
+        slicing = {srv_id: self.slicing[srv_id] for srv_id in self.updated if srv_id in self.slicing}
+        report = EdgeDataCenterReport(self.edc_id, slicing, self.it_power, self.cooling_power, True)
+        report.consumption = self.consumption
+        return report
+
     @property
     def consumer_id(self) -> str:
         return self.edc_id
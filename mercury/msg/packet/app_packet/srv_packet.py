@@ -3,9 +3,12 @@ from abc import ABC, abstractmethod
 from math import inf
 from mercury.config.client import ServicesConfig
 from mercury.config.packet import PacketConfig
-from typing import Any
+from typing import Any, TYPE_CHECKING
 from .app_packet import AppPacket
 
+if TYPE_CHECKING:
+    from mercury.model.edcs.edc.r_manager.pu import ProcessorSharing
+
 
 class SrvPacket(AppPacket, ABC):
     def __init__(self, node_from: str, node_to: str | None, service_id: str, client_id: str,
@@ -225,9 +228,10 @@ class SrvRequestProcess:
         self.t_arrived: float = t_arrived
         self.t_last: float = t_arrived
         self.t_operation: float | None = None
-        self.t_finish: float = inf
         self.t_burst: float = 0
-        self.progress: float = 0
+        self._t_finish: float = inf
+        self._progress: float = 0
+        self.engine: ProcessorSharing | None = None  # virtual-time engine running the process (if any)
 
     def __lt__(self, other):
         """ Processes of PU are sorted in a First-Come-First-Served basis"""
@@ -254,6 +258,24 @@ class SrvRequestProcess:
         """returns service request information and progress bar"""
         return self.request.info, self.progress
 
+    @property
+    def t_finish(self) -> float:
+        """Returns the time at which the process will finish if it is not stopped"""
+        return self._t_finish if self.engine is None else self.engine.t_finish(self)
+
+    @t_finish.setter
+    def t_finish(self, t_finish: float):
+        self._t_finish = t_finish
+
+    @property
+    def progress(self) -> float:
+        """Returns the progress of the process"""
+        return self._progress if self.engine is None else self.engine.progress(self)
+
+    @progress.setter
+    def progress(self, progress: float):
+        self._progress = progress
+
     @property
     def finished(self) -> bool:
         """Returns whether or not the process has been completed"""
@@ -262,7 +284,7 @@ class SrvRequestProcess:
     @property
     def running(self) -> bool:
         """Returns whether or not the process is running"""
-        return self.t_operation is not None
+        return self.t_operation is not None or self.engine is not None
 
     def start(self, t: float, t_operation: float) -> float:
         """
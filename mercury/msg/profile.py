@@ -1,6 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections import deque
+from heapq import heappop, heappush
 from math import inf
 from mercury.msg.packet.app_packet.srv_packet import SrvRelatedResponse
 from typing import Generator
@@ -71,28 +72,72 @@ class ProfileWindow:
 
 
 class AbstractProfile(ABC):
+
+    REJECTED = 'rejected'
+    MET_DEADLINE = 'met_deadline'
+    MISSED_DEADLINE = 'missed_deadline'
+    RESULTS = (REJECTED, MET_DEADLINE, MISSED_DEADLINE)
+
     def __init__(self):
         self.profiles: dict[str, AbstractProfile | ProfileWindow] = dict()
+        self.t_last: float = 0
+        self.updated: dict[str, None] = dict()  # child profiles that changed since the last call to pop_updated
 
-    @property
-    def t_last(self):
-        return max((profile.t_last for profile in self.profiles.values()), default=0)
+    @staticmethod
+    def response_result(response: SrvRelatedResponse) -> str:
+        if not response.successful:
+            return AbstractProfile.REJECTED
+        return AbstractProfile.MET_DEADLINE if response.deadline_met else AbstractProfile.MISSED_DEADLINE
 
     @property
     def t_next(self) -> float:
         return min((profile.t_next for profile in self.profiles.values()), default=inf)
 
+    @abstractmethod
+    def result_total_n(self, result: str) -> int:
+        pass
+
+    @abstractmethod
+    def result_total_acc_delay(self, result: str) -> float:
+        pass
+
+    @abstractmethod
+    def result_window_n(self, result: str) -> int:
+        pass
+
+    @abstractmethod
+    def result_window_acc_delay(self, result: str) -> float:
+        pass
+
+    def window_state(self) -> tuple[tuple[int, float], ...]:
+        """:return: window size and accumulated delay of every result type."""
+        return tuple((self.result_window_n(result), self.result_window_acc_delay(result)) for result in self.RESULTS)
+
+    def pop_updated(self) -> Generator[tuple[tuple[str, ...], ProfileWindow], None, None]:
+        """
+        Returns the profiling windows that changed since the last call to this method.
+        :return: generator of tuples (path of IDs to the profiling window, profiling window).
+        """
+        updated, self.updated = self.updated, dict()
+        for profile_id in updated:
+            profile = self.profiles[profile_id]
+            if isinstance(profile, ProfileWindow):
+                yield (profile_id,), profile
+            else:
+                for path, window in profile.pop_updated():
+                    yield (profile_id, *path), window
+
     @property
     def rejected_total_n(self) -> int:
-        return sum(profile.rejected_total_n for profile in self.profiles.values())
+        return self.result_total_n(self.REJECTED)
 
     @property
     def rejected_window_n(self) -> int:
-        return sum(profile.rejected_window_n for profile in self.profiles.values())
+        return self.result_window_n(self.REJECTED)
 
     @property
     def rejected_total_acc_delay(self) -> float:
-        return sum(profile.rejected_total_acc_delay for profile in self.profiles.values())
+        return self.result_total_acc_delay(self.REJECTED)
 
     @property
     def rejected_total_mean_delay(self) -> float | None:
@@ -101,7 +146,7 @@ class AbstractProfile(ABC):
 
     @property
     def rejected_window_acc_delay(self) -> float:
-        return sum(profile.rejected_window_acc_delay for profile in self.profiles.values())
+        return self.result_window_acc_delay(self.REJECTED)
 
     @property
     def rejected_window_mean_delay(self) -> float | None:
@@ -110,11 +155,11 @@ class AbstractProfile(ABC):
 
     @property
     def met_deadline_total_n(self) -> int:
-        return sum(profile.met_deadline_total_n for profile in self.profiles.values())
+        return self.result_total_n(self.MET_DEADLINE)
 
     @property
     def met_deadline_total_acc_delay(self) -> float:
-        return sum(profile.met_deadline_total_acc_delay for profile in self.profiles.values())
+        return self.result_total_acc_delay(self.MET_DEADLINE)
 
     @property
     def met_deadline_total_mean_delay(self) -> float | None:
@@ -123,11 +168,11 @@ class AbstractProfile(ABC):
 
     @property
     def met_deadline_window_n(self) -> int:
-        return sum(profile.met_deadline_window_n for profile in self.profiles.values())
+        return self.result_window_n(self.MET_DEADLINE)
 
     @property
     def met_deadline_window_acc_delay(self) -> float:
-        return sum(profile.met_deadline_window_acc_delay for profile in self.profiles.values())
+        return self.result_window_acc_delay(self.MET_DEADLINE)
 
     @property
     def met_deadline_window_mean_delay(self) -> float | None:
@@ -136,11 +181,11 @@ class AbstractProfile(ABC):
 
     @property
     def missed_deadline_total_n(self) -> int:
-        return sum(profile.missed_deadline_total_n for profile in self.profiles.values())
+        return self.result_total_n(self.MISSED_DEADLINE)
 
     @property
     def missed_deadline_total_acc_delay(self) -> float:
-        return sum(profile.missed_deadline_total_acc_delay for profile in self.profiles.values())
+        return self.result_total_acc_delay(self.MISSED_DEADLINE)
 
     @property
     def missed_deadline_total_mean_delay(self) -> float | None:
@@ -149,11 +194,11 @@ class AbstractProfile(ABC):
 
     @property
     def missed_deadline_window_n(self) -> int:
-        return sum(profile.missed_deadline_window_n for profile in self.profiles.values())
+        return self.result_window_n(self.MISSED_DEADLINE)
 
     @property
     def missed_deadline_window_acc_delay(self) -> float:
-        return sum(profile.missed_deadline_window_acc_delay for profile in self.profiles.values())
+        return self.result_window_acc_delay(self.MISSED_DEADLINE)
 
     @property
     def missed_deadline_window_mean_delay(self) -> float | None:
@@ -222,84 +267,118 @@ class AbstractProfile(ABC):
 
 
 class ResponseProfile(AbstractProfile):
-
-    REJECTED = 'rejected'
-    MET_DEADLINE = 'met_deadline'
-    MISSED_DEADLINE = 'missed_deadline'
-
     def __init__(self, window_size: float):
         super().__init__()
-        self.profiles: dict[str, ProfileWindow] = {
-            ResponseProfile.REJECTED: ProfileWindow(window_size),
-            ResponseProfile.MET_DEADLINE: ProfileWindow(window_size),
-            ResponseProfile.MISSED_DEADLINE: ProfileWindow(window_size),
-        }
+        self.profiles: dict[str, ProfileWindow] = {result: ProfileWindow(window_size) for result in self.RESULTS}
+        self.updated = dict.fromkeys(self.profiles)
 
     def __eq__(self, other):
         return self.total_n == other.total_n
 
-    @property
-    def rejected_total_n(self) -> int:
-        return self.profiles[self.REJECTED].total_n
+    def result_total_n(self, result: str) -> int:
+        return self.profiles[result].total_n
 
-    @property
-    def rejected_window_n(self) -> int:
-        return self.profiles[self.REJECTED].window_n
+    def result_total_acc_delay(self, result: str) -> float:
+        return self.profiles[result].total_acc_delay
 
-    @property
-    def rejected_total_acc_delay(self) -> float:
-        return self.profiles[self.REJECTED].total_acc_delay
+    def result_window_n(self, result: str) -> int:
+        return self.profiles[result].window_n
 
-    @property
-    def rejected_window_acc_delay(self) -> float:
-        return self.profiles[self.REJECTED].window_acc_delay
-
-    @property
-    def met_deadline_total_n(self) -> int:
-        return self.profiles[self.MET_DEADLINE].total_n
-
-    @property
-    def met_deadline_window_n(self) -> int:
-        return self.profiles[self.MET_DEADLINE].window_n
-
-    @property
-    def met_deadline_total_acc_delay(self) -> float:
-        return self.profiles[self.MET_DEADLINE].total_acc_delay
-
-    @property
-    def met_deadline_window_acc_delay(self) -> float:
-        return self.profiles[self.MET_DEADLINE].window_acc_delay
-
-    @property
-    def missed_deadline_total_n(self) -> int:
-        return self.profiles[self.MISSED_DEADLINE].total_n
-
-    @property
-    def missed_deadline_window_n(self) -> int:
-        return self.profiles[self.MISSED_DEADLINE].window_n
-
-    @property
-    def missed_deadline_total_acc_delay(self) -> float:
-        return self.profiles[self.MISSED_DEADLINE].total_acc_delay
-
-    @property
-    def missed_deadline_window_acc_delay(self) -> float:
-        return self.profiles[self.MISSED_DEADLINE].window_acc_delay
+    def result_window_acc_delay(self, result: str) -> float:
+        return self.profiles[result].window_acc_delay
 
     def push(self, t: float, response: SrvRelatedResponse) -> bool:
-        profile = self.profiles[self.REJECTED]
-        if response.successful:
-            profile = self.profiles[self.MET_DEADLINE] if response.deadline_met else self.profiles[self.MISSED_DEADLINE]
-        profile.push(t, response.client_id, response.t_processing)
+        result = self.response_result(response)
+        self.profiles[result].push(t, response.client_id, response.t_processing)
+        self.t_last = t
+        self.updated[result] = None
         return True
 
     def clean(self, t: float) -> Generator[str, None, None]:
-        for profile in self.profiles.values():
+        for result, profile in self.profiles.items():
             for client_id in profile.clean(t):
+                self.updated[result] = None
                 yield client_id
+        self.t_last = t
 
 
-class SrvProfile(AbstractProfile):
+class AggregatedProfile(AbstractProfile, ABC):
+    def __init__(self):
+        """
+        Profile that aggregates the metrics of its child profiles. Aggregated metrics are updated incrementally
+        every time a child profile changes. The next expiration time is obtained from a heap of child profiles.
+        """
+        super().__init__()
+        self.profiles: dict[str, AbstractProfile] = dict()
+        self._total_n: dict[str, int] = dict.fromkeys(self.RESULTS, 0)
+        self._total_acc_delay: dict[str, float] = dict.fromkeys(self.RESULTS, 0)
+        self._window_n: dict[str, int] = dict.fromkeys(self.RESULTS, 0)
+        self._window_acc_delay: dict[str, float] = dict.fromkeys(self.RESULTS, 0)
+        self._t_next: list[tuple[float, str]] = list()
+
+    @property
+    def t_next(self) -> float:
+        # Outdated entries are discarded lazily
+        while self._t_next and self._t_next[0][0] != self.profiles[self._t_next[0][1]].t_next:
+            heappop(self._t_next)
+        return self._t_next[0][0] if self._t_next else inf
+
+    def result_total_n(self, result: str) -> int:
+        return self._total_n[result]
+
+    def result_total_acc_delay(self, result: str) -> float:
+        return self._total_acc_delay[result]
+
+    def result_window_n(self, result: str) -> int:
+        return self._window_n[result]
+
+    def result_window_acc_delay(self, result: str) -> float:
+        return self._window_acc_delay[result]
+
+    def _push_profile(self, profile_id: str, t: float, response: SrvRelatedResponse) -> bool:
+        profile = self.profiles[profile_id]
+        prev_t_next = profile.t_next
+        if not profile.push(t, response):
+            return False
+        result, delay = self.response_result(response), response.t_processing
+        self._total_n[result] += 1
+        self._total_acc_delay[result] += delay
+        self._window_n[result] += 1
+        self._window_acc_delay[result] += delay
+        self.t_last = max(self.t_last, t)
+        self._profile_updated(profile_id, prev_t_next)
+        return True
+
+    def _expired_profiles(self, t: float) -> list[str]:
+        if t < self.t_last:
+            raise ValueError(f'invalid value for t: {t} (last_t: {self.t_last})')
+        self.t_last = t
+        res: dict[str, None] = dict()
+        while self._t_next and self._t_next[0][0] <= t:
+            t_next, profile_id = heappop(self._t_next)
+            if t_next == self.profiles[profile_id].t_next:
+                res[profile_id] = None
+        return list(res)
+
+    def _profile_cleaned(self, profile_id: str, prev_state: tuple[tuple[int, float], ...], prev_t_next: float):
+        profile = self.profiles[profile_id]
+        for result, (prev_n, prev_acc_delay) in zip(self.RESULTS, prev_state):
+            window_n = profile.result_window_n(result)
+            if window_n != prev_n:
+                self._window_n[result] += window_n - prev_n
+                self._window_acc_delay[result] += profile.result_window_acc_delay(result) - prev_acc_delay
+                if not self._window_n[result]:
+                    self._window_acc_delay[result] = 0  # we avoid accumulating rounding errors
+        self._profile_updated(profile_id, prev_t_next)
+
+    def _profile_updated(self, profile_id: str, prev_t_next: float):
+        self.updated[profile_id] = None
+        t_next = self.profiles[profile_id].t_next
+        if t_next != prev_t_next and t_next < inf:
+            heappush(self._t_next, (t_next, profile_id))
+
+
+class SrvProfile(AggregatedProfile):
     def __init__(self, window_size: float):
         super().__init__()
         if window_size < 0:
@@ -318,20 +397,24 @@ class SrvProfile(AbstractProfile):
         self.clients[client_id] = self.clients.get(client_id, 0) + 1
         if req_type_id not in self.profiles:
             self.profiles[req_type_id] = ResponseProfile(self.window_size)
-        return self.profiles[req_type_id].push(t, response)
+            self.updated[req_type_id] = None
+        return self._push_profile(req_type_id, t, response)
 
     def clean(self, t: float) -> bool:
         res = False
-        for profile in self.profiles.values():
+        for req_type_id in self._expired_profiles(t):
+            profile = self.profiles[req_type_id]
+            prev_state, prev_t_next = profile.window_state(), profile.t_next
             for client_id in profile.clean(t):
                 res = True
                 self.clients[client_id] -= 1
                 if self.clients[client_id] == 0:
                     self.clients.pop(client_id)
+            self._profile_cleaned(req_type_id, prev_state, prev_t_next)
         return res
 
 
-class EDCProfile(AbstractProfile):
+class EDCProfile(AggregatedProfile):
     def __init__(self, edc_id: str, srv_profiling_windows: dict[str, float]):
         super().__init__()
         self.edc_id: str = edc_id
@@ -340,16 +423,19 @@ class EDCProfile(AbstractProfile):
 
     def push(self, t: float, response: SrvRelatedResponse) -> bool:
         service_id = response.service_id
-        return service_id in self.profiles and self.profiles[service_id].push(t, response)
+        return service_id in self.profiles and self._push_profile(service_id, t, response)
 
     def clean(self, t: float) -> bool:
         res = False
-        for profile in self.profiles.values():
+        for service_id in self._expired_profiles(t):
+            profile = self.profiles[service_id]
+            prev_state, prev_t_next = profile.window_state(), profile.t_next
             res |= profile.clean(t)
+            self._profile_cleaned(service_id, prev_state, prev_t_next)
         return res
 
 
-class CloudProfile(AbstractProfile):
+class CloudProfile(AggregatedProfile):
     def __init__(self, cloud_id: str, srv_profiling_windows: dict[str, float]):
         super().__init__()
         self.cloud_id: str = cloud_id
@@ -358,10 +444,13 @@ class CloudProfile(AbstractProfile):
 
     def push(self, t: float, response: SrvRelatedResponse) -> bool:
         service_id = response.service_id
-        return service_id in self.profiles and self.profiles[service_id].push(t, response)
+        return service_id in self.profiles and self._push_profile(service_id, t, response)
 
     def clean(self, t: float) -> bool:
         res = False
-        for profile in self.profiles.values():
+        for service_id in self._expired_profiles(t):
+            profile = self.profiles[service_id]
+            prev_state, prev_t_next = profile.window_state(), profile.t_next
             res |= profile.clean(t)
+            self._profile_cleaned(service_id, prev_state, prev_t_next)
         return res
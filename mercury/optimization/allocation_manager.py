@@ -1,10 +1,11 @@
+from __future__ import annotations
 import pandas as pd
 from sklearn.cluster import KMeans
 import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
-from copy import deepcopy
-import random
+from typing import Iterable
+from mercury.utils.rng import stream
 
 
 def dist(a, b, ax=1):
@@ -12,35 +13,63 @@ def dist(a, b, ax=1):
 
 
 class AllocationManager:
-    def __init__(self, data, time_window=60, grid_res=40):
+    def __init__(self, data: pd.DataFrame | Iterable[pd.DataFrame], time_window: float = 60, grid_res: int = 40,
+                 bounds: tuple[float, float] | None = None):
+        """
+        Computes the density of a scenario from mobility traces: the area is divided into a grid, and the density of
+        each cell is the maximum number of different nodes that were in the cell during the same time window.
+        :param data: mobility traces with the columns epoch, x, y, and cab_id. Traces larger than the available memory
+        can be provided as an iterable of data frames sorted by epoch (e.g., pd.read_csv(path, chunksize=10 ** 6)).
+        :param time_window: duration (in seconds) of the time windows.
+        :param grid_res: number of cells of the grid along its shortest side.
+        :param bounds: maximum x and y coordinates of the traces. It is mandatory for iterables of data frames.
+        """
         self.time_window = time_window
         self.grid_res = grid_res
-        self.data = data.copy()
+        self.data = data.copy() if isinstance(data, pd.DataFrame) else None
         self.aps = None
         self.edcs = None
 
-        df = data.copy()
-        df['epoch'] = np.round(df['epoch'] / self.time_window)
-        x_grid = (np.max(df['x']) + 1) / self.grid_res
-        y_grid = (np.max(df['y']) + 1) / self.grid_res
-
-        self.grid_step = np.minimum(x_grid, y_grid)
-
-        self.grid = np.zeros(
-            [int(np.floor(np.max(df['x']) / self.grid_step)), int(np.floor(np.max(df['y']) / self.grid_step))])
-
-        for e in df['epoch'].unique():
-            aux_x = (df[df['epoch'] == e]['x'] / self.grid_step).apply(np.floor).astype(np.int32)
-            aux_y = (df[df['epoch'] == e]['y'] / self.grid_step).apply(np.floor).astype(np.int32)
-            d = pd.DataFrame(data={'aux_x': aux_x, 'aux_y': aux_y})
-
-            for (i, j), reps in d.groupby(list(d.columns)).apply(lambda x: list(x.index)).iteritems():
-                if i >= len(self.grid) or j >= len(self.grid[0]):
-                    continue
-
-                nu = df.iloc[reps]['cab_id'].nunique()
-                if nu > self.grid[i, j]:
-                    self.grid[i, j] = nu
+        if bounds is None:
+            if self.data is None:
+                raise ValueError('bounds are required for iterables of data frames')
+            bounds = np.max(self.data['x']), np.max(self.data['y'])
+        x_max, y_max = bounds
+        self.grid_step = np.minimum((x_max + 1) / self.grid_res, (y_max + 1) / self.grid_res)
+        self.grid = np.zeros([int(np.floor(x_max / self.grid_step)), int(np.floor(y_max / self.grid_step))])
+
+        pending = None  # nodes per epoch and cell of the time windows that may continue in the next chunk
+        for chunk in [self.data] if self.data is not None else data:
+            nodes = self._cell_nodes(chunk)
+            if nodes.empty:
+                continue
+            if pending is not None:
+                if nodes['epoch'].min() < pending['epoch'].max():
+                    raise ValueError('data frames must be sorted by epoch')
+                nodes = pd.concat([pending, nodes], ignore_index=True).drop_duplicates()
+            last_epoch = nodes['epoch'].max()
+            self._update_grid(nodes[nodes['epoch'] < last_epoch])
+            pending = nodes[nodes['epoch'] == last_epoch]
+        if pending is not None:
+            self._update_grid(pending)
+
+    def _cell_nodes(self, data: pd.DataFrame) -> pd.DataFrame:
+        """:return: data frame with the different nodes (column node) per time window (epoch) and cell (cell)."""
+        epoch = np.round(data['epoch'].to_numpy() / self.time_window)
+        x = np.floor(data['x'].to_numpy() / self.grid_step).astype(np.int64)
+        y = np.floor(data['y'].to_numpy() / self.grid_step).astype(np.int64)
+        inside = (x >= 0) & (x < self.grid.shape[0]) & (y >= 0) & (y < self.grid.shape[1])
+        return pd.DataFrame({
+            'epoch': epoch[inside],
+            'cell': x[inside] * self.grid.shape[1] + y[inside],  # cells are packed in a single integer
+            'node': data['cab_id'].to_numpy()[inside],
+        }).drop_duplicates()
+
+    def _update_grid(self, nodes: pd.DataFrame):
+        """Updates the density of the cells with the nodes of complete time windows (see _cell_nodes)."""
+        density = nodes.groupby(['epoch', 'cell']).size().groupby(level='cell').max()
+        cells = density.index.to_numpy()
+        self.grid.flat[cells] = np.maximum(self.grid.flat[cells], density.to_numpy())
 
     def plot_grid(self, title="Scenario density", pdf_path=None):
             plt.figure(figsize=(10, 8))
@@ -52,139 +81,50 @@ class AllocationManager:
                 plt.savefig(pdf_path)
             plt.show()
 
-    def allocate_aps(self, plot=False):
-        x = []
-        y = []
-        z = []
-        for i in range(self.grid.shape[0]):
-            for j in range(self.grid.shape[1]):
-                x.append(i)
-                y.append(j)
-                z.append(self.grid[i, j])
-        d = {'x': x, 'y': y, 'z': z}
-        data = pd.DataFrame(data=d)
-
-        X = data.x
-        Y = data.y
-        D = np.array(list(zip(X, Y)))
-        flag = 0
-        # Number of clusters
-        k = 1
-        # X coordinates of random centroids
-        C_x = np.random.uniform(0, np.max(X), size=k)
-        # Y coordinates of random centroids
-        C_y = np.random.uniform(0, np.max(Y), size=k)
-
-        clusters = np.zeros(len(D))
-        dense_cluster = 0
-        len_list = []
-
-        while flag != 1:
-            flag = 1
-            if len(C_x) != k:
-                candidates = []
-                for j in range(len(D)):
-                    if clusters[j] == dense_cluster:
-                        candidates.append(D[j, :])
-                cand = random.choice(candidates)
-
-                C_x_aux = [cand[0]]
-                C_y_aux = [cand[1]]
-                C_x = np.concatenate((C_x, C_x_aux), axis=0)
-                C_y = np.concatenate((C_y, C_y_aux), axis=0)
-
-            C = np.array(list(zip(C_x, C_y)), dtype=np.float32)
-            # To store the value of centroids when it updates
-            C_old = np.zeros(C.shape)
-            # Cluster Lables(0, 1, 2)
-            # Error func. - Distance between new centroids and old centroids
-            error = dist(C, C_old)
-            # Loop will run till the error becomes zero
-            while sum(error) != 0:
-                # Assigning each value to its closest cluster
-                for i in range(len(D)):
-                    distances = dist(D[i], C)
-                    cluster = np.argmin(distances)
-                    clusters[i] = cluster
-                # Storing the old centroid values
-                C_old = deepcopy(C)
-                # Finding the new centroids by taking the average value
-                for i in range(k):
-                    points_x = [np.repeat(D[j, 0], data.z[j]) for j in range(len(D)) if clusters[j] == i]
-                    l_x = []
-                    for item in points_x:
-                        l_x = np.concatenate((l_x, item), axis=0)
-
-                    points_y = [np.repeat(D[j, 1], data.z[j]) for j in range(len(D)) if clusters[j] == i]
-                    l_y = []
-                    for item in points_y:
-                        l_y = np.concatenate((l_y, item), axis=0)
-
-                    if np.isnan(np.mean(l_x)):
-                        C[i] = np.array([-1, -1])
-                        break
-                    else:
-                        C[i] = np.array([np.mean(l_x), np.mean(l_y)])
-
-                error = dist(C, C_old)
-                print(error, k)
-
-            l_max = 0
-            for i in range(k):
-                points_x = [np.repeat(D[j, 0], data.z[j]) for j in range(len(D)) if clusters[j] == i]
-                l_x = []
-                for item in points_x:
-                    l_x = np.concatenate((l_x, item), axis=0)
-                len_list.append(len(l_x))
-                if len(l_x) > l_max:
-                    l_max = len(l_x)
-                    dense_cluster = i
-                if len(l_x) > 200 and flag != -1:
-                    flag = 0
-                if len(l_x) == 0:
-                    flag = -1
-                print(i, len(l_x))
-            if flag == -1:
-                k = k - 1
-            C_x = C[:, 0]
-            C_y = C[:, 1]
-            k = k + 1
-        k = k - 1
-        mean_density = np.sum(len_list) / k
-
-        print('Clusters:', k)
-        print('Mean density:', mean_density)
-        print('Max_cluster:', np.max(len_list))
-        print('Min_cluster:', np.min(len_list))
-        print(len_list)
-
-        C_aux = C
-        count = 0
-        for i in range(k):
-            p = 0
-            p = [p + 0 for j in range(len(D)) if clusters[j] == i]
-
-            points_x = [np.repeat(D[j, 0], data.z[j]) for j in range(len(D)) if clusters[j] == i]
-            l_x = []
-            for item in points_x:
-                l_x = np.concatenate((l_x, item), axis=0)
-
-            points_y = [np.repeat(D[j, 1], data.z[j]) for j in range(len(D)) if clusters[j] == i]
-            l_y = []
-            for item in points_y:
-                l_y = np.concatenate((l_y, item), axis=0)
-            if len(l_x) == 0:
-                C_aux = np.delete(C_aux, i - count, 0)
-                count = count + 1
-            else:
-                print(C[i], len(l_x), len(p))
-        C = C_aux
+    def allocate_aps(self, plot=False, max_density=200):
+        """
+        Places access points with weighted k-means: cells of the grid are weighted by their density. Every cluster
+        denser than max_density gets a new centroid in one of its cells (chosen at random), and k-means is
+        warm-started with the previous centroids. This is repeated until no cluster is denser than max_density.
+        :param plot: if True, it plots the resulting clusters.
+        :param max_density: maximum density of a cluster (i.e., sum of the density of its cells).
+        """
+        rng = stream('allocation_manager')
+        cells = np.indices(self.grid.shape).reshape(2, -1).T.astype(np.float64)
+        weights = self.grid.reshape(-1)
+        dense = weights > 0
+        if not np.any(dense):
+            raise ValueError('the density grid is empty')
+        points, weights = cells[dense], weights[dense]
+
+        C = np.array([[rng.uniform(0, np.max(cells[:, 0])), rng.uniform(0, np.max(cells[:, 1]))]])
+        while True:
+            kmeans = KMeans(n_clusters=len(C), init=C, n_init=1).fit(points, sample_weight=weights)
+            C = kmeans.cluster_centers_
+            densities = np.bincount(kmeans.labels_, weights=weights, minlength=len(C))
+            # A cluster cannot be split if every cell with nodes already has its own cluster
+            dense_clusters = np.flatnonzero(densities > max_density)[:len(points) - len(C)]
+            if not len(dense_clusters):
+                break
+            # Cells sorted by cluster: the cells of cluster i are in order[start[i]:start[i] + n_cells[i]]
+            clusters = kmeans.predict(cells)
+            order = np.argsort(clusters, kind='stable')
+            n_cells = np.bincount(clusters, minlength=len(C))
+            start = np.cumsum(n_cells) - n_cells
+            new_C = [cells[order[start[i] + rng.randrange(n_cells[i])]] for i in dense_clusters]
+            C = np.vstack([C, *new_C])
+
+        C = C[densities > 0]
+        densities = densities[densities > 0]
         k = len(C)
+        print('Clusters:', k)
+        print('Mean density:', np.mean(densities))
+        print('Max_cluster:', np.max(densities))
+        print('Min_cluster:', np.min(densities))
         self.aps = C * self.grid_step
 
-        print(k)
-
         if plot:
+            clusters = np.argmin(dist(cells[:, np.newaxis], C[np.newaxis], ax=2), axis=1)
             plt.figure(figsize=(10, 8))
             ax = sns.heatmap(data=clusters.reshape(self.grid.shape).transpose(), annot=True, cbar=False)
             ax.invert_yaxis()
@@ -200,104 +140,58 @@ class AllocationManager:
             plt.show()
 
     def allocate_edcs(self, opt='n', n=3, EDC_min=2, EDC_max=2):
-        flag2 = 0
+        fits = dict()  # {number of clusters: (centroids, labels, APs per cluster)} for the current set of APs
+
+        def fit(points, n_clusters):
+            # k-means fits are deterministic: the same fit is never computed twice
+            if n_clusters not in fits:
+                kmeans = KMeans(n_clusters=n_clusters, random_state=0).fit(points)
+                n_aps = np.bincount(kmeans.labels_, minlength=n_clusters)
+                fits[n_clusters] = kmeans.cluster_centers_, kmeans.labels_, n_aps
+            return fits[n_clusters]
+
         if opt == 'n':
-            E_n = n
-            kmeans = KMeans(n_clusters=E_n, random_state=0).fit(self.aps)
-            E = kmeans.cluster_centers_
-            C_EDC = kmeans.predict(self.aps)
-            print(E)
-            print(len(E))
+            E, _, _ = fit(self.aps, n)
 
         elif opt == 'max':
             E_n = len(self.aps)
-            while flag2 != 1:
-                kmeans = KMeans(n_clusters=E_n, random_state=0).fit(self.aps)
-                E = kmeans.cluster_centers_
-                C_EDC = kmeans.predict(self.aps)
-                for i in range(E_n):
-                    if (C_EDC.tolist()).count(i) > EDC_max:
-                        flag2 = 1
+            while np.max(fit(self.aps, E_n)[2]) <= EDC_max:
                 E_n = E_n - 1
-            E_n = E_n + 2
-            kmeans = KMeans(n_clusters=E_n, random_state=0).fit(self.aps)
-            E = kmeans.cluster_centers_
-            C_EDC = kmeans.predict(self.aps)
-            print(E)
-            print(len(E))
+            E, _, _ = fit(self.aps, E_n + 1)
 
         elif opt == 'min':
             E_n = 1
-            while flag2 != 1:
-                kmeans = KMeans(n_clusters=E_n, random_state=0).fit(self.aps)
-                E = kmeans.cluster_centers_
-                C_EDC = kmeans.predict(self.aps)
-                for i in range(E_n):
-                    if (C_EDC.tolist()).count(i) < EDC_min:
-                        flag2 = 1
+            while np.min(fit(self.aps, E_n)[2]) >= EDC_min:
                 E_n = E_n + 1
-            E_n = E_n - 2
-            kmeans = KMeans(n_clusters=E_n, random_state=0).fit(self.aps)
-            E = kmeans.cluster_centers_
-            C_EDC = kmeans.predict(self.aps)
-            print(E)
-            print(len(E))
+            E, _, _ = fit(self.aps, E_n - 1)
 
         elif opt == 'minmax':
-            flag3 = 0
             C_E_aux = self.aps
             E_n = 1
-            r_c = []
-            while flag3 != 1:
-                # print(r_c)
-                while flag2 != 1:
-                    kmeans = KMeans(n_clusters=E_n, random_state=0).fit(C_E_aux)
-                    E = kmeans.cluster_centers_
-                    C_EDC = kmeans.predict(C_E_aux)
-                    # print(C_EDC)
-                    for i in range(E_n):
-                        if (C_EDC.tolist()).count(i) < EDC_max:
-                            flag2 = 1
+            r_c = list()
+            while True:
+                while np.min(fit(C_E_aux, E_n)[2]) >= EDC_max:
                     E_n = E_n + 1
-                flag2 = 0
-                E_n = E_n - 1
-                kmeans = KMeans(n_clusters=E_n, random_state=0).fit(C_E_aux)
-                E = kmeans.cluster_centers_
-                C_EDC = kmeans.predict(C_E_aux)
-                # print('now')
-                # print(C_EDC)
-                f = []
-                # print(C_E_aux)
-                # print(E)
-                count = 0
-                # print(C_E_aux)
-                for index, item in enumerate(C_EDC.tolist()):
-                    # print(index,item)
-                    if len(C_EDC.tolist()) / EDC_max < 1:
-                        r_c = np.vstack((r_c, E))
-                        flag3 = 1
-                    if (C_EDC.tolist()).count(item) <= EDC_max:
-                        C_E_aux = np.delete(C_E_aux, index - count, 0)
-                        count = count + 1
-                        if item not in f:
-                            if len(r_c) == 0:
-                                r_c = np.concatenate((r_c, E[item]), axis=0)
-                            else:
-                                r_c = np.vstack((r_c, E[item]))
-                            f.append(item)
+                E, C_EDC, n_aps = fit(C_E_aux, E_n)
+                if len(C_EDC) < EDC_max:
+                    r_c.extend(E)
+                    break
+                # Clusters with at most EDC_max APs are final: their APs are not clustered again
+                final = n_aps[C_EDC] <= EDC_max
+                _, first = np.unique(C_EDC[final], return_index=True)
+                r_c.extend(E[C_EDC[final][np.sort(first)]])
+                C_E_aux = C_E_aux[~final]
+                fits.clear()
                 if len(C_E_aux) <= EDC_max:
-                    flag3 = 1
-            # print(r_c)
-            kmeans = KMeans(n_clusters=len(r_c), init=r_c)
-            E = r_c
-            C_EDC = kmeans.fit_predict(self.aps)
-            print(E)
-            # print(kmeans.cluster_centers_)
-            E_n = len(E)
-            print(len(E))
+                    break
+            E = np.array(r_c)
+        print(E)
+        print(len(E))
         self.edcs = E
 
     def plot_scenario(self, title="Scenario", pdf_path=None):
+        if self.data is None:
+            raise ValueError('plotting the scenario requires the mobility traces as a data frame')
         D_real = np.array(list(zip(self.data['x'], self.data['y'])))
         clusters_data_real = np.zeros(len(D_real))
         clusters_ap_real = np.zeros(len(self.aps))
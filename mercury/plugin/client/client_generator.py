@@ -4,8 +4,8 @@ from abc import ABC, abstractmethod
 from collections import deque
 from math import inf
 from mercury.config.client import ClientConfig, WiredClientConfig, WirelessClientConfig, TransceiverConfig, LinkConfig
-from numpy.random import poisson  # We use poisson from numpy as numpy is a dependency of Mercury
-from random import gauss, uniform, expovariate
+from mercury.utils.rng import GLOBAL_RNG, numpy_rng
+from random import Random
 from typing import Any
 
 
@@ -15,7 +15,9 @@ class ClientGenerator(ABC):
         Client generator abstract class.
         :param list[str] services: list of the IDs of all the services on board of the clients.
         :param dict[str, Any] trx_config: configuration parameters for the client nodes transceiver.
+        :param Random rng: random generator of the client generator. By default, it is the global random generator.
         """
+        self.rng: Random = kwargs.get('rng', GLOBAL_RNG)
         self.services: set[str] = kwargs['services']
         self.trx_config: TransceiverConfig | None = None
         if 'trx_config' in kwargs:
@@ -86,6 +88,7 @@ class SyntheticClientGenerator(ClientGenerator):
     def __init__(self, **kwargs):
         # First, we execute the __init__ method of the ClientGenerator class.
         super().__init__(**kwargs)
+        self.np_rng = numpy_rng(self.rng)  # We use poisson from numpy as numpy is a dependency of Mercury
         self.n_clients: int = 0
         self.generator_id: str = kwargs.get('generator_id', 'synthetic_generator')
         self.t_start: float = kwargs.get('t_start', 0)
@@ -185,18 +188,17 @@ class SyntheticClientGenerator(ClientGenerator):
         else:
             raise ValueError(f'unknown synthetic configuration id: {synth_id}')
 
-    @staticmethod
-    def synthesize_value(synth_id: str, synth_config: dict[str, Any]) -> float:
+    def synthesize_value(self, synth_id: str, synth_config: dict[str, Any]) -> float:
         if synth_id == 'constant':
             return synth_config['period']
         elif synth_id == 'uniform':
-            return uniform(synth_config['min_t'], synth_config['max_t'])
+            return self.rng.uniform(synth_config['min_t'], synth_config['max_t'])
         elif synth_id == 'gaussian':
-            return max(0., gauss(synth_config['mu'], synth_config.get('sigma', 0)))
+            return max(0., self.rng.gauss(synth_config['mu'], synth_config.get('sigma', 0)))
         elif synth_id == 'exponential':
-            return expovariate(synth_config['lambda'])
+            return self.rng.expovariate(synth_config['lambda'])
         elif synth_id == 'poisson':
-            return synth_config['t_interval'] * poisson(synth_config.get('lambda', 0))
+            return synth_config['t_interval'] * self.np_rng.poisson(synth_config.get('lambda', 0))
         raise ValueError(f'unknown synthetic configuration id: {synth_id}')
 
     def check_synth_location_box(self):
@@ -249,14 +251,14 @@ class SyntheticClientGenerator(ClientGenerator):
             elif self.synth_location_id == 'uniform':
                 min_coord = self.synth_location_config.get(f'min_{coord}', 0)
                 max_coord = self.synth_location_config.get(f'max_{coord}', 0)
-                location.append(uniform(min_coord, max_coord))
+                location.append(self.rng.uniform(min_coord, max_coord))
             elif self.synth_location_id == 'gaussian':
                 min_box_coord = self.synth_location_box.get(f'min_{coord}', -inf)
                 max_box_coord = self.synth_location_box.get(f'max_{coord}', inf)
                 mu_coord = self.synth_location_config.get(f'mu_{coord}', 0)
                 sigma_coord = self.synth_location_config.get(f'sigma_{coord}', 0)
                 # If the location is outside the location box, we "fix" it (gaussian distributions are tricky)
-                location.append(max(min_box_coord, min(max_box_coord, gauss(mu_coord, sigma_coord))))
+                location.append(max(min_box_coord, min(max_box_coord, self.rng.gauss(mu_coord, sigma_coord))))
             else:
                 raise ValueError(f'unknown synth_location_id ({self.synth_location_id})')
         return tuple(location)
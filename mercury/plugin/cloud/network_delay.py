@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from random import gauss
+from mercury.utils.rng import GLOBAL_RNG
+from random import Random
 
 
 class CloudNetworkDelay(ABC):
     def __init__(self, **kwargs):
+        self.rng: Random = kwargs.get('rng', GLOBAL_RNG)
         self.prop_delay: float = kwargs.get('prop_delay', 0)
         if self.prop_delay < 0:
             raise ValueError('prop_delay must be greater than or equal to 0')
@@ -36,4 +38,4 @@ class GaussianCloudNetworkDelay(CloudNetworkDelay):
             raise ValueError('sigma must be greater than or equal to 0')
 
     def _delay(self, msg_size: int) -> float:
-        return gauss(self.mean_delay(msg_size), self.sigma)
+        return self.rng.gauss(self.mean_delay(msg_size), self.sigma)
@@ -1,15 +1,17 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from random import gauss
+from mercury.utils.rng import GLOBAL_RNG
+from random import Random
 
 
 class CloudProcTimeModel(ABC):
     def __init__(self, **kwargs):
         """
         Processing unit processing time model.
+        :param Random rng: random generator of the model. By default, it is the global random generator.
         :param kwargs: any additional configuration parameter.
         """
-        pass
+        self.rng: Random = kwargs.get('rng', GLOBAL_RNG)
 
     def proc_time(self) -> float:
         """
@@ -66,4 +68,4 @@ class GaussianProcTimeModel(CloudProcTimeModel):
 
     @property
     def _proc_time(self) -> float:
-        return gauss(self.mu, self.sigma)
+        return self.rng.gauss(self.mu, self.sigma)
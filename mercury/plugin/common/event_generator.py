@@ -3,7 +3,8 @@ import pandas as pd
 from abc import ABC, abstractmethod
 from math import inf
 from mercury.utils.history_buffer import EventHistoryBuffer
-from random import expovariate, gauss, uniform
+from mercury.utils.rng import GLOBAL_RNG
+from random import Random
 from typing import Callable, Generic, TypeVar
 
 
@@ -12,6 +13,7 @@ T = TypeVar('T')
 
 class EventGenerator(ABC, Generic[T]):
     def __init__(self, **kwargs):
+        self.rng: Random = kwargs.get('rng', GLOBAL_RNG)
         self.last_val: T | None = kwargs.get('initial_val', None)
         self.last_t: float = kwargs.get('t_start', 0)
         self.val_modifier: Callable[[T], T] = kwargs.get('val_modifier', lambda x: x)
@@ -61,7 +63,7 @@ class UniformDistributionGenerator(EventGenerator[T], ABC, Generic[T]):
         super().__init__(**kwargs)
 
     def _compute_next_ta(self) -> float:
-        return max(uniform(self.lower_bound, self.upper_bound), 0)
+        return max(self.rng.uniform(self.lower_bound, self.upper_bound), 0)
 
 
 class GaussianDistributionGenerator(EventGenerator[T], ABC, Generic[T]):
@@ -75,7 +77,7 @@ class GaussianDistributionGenerator(EventGenerator[T], ABC, Generic[T]):
         super().__init__(**kwargs)
 
     def _compute_next_ta(self) -> float:
-        return max(gauss(self.mean, self.std_deviation), 0)
+        return max(self.rng.gauss(self.mean, self.std_deviation), 0)
 
 
 class ExponentialDistributionGenerator(EventGenerator[T], ABC, Generic[T]):
@@ -87,7 +89,7 @@ class ExponentialDistributionGenerator(EventGenerator[T], ABC, Generic[T]):
         super().__init__(**kwargs)
 
     def _compute_next_ta(self) -> float:
-        return expovariate(self.lambd)
+        return self.rng.expovariate(self.lambd)
 
 
 class LambdaDrivenGenerator(EventGenerator[T], ABC, Generic[T]):
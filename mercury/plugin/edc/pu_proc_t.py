@@ -1,6 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from random import gauss
+from mercury.utils.rng import GLOBAL_RNG
+from random import Random
 
 
 class ProcessingUnitProcTimeModel(ABC):
@@ -8,9 +9,11 @@ class ProcessingUnitProcTimeModel(ABC):
         """
         Processing unit processing time model.
         :param int max_parallel_tasks: maximum number of tasks that the processing unit can execute in parallel.
+        :param Random rng: random generator of the model. By default, it is the global random generator.
         :param kwargs: any additional configuration parameter.
         """
         self.max_parallel_tasks: int = kwargs['max_parallel_tasks']
+        self.rng: Random = kwargs.get('rng', GLOBAL_RNG)
 
     def utilization(self, n_tasks: int) -> float:
         """:return: the utilization factor of the processing unit."""
@@ -39,6 +42,11 @@ class ProcessingUnitProcTimeModel(ABC):
     def expected_proc_time(self) -> float:
         return self._proc_time(1)  # TODO -> supongo que todo se ejecuta secuencialmente
 
+    @property
+    def deterministic(self) -> bool:
+        """:return: true if the processing time only depends on the number of tasks (i.e., it is not random)."""
+        return False
+
 
 class ConstantProcTimeModel(ProcessingUnitProcTimeModel):
     def __init__(self, **kwargs):
@@ -66,6 +74,10 @@ class ConstantProcTimeModel(ProcessingUnitProcTimeModel):
     def _proc_time(self, n_tasks: int) -> float:
         return self.proc_t[n_tasks - 1] if isinstance(self.proc_t, list) else self.proc_t
 
+    @property
+    def deterministic(self) -> bool:
+        return True
+
 
 class RoundRobinProcTimeModel(ProcessingUnitProcTimeModel):
     def __init__(self, **kwargs):
@@ -90,6 +102,10 @@ class RoundRobinProcTimeModel(ProcessingUnitProcTimeModel):
     def _proc_time(self, n_tasks: int) -> float:
         return self.proc_t if n_tasks == 1 else self.proc_t * n_tasks * (1 + self.switch_penalty)
 
+    @property
+    def deterministic(self) -> bool:
+        return True
+
 
 class GaussianProcTimeModel(ProcessingUnitProcTimeModel):
     def __init__(self, **kwargs):
@@ -137,7 +153,7 @@ class GaussianProcTimeModel(ProcessingUnitProcTimeModel):
     def _proc_time(self, n_tasks: int) -> float:
         mu = self.mu[n_tasks - 1] if isinstance(self.mu, list) else self.mu
         sigma = self.sigma[n_tasks - 1] if isinstance(self.sigma, list) else self.sigma
-        return max(gauss(mu, sigma), 0)
+        return max(self.rng.gauss(mu, sigma), 0)
 
     @property
     def expected_proc_time(self) -> float:
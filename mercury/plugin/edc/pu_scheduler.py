@@ -38,6 +38,11 @@ class ProcessingUnitScheduler(ABC, Generic[T]):
             scheduled.append(process)
         return scheduled
 
+    @property
+    def dynamic(self) -> bool:
+        """:return: true if task priorities may change over time even if the set of tasks does not change."""
+        return True
+
     @abstractmethod
     def task_priority(self, t: float, pu_config: ProcessingUnitConfig, process: SrvRequestProcess) -> T:
         """
@@ -51,16 +56,28 @@ class ProcessingUnitScheduler(ABC, Generic[T]):
 
 
 class FirstComeFirstServed(ProcessingUnitScheduler[float]):
+    @property
+    def dynamic(self) -> bool:
+        return False
+
     def task_priority(self, t: float, pu_config: ProcessingUnitConfig, process: SrvRequestProcess) -> float:
         return process.t_arrived
 
 
 class ShortestJobFirst(ProcessingUnitScheduler[float]):
+    @property
+    def dynamic(self) -> bool:
+        return False
+
     def task_priority(self, t: float, pu_config: ProcessingUnitConfig, process: SrvRequestProcess) -> float:
         return pu_config.srv_configs[process.service_id].proc_t_model.expected_proc_time
 
 
 class LongestJobFirst(ProcessingUnitScheduler[float]):
+    @property
+    def dynamic(self) -> bool:
+        return False
+
     def task_priority(self, t: float, pu_config: ProcessingUnitConfig, process: SrvRequestProcess) -> float:
         return -pu_config.srv_configs[process.service_id].proc_t_model.expected_proc_time
 
@@ -76,6 +93,10 @@ class LongestRemainingTimeFirst(ProcessingUnitScheduler[float]):
 
 
 class EarliestDeadlineFirst(ProcessingUnitScheduler[float]):
+    @property
+    def dynamic(self) -> bool:
+        return False
+
     def task_priority(self, t: float, pu_config: ProcessingUnitConfig, process: SrvRequestProcess) -> float:
         return process.t_deadline
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
+import numpy as np
 from abc import ABC, abstractmethod
-from functools import lru_cache
+from collections import ChainMap
+from math import inf
+from mercury.config.client import ServicesConfig
 from mercury.config.edcs import EdgeFederationConfig, EdgeDataCenterConfig
 from mercury.config.gateway import GatewaysConfig
-from mercury.msg.edcs import EdgeDataCenterReport
+from mercury.msg.edcs import EdgeDataCenterReport, SrvSlicingReport
 from mercury.msg.packet.app_packet.srv_packet import SrvRelatedRequest
 from mercury.utils.amf import AccessManagementFunction
-from mercury.utils.maths import euclidean_distance
-from typing import Generic, Tuple, TypeVar
+from mercury.utils.report_board import EDCReportBoard
+from typing import Generic, MutableMapping, Tuple, TypeVar
 
 
 T = TypeVar('T')
@@ -17,15 +20,48 @@ class ServerMappingStrategy(ABC, Generic[T]):
     def __init__(self, **kwargs):
         """
         Software-Defined Network allocation strategy class.
+        The status of the federation is kept in NumPy matrices (EDC x service utilization, EDC power consumption,
+        and gateway x EDC distance) to map requests with vectorized operations.
         :param GatewaysConfig gws_config: Dictionary {AP ID: AP location}.
         :param EdgeFederationConfig edge_fed_config: Dictionary {EDC ID: EDC location}.
+        :param EDCReportBoard | None report_board: Federation report board. If None, reports are received via packets.
+        :param bool batch_accounting: if True, requests mapped in a batch consume the resources of their EDC, so the
+                                      following requests of the batch see the updated status. By default, it is False.
         :param kwargs: Any additional configuration parameter.
         """
         self.edc_id: str = kwargs['edc_id']
         self.amf: AccessManagementFunction = kwargs['amf']
         self.gws_config: GatewaysConfig = kwargs['gws_config']
         self.edge_fed_config: EdgeFederationConfig = kwargs['edge_fed_config']
-        self.edc_reports: dict[str, EdgeDataCenterReport | None] = {edc: None for edc in self.edge_fed_config.edcs_config}
+        self.report_board: EDCReportBoard | None = kwargs.get('report_board')
+        self.edc_reports: MutableMapping[str, EdgeDataCenterReport | None]
+        if self.report_board is None:
+            self.edc_reports = {edc: None for edc in self.edge_fed_config.edcs_config}
+        else:  # The report of this EDC is not subject to the staleness delay of the board
+            self.edc_reports = ChainMap({self.edc_id: None}, self.report_board.reports)
+        self._board_version: int = 0
+        self.batch_accounting: bool = kwargs.get('batch_accounting', False)
+
+        self.edc_ids: list[str] = list(self.edge_fed_config.edcs_config)
+        self.edc_index: dict[str, int] = {edc_id: i for i, edc_id in enumerate(self.edc_ids)}
+        self.srv_index: dict[str, int] = {srv_id: i for i, srv_id in enumerate(ServicesConfig.SERVICES)}
+        self.gw_index: dict[str, int] = {gw_id: i for i, gw_id in enumerate(self.gws_config.gateways)}
+        n_edcs, n_srvs = len(self.edc_ids), len(self.srv_index)
+        self.state_versions: list[int] = [0] * n_edcs
+        self.slice_size_matrix: np.ndarray = np.zeros((n_edcs, n_srvs))
+        self.slice_available_matrix: np.ndarray = np.zeros((n_edcs, n_srvs))
+        self.free_size_matrix: np.ndarray = np.zeros((n_edcs, n_srvs))
+        self.free_available_matrix: np.ndarray = np.zeros((n_edcs, n_srvs))
+        self.slice_u_matrix: np.ndarray = np.ones((n_edcs, n_srvs))
+        self.free_u_matrix: np.ndarray = np.ones((n_edcs, n_srvs))
+        self.available_matrix: np.ndarray = np.zeros((n_edcs, n_srvs), dtype=bool)
+        self.consumption_array: np.ndarray = np.zeros(n_edcs)
+        self.distances: np.ndarray = np.zeros((len(self.gw_index), n_edcs))
+        if self.gw_index and self.edc_ids:
+            gw_locations = np.array([gw_config.location for gw_config in self.gws_config.gateways.values()])
+            edc_locations = np.array([self.edcs_config[edc_id].location for edc_id in self.edc_ids])
+            diff = gw_locations[:, np.newaxis, :] - edc_locations[np.newaxis, :, :]
+            self.distances = np.sqrt(np.sum(diff ** 2, axis=-1))
 
     @property
     def congestion(self) -> float:
@@ -48,7 +84,38 @@ class ServerMappingStrategy(ABC, Generic[T]):
         return self.edc_reports[self.edc_id]
 
     def update_edc_report(self, edc_report: EdgeDataCenterReport):
-        self.edc_reports[edc_report.edc_id] = edc_report
+        self.edc_reports[edc_report.edc_id] = edc_report.merge(self.edc_reports[edc_report.edc_id])
+        self.update_state(edc_report.edc_id)
+
+    def update_state(self, edc_id: str):
+        """
+        Updates the row of the federation status matrices that corresponds to a given EDC.
+        :param edc_id: ID of the EDC.
+        """
+        i = self.edc_index[edc_id]
+        edc_report = self.edc_reports[edc_id]
+        if edc_report is None:
+            self.available_matrix[i] = False
+            return
+        for srv_id, j in self.srv_index.items():
+            self.slice_size_matrix[i, j] = edc_report.srv_slice_size(srv_id)
+            self.slice_available_matrix[i, j] = edc_report.srv_slice_available(srv_id)
+            self.free_size_matrix[i, j] = edc_report.srv_free_size(srv_id)
+            self.free_available_matrix[i, j] = edc_report.srv_free_available(srv_id)
+            self.slice_u_matrix[i, j] = edc_report.srv_slice_u(srv_id)
+            self.free_u_matrix[i, j] = edc_report.srv_free_u(srv_id)
+        self.available_matrix[i] = (self.slice_u_matrix[i] < self.congestion) | (self.free_u_matrix[i] < self.congestion)
+        self.consumption_array[i] = edc_report.power_consumption
+
+    def sync_state(self):
+        """Updates the federation status matrices with the reports published in the report board (if any)."""
+        if self.report_board is not None and self.report_board.version != self._board_version:
+            self._board_version = self.report_board.version
+            for i, edc_id in enumerate(self.edc_ids):
+                version = self.report_board.versions[edc_id]
+                if edc_id != self.edc_id and version != self.state_versions[i]:
+                    self.state_versions[i] = version
+                    self.update_state(edc_id)
 
     def edc_available(self, edc_id: str, service_id: str) -> bool:
         if self.edc_reports[edc_id] is None:
@@ -67,17 +134,34 @@ class ServerMappingStrategy(ABC, Generic[T]):
     def positive_consumption(self, edc_id: str) -> float:
         return max(self.edc_reports[edc_id].consumption.power_consumption, 0)
 
-    @lru_cache(maxsize=None)
     def distance(self, gw_id: str, edc_id: str) -> float:
         """
-        Computes the distance between a gateway and an EDC. This function is cached to speed up the performance.
+        Returns the distance between a gateway and an EDC. Distances are precomputed to speed up the performance.
         :param gw_id: Gateway ID
         :param edc_id: EDC ID
         :return: distance between gateway and EDC
         """
-        gw_location = self.gws_config.gateways[gw_id].location
-        edc_location = self.edge_fed_config.edcs_config[edc_id].location
-        return euclidean_distance(gw_location, edc_location)
+        return self.distances[self.gw_index[gw_id], self.edc_index[edc_id]]
+
+    def srv_slice_u(self, srv_requests: list[SrvRelatedRequest]) -> np.ndarray:
+        """:return: (request x EDC) matrix with the slice utilization of the requested services."""
+        return self.slice_u_matrix[:, [self.srv_index[req.service_id] for req in srv_requests]].T
+
+    def srv_free_u(self, srv_requests: list[SrvRelatedRequest]) -> np.ndarray:
+        """:return: (request x EDC) matrix with the free resources utilization of the requested services."""
+        return self.free_u_matrix[:, [self.srv_index[req.service_id] for req in srv_requests]].T
+
+    def gw_distances(self, srv_requests: list[SrvRelatedRequest]) -> np.ndarray:
+        """:return: (request x EDC) matrix with the distance between the gateway of the clients and the EDCs."""
+        return self.distances[[self.gw_index[self.amf.get_client_gateway(req.client_id)] for req in srv_requests]]
+
+    def negative_consumptions(self, srv_requests: list[SrvRelatedRequest]) -> np.ndarray:
+        """:return: (request x EDC) matrix with the negative part of the EDCs power consumption."""
+        return np.broadcast_to(np.minimum(self.consumption_array, 0), (len(srv_requests), len(self.edc_ids)))
+
+    def positive_consumptions(self, srv_requests: list[SrvRelatedRequest]) -> np.ndarray:
+        """:return: (request x EDC) matrix with the positive part of the EDCs power consumption."""
+        return np.broadcast_to(np.maximum(self.consumption_array, 0), (len(srv_requests), len(self.edc_ids)))
 
     def map_server(self, srv_request: SrvRelatedRequest) -> str | None:
         """
@@ -85,13 +169,98 @@ class ServerMappingStrategy(ABC, Generic[T]):
         :param srv_request: Service-related request.
         :return Best Edge Data Center ID for the service.
         """
-        best_edc, best_cost = None, None
-        for edc_id in self.edc_reports:
-            if self.edc_available(edc_id, srv_request.service_id):
-                edc_cost = self.cost(edc_id, srv_request)
-                if best_edc is None or edc_cost < best_cost:
-                    best_edc, best_cost = edc_id, edc_cost
-        return best_edc
+        return self.map_servers([srv_request])[0]
+
+    def map_servers(self, srv_requests: list[SrvRelatedRequest]) -> list[str | None]:
+        """
+        Maps a batch of service-related requests. EDCs are compared in lexicographic order of their cost.
+        :param srv_requests: list of service-related requests.
+        :return: list with the best Edge Data Center ID for each request (None if no EDC is available).
+        """
+        if not srv_requests or not self.edc_ids:
+            return [None] * len(srv_requests)
+        self.sync_state()
+        if self.batch_accounting and len(srv_requests) > 1:
+            return self._map_servers_accounting(srv_requests)
+        available = self.available_matrix[:, [self.srv_index[req.service_id] for req in srv_requests]].T
+        if not available.any():
+            return [None] * len(srv_requests)
+        best = self.lexicographic_argmin(self.costs(srv_requests, available), available)
+        return [None if i < 0 else self.edc_ids[i] for i in best]
+
+    def _map_servers_accounting(self, srv_requests: list[SrvRelatedRequest]) -> list[str | None]:
+        """
+        Maps a batch of requests one by one. Every mapped request consumes one task of its EDC.
+        The status matrices are restored once the batch is mapped, as EDC reports will reflect the new tasks.
+        """
+        backup = [matrix.copy() for matrix in self._status_matrices()]
+        try:
+            res: list[str | None] = list()
+            for srv_request in srv_requests:
+                j = self.srv_index[srv_request.service_id]
+                available = self.available_matrix[np.newaxis, :, j]
+                best = -1
+                if available.any():
+                    best = self.lexicographic_argmin(self.costs([srv_request], available), available)[0]
+                if best >= 0:
+                    self._consume_task(best, j)
+                res.append(None if best < 0 else self.edc_ids[best])
+            return res
+        finally:
+            for matrix, prev_matrix in zip(self._status_matrices(), backup):
+                matrix[:] = prev_matrix
+
+    def _status_matrices(self) -> tuple[np.ndarray, ...]:
+        return self.slice_available_matrix, self.free_available_matrix, \
+            self.slice_u_matrix, self.free_u_matrix, self.available_matrix
+
+    def _consume_task(self, i: int, j: int):
+        """
+        Updates the status matrices after mapping a request of service j to EDC i.
+        Tasks are allocated in the slice of the service first. Then, they are allocated in free resources.
+        """
+        if self.slice_available_matrix[i, j] > 0:
+            self.slice_available_matrix[i, j] -= 1
+            self.slice_u_matrix[i, j] = SrvSlicingReport.utilization(self.slice_size_matrix[i, j],
+                                                                     self.slice_available_matrix[i, j])
+        elif self.free_available_matrix[i, j] > 0:
+            self.free_available_matrix[i, j] -= 1
+            self.free_u_matrix[i, j] = SrvSlicingReport.utilization(self.free_size_matrix[i, j],
+                                                                    self.free_available_matrix[i, j])
+        self.available_matrix[i, j] = self.slice_u_matrix[i, j] < self.congestion or \
+            self.free_u_matrix[i, j] < self.congestion
+
+    @staticmethod
+    def lexicographic_argmin(keys: tuple[np.ndarray, ...], mask: np.ndarray) -> np.ndarray:
+        """
+        Computes the row-wise lexicographic argmin of a cost matrix. Ties are broken by the lowest column index.
+        :param keys: cost keys (first key has the highest priority). Each key is a (request x EDC) matrix.
+        :param mask: (request x EDC) boolean matrix. Only columns set to True are considered.
+        :return: array with the column of the minimum cost for each row (-1 if there are no candidates).
+        """
+        candidates = mask.copy()
+        for key in keys:
+            key = np.where(candidates, key, inf)
+            candidates &= key == key.min(axis=1, keepdims=True)
+        return np.where(candidates.any(axis=1), candidates.argmax(axis=1), -1)
+
+    def costs(self, srv_requests: list[SrvRelatedRequest], available: np.ndarray) -> tuple[np.ndarray, ...]:
+        """
+        Computes the cost of mapping a batch of requests to every EDC. By default, it calls the cost method for every
+        available EDC. Strategies should override this method with a vectorized implementation.
+        :param srv_requests: list of service-related requests.
+        :param available: (request x EDC) boolean matrix with the EDCs that can process each request.
+        :return: tuple of (request x EDC) cost matrices (first matrix has the highest priority).
+        """
+        keys: list[np.ndarray] = list()
+        for i, j in zip(*np.nonzero(available)):
+            cost = self.cost(self.edc_ids[j], srv_requests[i])
+            cost = cost if isinstance(cost, tuple) else (cost,)
+            if not keys:
+                keys = [np.full(available.shape, inf) for _ in cost]
+            for key, value in zip(keys, cost):
+                key[i, j] = value
+        return tuple(keys)
 
     @abstractmethod
     def cost(self, edc_id: str, srv_request: SrvRelatedRequest) -> T:
@@ -103,12 +272,18 @@ class ClosestEDCStrategy(ServerMappingStrategy[float]):
         """ Selects the closest EDC to the AP """
         return self.distance(self.amf.get_client_gateway(srv_request.client_id), edc_id)
 
+    def costs(self, srv_requests: list[SrvRelatedRequest], available: np.ndarray) -> tuple[np.ndarray]:
+        return self.gw_distances(srv_requests),
+
 
 class EmptiestEDCStrategy(ServerMappingStrategy[Tuple[float, float]]):
     def cost(self, edc_id: str, srv_request: SrvRelatedRequest) -> tuple[float, float]:
         """ Selects the EDC with the lowest service utilization factor"""
         return self.slice_u(edc_id, srv_request.service_id), self.free_u(edc_id, srv_request.service_id)
 
+    def costs(self, srv_requests: list[SrvRelatedRequest], available: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return self.srv_slice_u(srv_requests), self.srv_free_u(srv_requests)
+
 
 class FullestEDCStrategy(EmptiestEDCStrategy):
     def cost(self, edc_id: str, srv_request: SrvRelatedRequest) -> tuple[float, float]:
@@ -116,6 +291,10 @@ class FullestEDCStrategy(EmptiestEDCStrategy):
         slice_u, free_u = super().cost(edc_id, srv_request)
         return -slice_u, -free_u
 
+    def costs(self, srv_requests: list[SrvRelatedRequest], available: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        slice_u, free_u = super().costs(srv_requests, available)
+        return -slice_u, -free_u
+
 
 class PowerBalanceStrategy(ServerMappingStrategy[Tuple[float, float]]):
     def cost(self, edc_id: str, srv_request: SrvRelatedRequest) -> tuple[float, float]:
@@ -126,6 +305,9 @@ class PowerBalanceStrategy(ServerMappingStrategy[Tuple[float, float]]):
         """
         return self.negative_consumption(edc_id), self.positive_consumption(edc_id)
 
+    def costs(self, srv_requests: list[SrvRelatedRequest], available: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return self.negative_consumptions(srv_requests), self.positive_consumptions(srv_requests)
+
 
 class HighestPowerStrategy(PowerBalanceStrategy):
     def cost(self, edc_id: str, srv_request: SrvRelatedRequest) -> tuple[float, float]:
@@ -137,6 +319,10 @@ class HighestPowerStrategy(PowerBalanceStrategy):
         negative_consumption, positive_consumption = super().cost(edc_id, srv_request)
         return negative_consumption, -positive_consumption
 
+    def costs(self, srv_requests: list[SrvRelatedRequest], available: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        negative_consumption, positive_consumption = super().costs(srv_requests, available)
+        return negative_consumption, -positive_consumption
+
 
 class SmartGridClosestEDCStrategy(ServerMappingStrategy[Tuple[float, float]]):
     def cost(self, edc_id: str, srv_request: SrvRelatedRequest) -> tuple[float, float]:
@@ -148,6 +334,9 @@ class SmartGridClosestEDCStrategy(ServerMappingStrategy[Tuple[float, float]]):
         gw_id = self.amf.get_client_gateway(srv_request.client_id)
         return self.negative_consumption(edc_id), self.distance(gw_id, edc_id)
 
+    def costs(self, srv_requests: list[SrvRelatedRequest], available: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return self.negative_consumptions(srv_requests), self.gw_distances(srv_requests)
+
 
 class SmartGridEmptiestEDCStrategy(ServerMappingStrategy[Tuple[float, float, float]]):
     """
@@ -159,6 +348,10 @@ class SmartGridEmptiestEDCStrategy(ServerMappingStrategy[Tuple[float, float, flo
         service_id = srv_request.service_id
         return self.negative_consumption(edc_id), self.slice_u(edc_id, service_id), self.free_u(edc_id, service_id)
 
+    def costs(self, srv_requests: list[SrvRelatedRequest],
+              available: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self.negative_consumptions(srv_requests), self.srv_slice_u(srv_requests), self.srv_free_u(srv_requests)
+
 
 class SmartGridFullestEDCStrategy(SmartGridEmptiestEDCStrategy):
     """
@@ -169,3 +362,8 @@ class SmartGridFullestEDCStrategy(SmartGridEmptiestEDCStrategy):
     def cost(self, edc_id: str, srv_request: SrvRelatedRequest) -> tuple[float, float, float]:
         negative_consumption, slice_u, free_u = super().cost(edc_id, srv_request)
         return negative_consumption, -slice_u, -free_u
+
+    def costs(self, srv_requests: list[SrvRelatedRequest],
+              available: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        negative_consumption, slice_u, free_u = super().costs(srv_requests, available)
+        return negative_consumption, -slice_u, -free_u
@@ -1,4 +1,10 @@
-import pkg_resources
+from __future__ import annotations
+import json
+import os
+import sys
+from hashlib import sha1
+from importlib import import_module
+from importlib.metadata import distributions
 from typing import Dict, Generic, Type, TypeVar
 from .client import ClientGenerator, SrvRequestGenerator, SrvActivityGenerator, SrvActivityWindowGenerator
 from .cloud import CloudNetworkDelay, CloudProcTimeModel
@@ -11,31 +17,153 @@ from .optimization import CostFunction, MoveFunction, Optimizer
 T = TypeVar('T')
 
 
+class EntryPointIndex:
+
+    GROUP_PREFIX: str = 'mercury.'
+    CACHE_VERSION: int = 1
+
+    def __init__(self, cache_path: str | None = None):
+        """
+        Index of the entry points of Mercury plugins. Entry points are not loaded until they are required.
+        The index is cached on disk. The cache is invalidated when the import path or the installed
+        distributions change (i.e., when the modification time of any entry of sys.path changes).
+        :param cache_path: path to the cache file. If None, the index is not cached on disk.
+        """
+        self.cache_path: str | None = cache_path
+        self._groups: dict[str, dict[str, str]] | None = None
+
+    @staticmethod
+    def default_cache_path() -> str | None:
+        """
+        :return: path to the default cache file. There is one cache file per import path. The cache directory can be
+                 set with the MERCURY_CACHE_DIR environment variable. If empty, entry points are not cached on disk.
+        """
+        cache_dir = os.environ.get('MERCURY_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'mercury'))
+        if not cache_dir:
+            return None
+        path_id = sha1('\n'.join(os.path.abspath(path) for path in sys.path).encode()).hexdigest()[:16]
+        return os.path.join(cache_dir, f'entry_points_{path_id}.json')
+
+    def group(self, group: str) -> dict[str, str]:
+        """
+        :param group: entry point group.
+        :return: dictionary {entry point name: entry point value (i.e., module:attribute)}.
+        """
+        if self._groups is None:
+            self._groups = self._load()
+        return self._groups.get(group, dict())
+
+    def invalidate(self):
+        """Forces the index to scan the installed distributions again."""
+        self._groups = None
+        if self.cache_path is not None and os.path.exists(self.cache_path):
+            os.remove(self.cache_path)
+
+    @staticmethod
+    def fingerprint() -> list[tuple[str, int]]:
+        res = list()
+        for path in sys.path:
+            path = os.path.abspath(path)
+            try:
+                res.append((path, os.stat(path).st_mtime_ns))
+            except OSError:
+                res.append((path, -1))
+        return res
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        fingerprint = [list(entry) for entry in self.fingerprint()]
+        if self.cache_path is not None:
+            try:
+                with open(self.cache_path) as file:
+                    cache = json.load(file)
+                if cache['version'] == self.CACHE_VERSION and cache['fingerprint'] == fingerprint \
+                        and self._sources_unchanged(cache['sources']):
+                    return cache['groups']
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        groups, sources = self._scan()
+        if self.cache_path is not None:
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                with open(self.cache_path, 'w') as file:
+                    json.dump({'version': self.CACHE_VERSION, 'fingerprint': fingerprint,
+                               'sources': sources, 'groups': groups}, file)
+            except OSError:
+                pass  # Read-only file systems just do not cache the index
+        return groups
+
+    def _scan(self) -> tuple[dict[str, dict[str, str]], dict[str, int]]:
+        groups: dict[str, dict[str, str]] = dict()
+        sources: dict[str, int] = dict()
+        for dist in distributions():
+            eps = [ep for ep in dist.entry_points if ep.group.startswith(self.GROUP_PREFIX)]
+            for ep in eps:
+                groups.setdefault(ep.group, dict()).setdefault(ep.name, ep.value)
+            dist_path = getattr(dist, '_path', None)  # Only available for distributions on the file system
+            if eps and dist_path is not None:
+                source = os.path.abspath(os.path.join(str(dist_path), 'entry_points.txt'))
+                if os.path.exists(source):
+                    sources[source] = os.stat(source).st_mtime_ns
+        return groups, sources
+
+    @staticmethod
+    def _sources_unchanged(sources: dict[str, int]) -> bool:
+        try:
+            return all(os.stat(source).st_mtime_ns == mtime for source, mtime in sources.items())
+        except OSError:
+            return False
+
+
 class Factory(Generic[T]):
+
+    INDEX: EntryPointIndex | None = None  # It is created the first time that a plugin is looked up
+
     def __init__(self, entry_point: str):
-        self._entities = {key: entity for key, entity in self.load_plugins(entry_point).items()}
+        """
+        Factory of Mercury entities. Plugins are resolved from their entry points the first time they are used.
+        :param entry_point: entry point group of the plugins.
+        """
+        self.entry_point: str = entry_point
+        self._entities: dict[str, Type[T]] = dict()
 
     def register(self, key: str, entity: Type[T]):
         if self.defined(key):
             raise ValueError('There is an already defined entity with that name')
         self._entities[key] = entity
 
+    @staticmethod
+    def index() -> EntryPointIndex:
+        """:return: index of the entry points of Mercury plugins. The cache path is resolved on first use."""
+        if Factory.INDEX is None:
+            Factory.INDEX = EntryPointIndex(EntryPointIndex.default_cache_path())
+        return Factory.INDEX
+
     def defined(self, key: str) -> bool:
-        return key in self._entities
+        return key in self._entities or key in self.index().group(self.entry_point)
 
     def create(self, key: str, **kwargs) -> T:
-        if not self.defined(key):
-            raise ValueError(f'Model name "{key}" not defined')
+        if key not in self._entities:
+            if not self.defined(key):
+                raise ValueError(f'Model name "{key}" not defined')
+            self._entities[key] = self.load_plugin(key, self.index().group(self.entry_point)[key])
         return self._entities[key](**kwargs)
 
     @staticmethod
-    def load_plugins(namespace: str) -> dict:
-        res = dict()
-        for ep in pkg_resources.iter_entry_points(group=namespace):
-            try:
-                res[ep.name] = ep.load(require=True)
-            except pkg_resources.UnknownExtra as ue:
-                raise ValueError(f'Plugin {ep} dependencies resolution failed: {ue}')
+    def load_plugin(key: str, value: str) -> Type[T]:
+        """
+        Loads a plugin from its entry point value.
+        :param key: name of the plugin.
+        :param value: entry point value (i.e., module:attribute).
+        :return: plugin class.
+        """
+        module_name, _, attrs = value.partition(':')
+        try:
+            res = import_module(module_name.strip())
+            for attr in attrs.split('[')[0].strip().split('.'):
+                if attr:
+                    res = getattr(res, attr)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f'Plugin {key} = {value} resolution failed: {e}')
         return res
 
 
@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
-from math import pow
+from math import pi, pow
 from mercury.utils.link import Link
-from mercury.utils.maths import from_db_to_natural
-from scipy.constants import c, pi
+from mercury.utils.maths import from_db_to_natural, SPEED_OF_LIGHT as c
 
 
 class Attenuation(ABC):
@@ -2,8 +2,7 @@ from __future__ import annotations
 import pandas as pd
 from abc import ABC
 from math import inf
-from numpy.random import poisson  # We use poisson from numpy as numpy is a dependency of Mercury
-from random import gauss, uniform, expovariate
+from mercury.utils.rng import numpy_rng
 from typing import Any, Tuple
 from ..common.event_generator import EventGenerator, DiracDeltaGenerator, EventHistoryGenerator
 
@@ -23,6 +22,7 @@ class StillNodeMobility(NodeMobility, DiracDeltaGenerator[Tuple[float, ...]]):
 class GradientNodeMobility(NodeMobility):
     def __init__(self, **kwargs):
         super().__init__(**kwargs, initial_val=kwargs['initial_location'])
+        self.np_rng = numpy_rng(self.rng)  # We use poisson from numpy as numpy is a dependency of Mercury
         # Configuration parameters for synthetic client location box (i.e., boundaries of the scenario generation)
         self.synth_location_box: dict[str, float] = kwargs.get('synth_location_box', dict())
         self.check_synth_location_box()
@@ -39,7 +39,7 @@ class GradientNodeMobility(NodeMobility):
         self.gradient = list(self.generate_location_vector(synth_gradient_id, synth_gradient_config))
         # We also make it random the initial direction
         for i in range(len(self.gradient)):
-            if uniform(0, 1) > 0.5:
+            if self.rng.uniform(0, 1) > 0.5:
                 self.gradient[i] = -self.gradient[i]
 
         # Configuration parameters for spurious variations in trajectory
@@ -117,13 +117,14 @@ class GradientNodeMobility(NodeMobility):
         if self.synth_timestep_id == 'constant':
             return self.synth_timestep_config['period']
         elif self.synth_timestep_id == 'uniform':
-            return uniform(self.synth_timestep_config['min_t'], self.synth_timestep_config['max_t'])
+            return self.rng.uniform(self.synth_timestep_config['min_t'], self.synth_timestep_config['max_t'])
         elif self.synth_timestep_id == 'gaussian':
-            return max(0., gauss(self.synth_timestep_config['mu'], self.synth_timestep_config.get('sigma', 0)))
+            return max(0., self.rng.gauss(self.synth_timestep_config['mu'], self.synth_timestep_config.get('sigma', 0)))
         elif self.synth_timestep_id == 'exponential':
-            return expovariate(self.synth_timestep_config['lambda'])
+            return self.rng.expovariate(self.synth_timestep_config['lambda'])
         elif self.synth_timestep_id == 'poisson':
-            return self.synth_timestep_config['t_interval'] * poisson(self.synth_timestep_config.get('lambda', 0))
+            lambd = self.synth_timestep_config.get('lambda', 0)
+            return self.synth_timestep_config['t_interval'] * self.np_rng.poisson(lambd)
         raise ValueError(f'unknown synth_timestep_id: {self.synth_timestep_id}')
 
     def _compute_next_val(self) -> Tuple[float, ...]:
@@ -140,8 +141,7 @@ class GradientNodeMobility(NodeMobility):
                 self.gradient[i] = -self.gradient[i]
         return tuple(new_location)
 
-    @staticmethod
-    def generate_location_vector(synth_id: str, synth_config: dict[str, Any]) -> Tuple[float, ...]:
+    def generate_location_vector(self, synth_id: str, synth_config: dict[str, Any]) -> Tuple[float, ...]:
         location_vector: list[float] = list()
         for coord in 'x', 'y':
             if synth_id == 'constant':
@@ -149,11 +149,11 @@ class GradientNodeMobility(NodeMobility):
             elif synth_id == 'uniform':
                 min_coord = synth_config.get(f'min_{coord}', 0)
                 max_coord = synth_config.get(f'max_{coord}', 0)
-                location_vector.append(uniform(min_coord, max_coord))
+                location_vector.append(self.rng.uniform(min_coord, max_coord))
             elif synth_id == 'gaussian':
                 mu_coord = synth_config.get(f'mu_{coord}', 0)
                 sigma_coord = synth_config.get(f'sigma_{coord}', 0)
-                location_vector.append(gauss(mu_coord, sigma_coord))
+                location_vector.append(self.rng.gauss(mu_coord, sigma_coord))
             else:
                 raise ValueError(f'unknown synth_config ({synth_config})')
         return tuple(location_vector)
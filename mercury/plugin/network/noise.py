@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
+from mercury.utils.maths import BOLTZMANN as k
 from typing import Union
-from scipy.constants import k
 
 
 class Noise(ABC):
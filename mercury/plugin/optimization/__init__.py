@@ -1,3 +1,3 @@
 from .optimizer import Optimizer
-from .cost_function import CostFunction
+from .cost_function import CostFunction, CostBound
 from .move_function import MoveFunction
@@ -2,7 +2,52 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import os
 import pandas as pd
-from typing import Callable
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+from xdevs.transducers import Transducer
+
+if TYPE_CHECKING:
+    from mercury.model import MercuryModelABC
+
+
+class CostBound(Transducer, ABC):
+    def __init__(self, cost_function: CostFunction):
+        """
+        xDEVS transducer that computes a lower bound of a cost function with the outputs of a running simulation.
+        The bound must never decrease as the simulation advances, and it must never exceed the final cost.
+
+        :param cost_function: cost function to be bounded.
+        """
+        super().__init__(transducer_id=f'{type(cost_function).__name__}_bound')
+        self.map: Callable[[float], float] | None = cost_function.map
+        self.raw_bound: float = 0
+
+    @property
+    def bound(self) -> float:
+        """:return: current lower bound of the cost (after applying the map function of the cost function)."""
+        return self.raw_bound if self.map is None else self.map(self.raw_bound)
+
+    def create_known_data_types_map(self) -> Iterable[type]:
+        return [float]
+
+    def initialize(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def bulk_data(self, sim_time: float):
+        for port in self.imminent_ports:
+            for event in port.values:
+                self.update(event)
+
+    @abstractmethod
+    def update(self, event: Any):
+        """
+        Updates the raw lower bound with a new simulation output.
+
+        :param event: simulation output.
+        """
+        pass
 
 
 class CostFunction(ABC):
@@ -11,6 +56,7 @@ class CostFunction(ABC):
         Abstract cost function for the decision support system.
 
         :param map: callable function that modifies the cost after computing.
+        It must be non-decreasing for pruning candidates with online lower bounds.
         :param kwargs: any other implementation-specific parameters.
         """
         self.map: Callable[[float], float] | None = kwargs.get('map')
@@ -35,6 +81,16 @@ class CostFunction(ABC):
         """
         pass
 
+    def online_bound(self, model: MercuryModelABC) -> CostBound | None:
+        """
+        Creates a transducer that computes a lower bound of the cost while the scenario is being simulated.
+        Optimizers use it to abort the simulation of candidates that cannot improve the current solution.
+
+        :param model: Mercury model under study. It must be built.
+        :return: lower bound transducer connected to the model. If None, the cost function does not support it.
+        """
+        return None
+
 
 class DeadlinesCost(CostFunction):
     def _cost(self, base_dir: str) -> float:
@@ -48,6 +104,18 @@ class DeadlinesCost(CostFunction):
         delay_info = pd.read_csv(path)
         return delay_info['deadline_met'].tolist().count(False)
 
+    def online_bound(self, model: MercuryModelABC) -> CostBound | None:
+        bound = DeadlinesBound(self)
+        bound.add_target_port(model.clients.output_srv_report)
+        return bound
+
+
+class DeadlinesBound(CostBound):
+    def update(self, event: Any):
+        """Unmet deadlines can only grow during the simulation."""
+        if not event.deadline_met:
+            self.raw_bound += 1
+
 
 class EnergyCost(CostFunction):
     def _cost(self, base_dir: str) -> float:
@@ -64,5 +132,26 @@ class EnergyCost(CostFunction):
             total_acc_cost += consumer_df['acc_cost'].max()
         return total_acc_cost
 
+    def online_bound(self, model: MercuryModelABC) -> CostBound | None:
+        if model.smart_grid is None:
+            return None
+        bound = EnergyBound(self)
+        for port in model.smart_grid.outputs_consumption.values():
+            bound.add_target_port(port)
+        return bound
+
+
+class EnergyBound(CostBound):
+    def __init__(self, cost_function: CostFunction):
+        """The maximum accumulated cost reported by every EDC so far cannot exceed its maximum in the whole run."""
+        super().__init__(cost_function)
+        self.acc_costs: dict[str, float] = dict()
+
+    def update(self, event: Any):
+        prev_cost = self.acc_costs.get(event.consumer_id)
+        if prev_cost is None or event.acc_cost > prev_cost:
+            self.acc_costs[event.consumer_id] = event.acc_cost
+            self.raw_bound += event.acc_cost if prev_cost is None else event.acc_cost - prev_cost
+
 
 # TODO add AggregatedCost (cuando estén las factorías)
@@ -3,18 +3,61 @@ import json
 import os.path
 from mercury.config import MercuryConfig
 from mercury.msg.packet import PacketInterface, AppPacket
+from mercury.run_controller import RunController
+from mercury.utils.rng import get_seed, set_seed
 import multiprocessing
 from random import random
 from time import time
 from typing import Any, Callable, Type
-from ..cost_function import CostFunction
+from xdevs.sim import Coordinator
+from ..cost_function import CostBound, CostFunction
 from ..move_function import MoveFunction
 import csv
 
 
+class PruningController(RunController):
+    def __init__(self, cost_function: CostFunction, threshold: float):
+        """
+        Run controller that aborts the simulation of a candidate as soon as the online lower bound of its cost
+        exceeds a threshold (i.e., when the candidate cannot be selected by the optimizer anymore).
+
+        :param cost_function: cost function to evaluate the scenario.
+        :param threshold: maximum cost of candidates that could still be selected.
+        """
+        super().__init__()
+        self.cost_function: CostFunction = cost_function
+        self.threshold: float = threshold
+        self.bound: CostBound | None = None
+
+    def create_kpis(self, model) -> list[CostBound]:
+        self.t_stop = None
+        self.bound = self.cost_function.online_bound(model)
+        return [] if self.bound is None else [self.bound]
+
+    def simulate(self, coordinator: Coordinator, time_interv: float) -> bool:
+        """
+        Simulates step by step until the lower bound of the cost exceeds the threshold or the time interval ends.
+
+        :param coordinator: initialized xDEVS coordinator with the lower bound transducer.
+        :param time_interv: maximum time (in seconds) to simulate.
+        :return: True if the simulation was aborted.
+        """
+        if self.bound is None:
+            coordinator.simulate_time(time_interv)
+            return False
+        t_end = coordinator.time_next + time_interv
+        while coordinator.time_next < t_end:
+            coordinator.simulate(1)
+            if self.bound.bound > self.threshold:
+                self.t_stop = coordinator.clock.time
+                return True
+        return False
+
+
 class OptimizerState:
     def __init__(self, cost_function: CostFunction, raw_config: dict[str, Any], base_dir: str, interval: float,
-                 lite: bool = True, p_type: Type[PacketInterface] = AppPacket, clean: bool = True):
+                 lite: bool = True, p_type: Type[PacketInterface] = AppPacket, clean: bool = True,
+                 seed: int | None = None):
         """
         State configuration for a given optimization.
 
@@ -25,6 +68,7 @@ class OptimizerState:
         :param lite: if True, simulations are executed in lite mode. It is activated by default.
         :param p_type: communication layer to use if lite is not activated. Defaults to AppPacket.
         :param clean: if True, the simulation traces are deleted after computing the cost. Defaults to True.
+        :param seed: if not None, the scenario is simulated with common random numbers seeded with this value.
         """
         self.cost_function: CostFunction = cost_function
         self.raw_config: dict[str, Any] = raw_config
@@ -40,6 +84,9 @@ class OptimizerState:
         self.lite: bool = lite
         self.p_type: Type[PacketInterface] = p_type
         self.clean: bool = clean
+        self.seed: int | None = seed
+        self.threshold: float | None = None
+        self.pruned: bool = False
         self._cost: float | None = None
 
     def __eq__(self, other: OptimizerState):
@@ -53,19 +100,19 @@ class OptimizerState:
     @property
     def cost(self) -> float:
         """
-        Returns the scenario cost. This cost is cache-based to save execuion time
+        Returns the scenario cost. This cost is cache-based to save execuion time.
+        If threshold is set and the cost function supports online lower bounds, the simulation is aborted as soon
+        as the lower bound exceeds the threshold. Then, the candidate is pruned and its cost is the lower bound.
         :return: scenario cost.
         """
         if self._cost is None:
-            from mercury import Mercury
-            from mercury.model import MercuryModelABC
-
-            config = MercuryConfig.from_json(self.config_file)
-            model = MercuryModelABC.new_mercury(config, self.lite, self.p_type)
-            model.add_transducers('transducer', 'csv', {'output_dir': self.base_dir})
-            mercury = Mercury(model)
-            mercury.start_simulation(time_interv=self.interval, log_time=False)
-            self._cost = self.cost_function.cost(self.base_dir)
+            prev_seed = get_seed()
+            if self.seed is not None:
+                set_seed(self.seed)  # random streams are created with the configuration and the model
+            try:
+                self._simulate()
+            finally:
+                set_seed(prev_seed)
             # If clean is active, we remove simulation traces
             if self.clean:
                 for file in os.listdir(self.base_dir):
@@ -73,6 +120,23 @@ class OptimizerState:
                         os.remove(os.path.join(self.base_dir, file))
         return self._cost
 
+    def _simulate(self):
+        from mercury import Mercury
+        from mercury.model import MercuryModelABC
+
+        config = MercuryConfig.from_json(self.config_file)
+        model = MercuryModelABC.new_mercury(config, self.lite, self.p_type)
+        model.add_transducers('transducer', 'csv', {'output_dir': self.base_dir})
+        mercury = Mercury(model)
+        if self.threshold is None:
+            mercury.start_simulation(time_interv=self.interval, log_time=False)
+            self._cost = self.cost_function.cost(self.base_dir)
+        else:
+            controller = PruningController(self.cost_function, self.threshold)
+            mercury.start_simulation(time_interv=self.interval, log_time=False, controller=controller)
+            self.pruned = controller.t_stop is not None
+            self._cost = controller.bound.bound if self.pruned else self.cost_function.cost(self.base_dir)
+
 
 class Optimizer:
     def __init__(self, **kwargs):
@@ -89,6 +153,11 @@ class Optimizer:
         :param bool lite: if true, it uses the Mercury lite version.
         :param Type[PacketInterface] p_type: package type. By default, it is set to AppPacket.
         :param bool clean: If True, simulation traces are deleted after computing the scenario cost. Defaults to True.
+        :param bool pruning: if True, the simulation of candidates is aborted as soon as the online lower bound of
+        their cost shows that they cannot be selected (see CostFunction.online_bound). Defaults to True.
+        :param int crn_seed: if not None, states are simulated with common random numbers: every stochastic source
+        of the scenario has its own random stream, and all the states of the run are seeded with crn_seed. Thus,
+        candidates see the same workload as the current and the best states they are compared with. Defaults to None.
         :param kwargs: any additional parameter required by the class specialization.
         """
         self.current_state: OptimizerState | None = None
@@ -114,9 +183,11 @@ class Optimizer:
         self.lite: bool = kwargs.get('lite', True)
         self.p_type: Type[PacketInterface] = kwargs.get('p_type', AppPacket)
         self.clean: bool = kwargs.get('clean', True)
+        self.pruning: bool = kwargs.get('pruning', True)
+        self.crn_seed: int | None = kwargs.get('crn_seed')
         initial_state_dir = os.path.join(self.base_dir, 'initial_state')
-        self.initial_state = OptimizerState(self.cost_function, raw_config, initial_state_dir,
-                                            self.interval, self.lite, self.p_type, self.clean)
+        self.initial_state = OptimizerState(self.cost_function, raw_config, initial_state_dir, self.interval,
+                                            self.lite, self.p_type, self.clean, self.crn_seed)
 
     @staticmethod
     def cost_and_append(state: OptimizerState, states: list[OptimizerState]):
@@ -141,7 +212,15 @@ class Optimizer:
             new_raw_config = self.move_function.move(prev_raw_state)
         return new_raw_config
 
-    def new_candidate(self, prev_state: OptimizerState) -> OptimizerState | None:
+    def new_candidate(self, prev_state: OptimizerState, threshold: float | None = None) -> OptimizerState | None:
+        """
+        Creates and evaluates up to n_candidates candidates and returns the best one.
+
+        :param prev_state: state used for generating the candidates.
+        :param threshold: if not None and pruning is enabled, candidates whose cost exceeds this value are pruned.
+        :return: best candidate. If no valid candidate was found, it returns None.
+        """
+        threshold = threshold if self.pruning else None
         # create iteration folder
         iter_dir = os.path.join(self.base_dir, f'iter_{self.n_iter}')
         if self.n_candidates > 1:
@@ -154,8 +233,8 @@ class Optimizer:
             raw_candidate = self.new_raw_candidate(prev_state.raw_config)
             if raw_candidate is not None:
                 candidate_dir = os.path.join(iter_dir, f'candidate_{i}') if self.n_candidates > 1 else iter_dir
-                candidate = OptimizerState(self.cost_function, raw_candidate, candidate_dir,
-                                           self.interval, self.lite, self.p_type, self.clean)
+                candidate = OptimizerState(self.cost_function, raw_candidate, candidate_dir, self.interval,
+                                           self.lite, self.p_type, self.clean, self.crn_seed)
                 candidates.append(candidate)
         # if candidates list is empty, we return None
         if not candidates:
@@ -165,13 +244,19 @@ class Optimizer:
             scores = self.manager.list()
             jobs = list()
             for candidate in candidates:
+                candidate.threshold = threshold
                 p = multiprocessing.Process(target=Optimizer.cost_and_append, args=(candidate, scores))
                 p.start()
                 jobs.append(p)
             for t in jobs:
                 t.join()
-        # Otherwise, we do it sequentially
+        # Otherwise, we do it sequentially, and candidates worse than the best one so far can be pruned too
         else:
+            for candidate in candidates:
+                candidate.threshold = threshold
+                cost = candidate.cost
+                if self.pruning and not candidate.pruned:
+                    threshold = cost if threshold is None else min(threshold, cost)
             scores = candidates
         # Return best candidate
         best_candidate = min(scores, key=lambda x: x.cost)
@@ -187,7 +272,7 @@ class Optimizer:
             log_path = os.path.join(self.base_dir, 'optimization_log.csv')
             file = open(log_path, 'w', newline='')
             csv_writer = csv.writer(file, delimiter=',')
-            csv_writer.writerow(['n_iter', 't_start', 't_stop', 'candidate_cost',
+            csv_writer.writerow(['n_iter', 't_start', 't_stop', 'candidate_cost', 'pruned',
                                  'acceptance_p', 'accepted', 'current_cost', 'best_cost'])
             file.flush()
         for i in range(n_iterations):
@@ -212,16 +297,17 @@ class Optimizer:
 
     def run_iteration(self, csv_writer) -> str | None:
         t_start = time()
-        candidate = self.new_candidate(self.current_state)
+        u = random()  # drawn in advance to know which candidates can be pruned
+        candidate = self.new_candidate(self.current_state, self.acceptance_threshold(u))
         if candidate is None:
             return 'UNABLE TO GENERATE A VALID CANDIDATE'
         p = self.acceptance_p(candidate)
-        accepted = p >= random()
+        accepted = p >= u
         if accepted:
             self.current_state = candidate
         t_stop = time()
         if csv_writer is not None:
-            csv_writer.writerow([self.n_iter, t_start, t_stop, candidate.cost, p,
+            csv_writer.writerow([self.n_iter, t_start, t_stop, candidate.cost, candidate.pruned, p,
                                  accepted, self.current_state.cost, self.best_state.cost])
         return None
 
@@ -233,3 +319,13 @@ class Optimizer:
         :return: acceptance probability
         """
         return 1 if candidate.cost < self.current_state.cost else 0
+
+    def acceptance_threshold(self, u: float) -> float | None:
+        """
+        Returns the maximum cost of a candidate that could be accepted with a given random number.
+        It must be consistent with acceptance_p, as candidates with a greater cost are pruned.
+
+        :param u: random number used for deciding whether the candidate is accepted or not.
+        :return: maximum cost of an acceptable candidate. If None, every candidate could be accepted.
+        """
+        return None if u <= 0 else self.current_state.cost
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from math import exp
+from math import exp, log
 from typing import Callable
 from .optimizer import Optimizer, OptimizerState
 
@@ -55,6 +55,9 @@ class SimulatedAnnealing(Optimizer):
         except OverflowError:
             return 1
 
+    def acceptance_threshold(self, u: float) -> float | None:
+        return None if u <= 0 else self.current_state.cost - self.current_t * log(u)
+
     def run_iteration(self, csv_writer) -> str | None:
         super().run_iteration(csv_writer)
         self.current_t = self.adjust_temp(self.current_t)
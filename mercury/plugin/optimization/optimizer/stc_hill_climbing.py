@@ -1,5 +1,5 @@
 from __future__ import annotations
-from math import exp
+from math import exp, log
 from .optimizer import Optimizer, OptimizerState
 
 
@@ -22,3 +22,6 @@ class StochasticHillClimbing(Optimizer):
             return 1 / (1 + exp(delta_cost / self.temp))
         except OverflowError:
             return 1
+
+    def acceptance_threshold(self, u: float) -> float | None:
+        return None if u <= 0 else self.current_state.cost + max(0., self.temp * log((1 - u) / u))
@@ -28,6 +28,10 @@ class TabuSearch(Optimizer):
             return None
         return raw_candidate
 
+    def acceptance_threshold(self, u: float) -> float | None:
+        """Every candidate is accepted, so only the candidates worse than the best one of the iteration are pruned."""
+        return None
+
     def acceptance_p(self, candidate: OptimizerState) -> float:
         """
         Returns the probability to move the current state to a new candidate.
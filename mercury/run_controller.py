@@ -0,0 +1,220 @@
+from __future__ import annotations
+from math import floor
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+from xdevs.models import Port
+from xdevs.sim import Coordinator
+from xdevs.transducers import Transducer
+from .utils.steady_state import SteadyStateEstimate, batch_means
+
+if TYPE_CHECKING:
+    from .model.model import MercuryModelABC
+
+
+class KPI(Transducer):
+    def __init__(self, kpi_id: str, value: Callable[[Any], float | None], signal_id: Callable[[Any], Any] | None = None,
+                 bin_size: float = 1, abs_half_width: float | None = None, rel_half_width: float | None = None,
+                 filters: dict[str, Any] | None = None):
+        """
+        Key performance indicator monitored online during a simulation.
+        :param kpi_id: ID of the KPI.
+        :param value: function that computes the value of an event. Events with None values are ignored.
+        :param signal_id: if None, every event is an observation of the KPI (e.g., the delay of a request).
+        Otherwise, the KPI is the sum of piecewise-constant signals (e.g., the power demand of every EDC), and this
+        function returns the ID of the signal of an event. Signals are observed as their average over time bins.
+        :param bin_size: length (in seconds) of the time bins of signal KPIs.
+        :param abs_half_width: target half-width of the confidence interval of the KPI.
+        :param rel_half_width: target half-width of the confidence interval of the KPI relative to its mean.
+        :param filters: {attribute: value} only events with these attribute values are considered.
+        """
+        super().__init__(transducer_id=kpi_id)
+        if bin_size <= 0:
+            raise ValueError(f'bin_size ({bin_size}) must be greater than 0')
+        self.value: Callable[[Any], float | None] = value
+        self.signal_id: Callable[[Any], Any] | None = signal_id
+        self.bin_size: float = bin_size
+        self.abs_half_width: float | None = abs_half_width
+        self.rel_half_width: float | None = rel_half_width
+        self.filters: dict[str, Any] = dict() if filters is None else filters
+        self.observations: list[float] = list()
+        self.estimate: SteadyStateEstimate | None = None
+
+        self.signals: dict[Any, float] = dict()
+        self.total: float = 0
+        self.t_last: float | None = None
+        self.bin_start: float = 0
+        self.bin_integral: float = 0
+
+    @property
+    def targeted(self) -> bool:
+        """:return: True if the KPI has a precision target."""
+        return self.abs_half_width is not None or self.rel_half_width is not None
+
+    @property
+    def converged(self) -> bool:
+        """
+        :return: True if the last estimate of the KPI meets its precision target. Estimates with no variance are
+        not converged: they usually come from KPIs that did not change yet (e.g., no deadline has been missed).
+        """
+        if not self.targeted or self.estimate is None or self.estimate.half_width <= 0:
+            return False
+        return self.abs_half_width is not None and self.estimate.half_width <= self.abs_half_width or \
+            self.rel_half_width is not None and self.estimate.rel_half_width <= self.rel_half_width
+
+    def create_known_data_types_map(self) -> Iterable[type]:
+        return [float]
+
+    def initialize(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def bulk_data(self, sim_time: float):
+        for port in self.imminent_ports:
+            for event in port.values:
+                if all(getattr(event, attr) == value for attr, value in self.filters.items()):
+                    value = self.value(event)
+                    if value is not None:
+                        if self.signal_id is None:
+                            self.observations.append(value)
+                        else:
+                            if self.t_last is None:  # signals start with their first event
+                                self.t_last = self.bin_start = sim_time
+                            self.update_time(sim_time)
+                            signal_id = self.signal_id(event)
+                            self.total += value - self.signals.get(signal_id, 0)
+                            self.signals[signal_id] = value
+
+    def update_time(self, t: float):
+        """Holds the current value of signal KPIs until time t, and adds the observations of the complete bins."""
+        if self.t_last is None:
+            return
+        n_bins = floor((t - self.bin_start) / self.bin_size)
+        if n_bins > 0:
+            bin_end = self.bin_start + self.bin_size
+            self.observations.append((self.bin_integral + self.total * (bin_end - self.t_last)) / self.bin_size)
+            self.observations.extend([self.total] * (n_bins - 1))
+            self.bin_start += n_bins * self.bin_size
+            self.t_last = self.bin_start
+            self.bin_integral = 0
+        self.bin_integral += self.total * (t - self.t_last)
+        self.t_last = t
+
+    def update_estimate(self, n_batches: int, confidence: float, min_batch_size: int) -> SteadyStateEstimate | None:
+        self.estimate = batch_means(self.observations, n_batches, confidence, min_batch_size=min_batch_size)
+        return self.estimate
+
+
+class RunController:
+    # {KPI type: (function that returns the target ports of the model, event value, signal ID)}
+    KPIS: dict[str, tuple[Callable[[MercuryModelABC], list[Port]], Callable[[Any], float | None],
+                          Callable[[Any], Any] | None]] = {
+        'srv_delay': (lambda m: [m.clients.output_srv_report], lambda x: x.t_delay, None),
+        'deadline_miss_ratio': (lambda m: [m.clients.output_srv_report], lambda x: 0 if x.deadline_met else 1, None),
+        'power_demand': (lambda m: [m.edcs.output_edc_report], lambda x: x.power_demand, lambda x: x.edc_id),
+        'it_power': (lambda m: [m.edcs.output_edc_report], lambda x: x.it_power, lambda x: x.edc_id),
+    }
+
+    def __init__(self, check_period: float = 1000, n_batches: int = 20, confidence: float = 0.95,
+                 min_batch_size: int = 10):
+        """
+        Run controller that stops simulations once the selected KPIs are estimated with the required precision.
+        KPIs are estimated with the batch means method after removing the warm-up period with the MSER-5 rule.
+        :param check_period: simulation time (in seconds) between consecutive precision checks.
+        :param n_batches: number of batches for estimating the confidence intervals of the KPIs.
+        :param confidence: confidence level of the intervals.
+        :param min_batch_size: minimum number of observations per batch. KPIs with fewer observations are not estimated.
+        """
+        if check_period <= 0:
+            raise ValueError(f'check_period ({check_period}) must be greater than 0')
+        if n_batches < 2:
+            raise ValueError(f'n_batches ({n_batches}) must be greater than 1')
+        if not 0 < confidence < 1:
+            raise ValueError(f'confidence ({confidence}) must be in the (0, 1) interval')
+        if min_batch_size < 1:
+            raise ValueError(f'min_batch_size ({min_batch_size}) must be greater than 0')
+        self.check_period: float = check_period
+        self.n_batches: int = n_batches
+        self.confidence: float = confidence
+        self.min_batch_size: int = min_batch_size
+        self.kpi_configs: dict[str, tuple[str, dict[str, Any]]] = dict()
+        self.kpis: dict[str, KPI] = dict()
+        self.t_stop: float | None = None
+
+    def add_kpi(self, kpi_type: str, abs_half_width: float | None = None, rel_half_width: float | None = None,
+                bin_size: float = 1, kpi_id: str | None = None, **filters):
+        """
+        Adds a KPI to be monitored.
+        :param kpi_type: type of KPI (see RunController.KPIS).
+        :param abs_half_width: target half-width of the confidence interval of the KPI.
+        :param rel_half_width: target half-width of the confidence interval relative to the mean of the KPI.
+        If no target is defined, the KPI is estimated but it does not stop the simulation.
+        :param bin_size: length (in seconds) of the time bins of KPIs that are time-weighted (e.g., power demand).
+        :param kpi_id: ID of the KPI. By default, it is the KPI type.
+        :param filters: {attribute: value} only events with these attributes are considered (e.g., service_id='adas').
+        """
+        if kpi_type not in self.KPIS:
+            raise ValueError(f'unknown KPI type: {kpi_type}')
+        kpi_id = kpi_type if kpi_id is None else kpi_id
+        if kpi_id in self.kpi_configs:
+            raise ValueError(f'KPI {kpi_id} already defined')
+        self.kpi_configs[kpi_id] = (kpi_type, {'abs_half_width': abs_half_width, 'rel_half_width': rel_half_width,
+                                               'bin_size': bin_size, 'filters': filters})
+
+    def create_kpis(self, model: MercuryModelABC) -> list[KPI]:
+        """
+        Creates the transducers that monitor the KPIs of a Mercury model.
+        :param model: Mercury model. It must be built.
+        :return: list of KPI transducers. They must be added to the coordinator of the simulation.
+        """
+        self.kpis = dict()
+        self.t_stop = None
+        for kpi_id, (kpi_type, kpi_config) in self.kpi_configs.items():
+            ports, value, signal_id = self.KPIS[kpi_type]
+            kpi = KPI(kpi_id, value, signal_id, **kpi_config)
+            for port in ports(model):
+                kpi.add_target_port(port)
+            self.kpis[kpi_id] = kpi
+        return list(self.kpis.values())
+
+    @property
+    def converged(self) -> bool:
+        """:return: True if all the KPIs with a precision target meet it."""
+        targeted = [kpi for kpi in self.kpis.values() if kpi.targeted]
+        return bool(targeted) and all(kpi.converged for kpi in targeted)
+
+    def update_estimates(self, t: float) -> dict[str, SteadyStateEstimate | None]:
+        """
+        Estimates the KPIs with all the observations until time t.
+        :param t: current simulation time.
+        :return: {KPI ID: estimate}. If there are not enough observations for a KPI, its estimate is None.
+        """
+        for kpi in self.kpis.values():
+            kpi.update_time(t)
+            kpi.update_estimate(self.n_batches, self.confidence, self.min_batch_size)
+        return self.report()
+
+    def report(self) -> dict[str, SteadyStateEstimate | None]:
+        """:return: last estimate of every KPI {KPI ID: estimate}."""
+        return {kpi_id: kpi.estimate for kpi_id, kpi in self.kpis.items()}
+
+    def simulate(self, coordinator: Coordinator, time_interv: float) -> bool:
+        """
+        Simulates until all the KPIs meet their precision targets or the time interval ends.
+        :param coordinator: initialized xDEVS coordinator with the KPI transducers.
+        :param time_interv: maximum time (in seconds) to simulate.
+        :return: True if the simulation stopped because all the KPIs met their precision targets.
+        """
+        t_end = coordinator.time_next + time_interv
+        t_check = coordinator.time_next + self.check_period
+        while True:
+            coordinator.simulate_time(min(t_check, t_end) - coordinator.time_next)
+            t_now = coordinator.clock.time
+            self.update_estimates(min(t_now, t_end))
+            if self.converged:
+                self.t_stop = t_now
+                return True
+            if coordinator.time_next >= t_end:
+                return False
+            while t_check <= coordinator.time_next:
+                t_check += self.check_period
@@ -0,0 +1,12 @@
+from xdevs.transducers import Transducers
+from .csv_transducer import AsyncCSVTransducer
+from .sqlite_transducer import SQLiteTransducer
+from .summary_transducer import SummaryTransducer
+from .writer import AsyncWriter
+
+# Mercury transducers are registered in xDEVS at runtime
+for _name, _plugin in ('csv_async', AsyncCSVTransducer), ('sqlite', SQLiteTransducer), ('summary', SummaryTransducer):
+    try:
+        Transducers.add_plugin(_name, _plugin)
+    except ValueError:  # plugin already registered
+        pass
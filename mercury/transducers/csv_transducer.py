@@ -0,0 +1,56 @@
+from __future__ import annotations
+from typing import Any
+from xdevs.plugins.transducers.csv_transducer import CSVTransducer
+from .writer import AsyncWriter
+
+
+class AsyncCSVTransducer(CSVTransducer):
+    def __init__(self, **kwargs):
+        """
+        xDEVS-to-CSV file transducer with asynchronous output.
+        Events are mapped to rows during the simulation, but rows are serialized and written by a writer thread.
+        The output files are identical to those of the regular CSV transducer.
+        :param batch_size: maximum number of rows sent to the writer thread at once. By default, it is set to 512.
+        :param max_batches: maximum number of batches waiting to be written. By default, it is set to 64.
+        When this limit is reached, the simulation waits for the writer thread.
+        """
+        super().__init__(**kwargs)
+        self.batch_size: int = kwargs.get('batch_size', 512)
+        self.max_batches: int = kwargs.get('max_batches', 64)
+        self.state_writer: AsyncWriter[list[Any]] | None = None
+        self.event_writer: AsyncWriter[list[Any]] | None = None
+
+    def initialize(self):
+        super().initialize()
+        if self.state_csv_writer is not None:
+            self.state_writer = AsyncWriter(self.state_csv_writer.writerows, self.batch_size,
+                                            self.max_batches, f'{self.transducer_id}_states')
+        if self.event_csv_writer is not None:
+            self.event_writer = AsyncWriter(self.event_csv_writer.writerows, self.batch_size,
+                                            self.max_batches, f'{self.transducer_id}_events')
+
+    def exit(self):
+        try:
+            for writer in self.state_writer, self.event_writer:
+                if writer is not None:
+                    writer.close()
+        finally:
+            self.state_writer = self.event_writer = None
+            super().exit()
+
+    def bulk_data(self, sim_time: float):
+        if self.state_writer is not None:
+            for state_insert in self._iterate_state_inserts(sim_time):
+                self.state_writer.put([state_insert[field] for field in self.state_header])
+        if self.event_writer is not None:
+            for event_insert in self._iterate_event_inserts(sim_time):
+                self.event_writer.put([event_insert[field] for field in self.event_header])
+
+    def flush(self):
+        """Blocks until all the rows generated so far are written."""
+        for writer in self.state_writer, self.event_writer:
+            if writer is not None:
+                writer.flush()
+        for file in self.state_csv_file, self.event_csv_file:
+            if file is not None:
+                file.flush()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+import os
+import sqlite3
+from typing import Any, Iterable
+from xdevs.transducers import Transducer
+
+
+class SQLiteTransducer(Transducer):
+
+    supported_data_types: dict[type, str]
+
+    def __init__(self, **kwargs):
+        """
+        xDEVS-to-SQLite transducer. States and events are written to typed tables of a SQLite database file.
+        Rows are inserted in batches, and every batch is inserted in a single transaction.
+        Several transducers can share the same database file, as they do not keep transactions open between batches.
+        :param path: path to the SQLite database file. By default, it is "results.db" in the output directory.
+        :param output_dir: directory that will contain the database file. By default, it is set to "./".
+        :param batch_size: number of rows inserted per transaction. By default, it is set to 10000.
+        :param index_fields: fields to be indexed when the transducer exits. By default,
+        the simulation time, DEVS element names (if included) and all the fields whose name ends with "_id".
+        """
+        super().__init__(**kwargs)
+        self.path: str = kwargs.get('path', os.path.join(kwargs.get('output_dir', '.'), 'results.db'))
+        self.batch_size: int = kwargs.get('batch_size', 10000)
+        if self.batch_size < 1:
+            raise ValueError(f'batch_size ({self.batch_size}) must be greater than 0')
+        self.index_fields: Iterable[str] | None = kwargs.get('index_fields')
+
+        self.state_table: str = self.transducer_id + '_states'
+        self.event_table: str = self.transducer_id + '_events'
+        self.state_header: list[str] = [self.sim_time_id]
+        self.event_header: list[str] = [self.sim_time_id]
+        if self.include_names:
+            self.state_header.append(self.model_name_id)
+            self.event_header.extend((self.model_name_id, self.port_name_id))
+
+        self.connection: sqlite3.Connection | None = None
+        self.state_insert: str | None = None
+        self.event_insert: str | None = None
+        self.state_rows: list[list[Any]] = list()
+        self.event_rows: list[list[Any]] = list()
+
+    def create_known_data_types_map(self) -> dict[type, str]:
+        return {str: 'TEXT', int: 'INTEGER', float: 'REAL', bool: 'INTEGER'}
+
+    def initialize(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        if self.target_components:
+            self.state_insert = self._create_table(self.state_table, self.state_header, self.state_mapper)
+        if self.target_ports:
+            self.event_insert = self._create_table(self.event_table, self.event_header, self.event_mapper)
+
+    def exit(self):
+        if self.connection is not None:
+            self.flush()
+            index_fields = self._index_fields()
+            with self.connection:
+                for table, header, insert in ((self.state_table, self.state_header, self.state_insert),
+                                              (self.event_table, self.event_header, self.event_insert)):
+                    if insert is not None:
+                        for field in header:
+                            if field in index_fields:
+                                self.connection.execute(f'CREATE INDEX IF NOT EXISTS "{table}_{field}" '
+                                                        f'ON "{table}" ("{field}")')
+            self.connection.close()
+            self.connection = None
+
+    def bulk_data(self, sim_time: float):
+        if self.state_insert is not None:
+            for state_insert in self._iterate_state_inserts(sim_time):
+                self.state_rows.append([state_insert[field] for field in self.state_header])
+            if len(self.state_rows) >= self.batch_size:
+                self._insert_rows(self.state_insert, self.state_rows)
+        if self.event_insert is not None:
+            for event_insert in self._iterate_event_inserts(sim_time):
+                self.event_rows.append([event_insert[field] for field in self.event_header])
+            if len(self.event_rows) >= self.batch_size:
+                self._insert_rows(self.event_insert, self.event_rows)
+
+    def flush(self):
+        """Inserts all the pending rows in the database."""
+        if self.state_rows:
+            self._insert_rows(self.state_insert, self.state_rows)
+        if self.event_rows:
+            self._insert_rows(self.event_insert, self.event_rows)
+
+    def _insert_rows(self, insert: str, rows: list[list[Any]]):
+        with self.connection:
+            self.connection.executemany(insert, rows)
+        rows.clear()
+
+    def _create_table(self, table: str, header: list[str], field_mapper: dict[str, tuple]) -> str:
+        columns = [f'"{self.sim_time_id}" REAL NOT NULL']
+        columns.extend(f'"{name_id}" TEXT NOT NULL' for name_id in header[1:])  # DEVS element names
+        for field_name, (field_type, _) in field_mapper.items():
+            column_type = self.supported_data_types.get(field_type)
+            if column_type is None:
+                self._log_unknown_data(field_type, field_name)
+                column_type = self.supported_data_types[str]
+            columns.append(f'"{field_name}" {column_type}')
+        header.extend(field_mapper)
+        with self.connection:
+            self.connection.execute(f'DROP TABLE IF EXISTS "{table}"')
+            self.connection.execute(f'CREATE TABLE "{table}" ({", ".join(columns)})')
+        return f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(header))})'
+
+    def _index_fields(self) -> set[str]:
+        if self.index_fields is not None:
+            return set(self.index_fields)
+        res = {self.sim_time_id}
+        if self.include_names:
+            res |= {self.model_name_id, self.port_name_id}
+        res |= {field for field in (*self.state_mapper, *self.event_mapper) if field.endswith('_id')}
+        return res
@@ -0,0 +1,217 @@
+from __future__ import annotations
+import csv
+import os
+from math import inf
+from typing import Any, Iterable
+from xdevs.transducers import Transducer
+
+
+def missing(value: Any) -> bool:
+    """:return: True if the value is undefined (i.e., None or NaN)."""
+    return value is None or value != value
+
+
+class EventSummary:
+    def __init__(self, n_numeric: int, n_bool: int):
+        """
+        Aggregates of events of an entity during a summary interval. Undefined values (None or NaN) are ignored.
+        :param n_numeric: number of numeric fields.
+        :param n_bool: number of boolean fields.
+        """
+        self.n_events: int = 0
+        self.counts: list[int] = [0] * n_numeric
+        self.sums: list[float] = [0] * n_numeric
+        self.maxs: list[float] = [-inf] * n_numeric
+        self.trues: list[int] = [0] * n_bool
+
+    def update(self, t: float, numeric: list[Any], bools: list[Any]):
+        self.n_events += 1
+        for i, value in enumerate(numeric):
+            if not missing(value):
+                self.counts[i] += 1
+                self.sums[i] += value
+                self.maxs[i] = max(self.maxs[i], value)
+        for i, value in enumerate(bools):
+            self.trues[i] += bool(value)
+
+    def close(self, t_end: float) -> list[Any] | None:
+        """
+        Closes the current interval.
+        :param t_end: end time of the interval.
+        :return: aggregates of the interval. If there were no events, it returns None.
+        """
+        if not self.n_events:
+            return None
+        res = [self.n_events]
+        for count, acc, max_value in zip(self.counts, self.sums, self.maxs):
+            res.extend((acc / count, max_value) if count else (None, None))
+        res.extend(trues / self.n_events for trues in self.trues)
+        self.n_events = 0
+        self.counts = [0] * len(self.counts)
+        self.sums = [0] * len(self.sums)
+        self.maxs = [-inf] * len(self.maxs)
+        self.trues = [0] * len(self.trues)
+        return res
+
+
+class SignalSummary:
+    def __init__(self, n_numeric: int, n_bool: int):
+        """
+        Time-weighted aggregates of a piecewise-constant signal of an entity during a summary interval.
+        Every reported value is held until the next report of the same entity. Undefined values (None or NaN)
+        are ignored, so means are weighted by the time during which every field was defined.
+        :param n_numeric: number of numeric fields.
+        :param n_bool: number of boolean fields.
+        """
+        self.defined: bool = False
+        self.n_events: int = 0
+        self.t_last: float = 0
+        self.t_covered: float = 0
+        self.numeric: list[Any] = [None] * n_numeric
+        self.bools: list[Any] = [False] * n_bool
+        self.t_defined: list[float] = [0] * n_numeric
+        self.integrals: list[float] = [0] * n_numeric
+        self.maxs: list[float] = [-inf] * n_numeric
+        self.t_trues: list[float] = [0] * n_bool
+
+    def advance(self, t: float):
+        """Holds the current values until time t."""
+        delta = t - self.t_last
+        if delta > 0:
+            self.t_covered += delta
+            for i, value in enumerate(self.numeric):
+                if not missing(value):
+                    self.t_defined[i] += delta
+                    self.integrals[i] += value * delta
+                    self.maxs[i] = max(self.maxs[i], value)
+            for i, value in enumerate(self.bools):
+                if value:
+                    self.t_trues[i] += delta
+            self.t_last = t
+
+    def update(self, t: float, numeric: list[Any], bools: list[Any]):
+        if self.defined:
+            self.advance(t)
+        else:
+            self.defined = True
+            self.t_last = t  # the signal of the entity starts now
+        self.n_events += 1
+        self.numeric = numeric
+        self.bools = bools
+
+    def close(self, t_end: float) -> list[Any] | None:
+        """
+        Closes the current interval.
+        :param t_end: end time of the interval.
+        :return: aggregates of the interval. If the signal was not defined during the interval, it returns None.
+        """
+        self.advance(t_end)
+        if not self.t_covered:
+            return None
+        res = [self.n_events]
+        for t_defined, integral, max_value in zip(self.t_defined, self.integrals, self.maxs):
+            res.extend((integral / t_defined, max_value, integral) if t_defined else (None, None, None))
+        res.extend(t_true / self.t_covered for t_true in self.t_trues)
+        self.n_events = 0
+        self.t_covered = 0
+        self.t_defined = [0] * len(self.t_defined)
+        self.integrals = [0] * len(self.integrals)
+        self.maxs = [-inf] * len(self.maxs)
+        self.t_trues = [0] * len(self.t_trues)
+        return res
+
+
+class SummaryTransducer(Transducer):
+
+    TIME_WEIGHTED_SUFFIXES: tuple[str, ...] = ('_edc_report', '_network', '_smart_grid')
+
+    def __init__(self, **kwargs):
+        """
+        xDEVS transducer that writes one row per entity and fixed simulation time interval instead of one per event.
+        Entities are identified by the event fields of unknown types and strings (e.g., edc_id or client_id).
+        For every interval and entity, the output contains the number of events, mean and maximum values of numeric
+        fields, and the ratio of true values of boolean fields. Time-weighted summaries also contain the integral of
+        numeric fields over the interval (e.g., energy from power), and means and ratios are weighted by time.
+        The last interval ends with the last simulation step observed by the transducer. States are not summarized.
+        :param interval: length (in seconds) of the summary intervals. By default, it is set to 60.
+        :param time_weighted: if True, events are samples of piecewise-constant signals (e.g., power demand).
+        Otherwise, every event is an independent observation (e.g., the delay of a request). By default,
+        it is True for Mercury EDC, network, and smart grid reports (see TIME_WEIGHTED_SUFFIXES).
+        :param delimiter: delimiter used in the output CSV file. By default, it is set to ",".
+        :param output_dir: directory that will contain the output CSV file. By default, it is set to "./"
+        """
+        super().__init__(**kwargs)
+        self.interval: float = kwargs.get('interval', 60)
+        if self.interval <= 0:
+            raise ValueError(f'interval ({self.interval}) must be greater than 0')
+        time_weighted = self.transducer_id.endswith(self.TIME_WEIGHTED_SUFFIXES)
+        self.time_weighted: bool = kwargs.get('time_weighted', time_weighted)
+        self.delimiter: str = kwargs.get('delimiter', ',')
+        self.filename: str = os.path.join(kwargs.get('output_dir', '.'), self.transducer_id + '_summary.csv')
+
+        self.key_fields: list[str] = list()
+        self.numeric_fields: list[str] = list()
+        self.bool_fields: list[str] = list()
+        self.summaries: dict[tuple, EventSummary | SignalSummary] = dict()
+        self.t_start: float = 0
+        self.t_last: float = 0
+        self.csv_file = None
+        self.csv_writer = None
+
+    def create_known_data_types_map(self) -> Iterable[type]:
+        return [str, int, float, bool]
+
+    @property
+    def header(self) -> list[str]:
+        res = [self.sim_time_id, *self.key_fields, 'n_events']
+        for field in self.numeric_fields:
+            res.extend((f'{field}_mean', f'{field}_max'))
+            if self.time_weighted:
+                res.append(f'{field}_integral')
+        res.extend(f'{field}_ratio' for field in self.bool_fields)
+        return res
+
+    def initialize(self):
+        if self.target_ports:
+            if self.include_names:
+                self.key_fields.extend((self.model_name_id, self.port_name_id))
+            for field, (field_type, _) in self.event_mapper.items():
+                if field_type is bool:
+                    self.bool_fields.append(field)
+                elif field_type in (int, float):
+                    self.numeric_fields.append(field)
+                else:
+                    self.key_fields.append(field)
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            self.csv_file = open(self.filename, 'w')
+            self.csv_writer = csv.writer(self.csv_file, delimiter=self.delimiter)
+            self.csv_writer.writerow(self.header)
+
+    def exit(self):
+        if self.csv_file is not None:
+            if self.t_last > self.t_start:
+                self._write_interval(self.t_last)
+            self.csv_file.close()
+            self.csv_file = None
+
+    def bulk_data(self, sim_time: float):
+        if self.csv_writer is None:
+            return
+        while sim_time >= self.t_start + self.interval:
+            self._write_interval(self.t_start + self.interval)
+            self.t_start += self.interval
+        self.t_last = sim_time
+        summary_class = SignalSummary if self.time_weighted else EventSummary
+        for event in self._iterate_event_inserts(sim_time):
+            key = tuple(event[field] for field in self.key_fields)
+            summary = self.summaries.get(key)
+            if summary is None:
+                summary = self.summaries[key] = summary_class(len(self.numeric_fields), len(self.bool_fields))
+            summary.update(sim_time, [event[field] for field in self.numeric_fields],
+                           [event[field] for field in self.bool_fields])
+
+    def _write_interval(self, t_end: float):
+        for key, summary in self.summaries.items():
+            row = summary.close(t_end)
+            if row is not None:
+                self.csv_writer.writerow([self.t_start, *key, *row])
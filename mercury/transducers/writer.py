@@ -0,0 +1,87 @@
+from __future__ import annotations
+from queue import Queue
+from threading import Thread
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class AsyncWriter(Generic[T]):
+    def __init__(self, write: Callable[[list[T]], None], batch_size: int = 512,
+                 max_batches: int = 64, name: str | None = None):
+        """
+        Writes records to an output in a dedicated thread, so simulation and I/O overlap.
+        Records are grouped in batches and sent to the writer thread through a bounded queue.
+        When the queue is full, the simulation blocks until the writer thread catches up (backpressure).
+        :param write: function that writes a batch of records to the output. It is only called by the writer thread.
+        :param batch_size: maximum number of records per batch.
+        :param max_batches: maximum number of batches waiting in the queue.
+        :param name: name of the writer thread.
+        """
+        if batch_size < 1:
+            raise ValueError(f'batch_size ({batch_size}) must be greater than 0')
+        if max_batches < 1:
+            raise ValueError(f'max_batches ({max_batches}) must be greater than 0')
+        self.write: Callable[[list[T]], None] = write
+        self.batch_size: int = batch_size
+        self.batch: list[T] = list()
+        self.queue: Queue[list[T] | None] = Queue(max_batches)
+        self.error: BaseException | None = None
+        self.thread: Thread | None = Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self.thread is None
+
+    def put(self, record: T):
+        """
+        Adds a new record to the current batch. Full batches are sent to the writer thread.
+        :param record: record to be written.
+        :raise RuntimeError: if the writer is closed or the writer thread failed.
+        """
+        if self.thread is None:
+            raise RuntimeError('writer is closed')
+        self.batch.append(record)
+        if len(self.batch) >= self.batch_size:
+            self._send_batch()
+
+    def flush(self):
+        """Blocks until all the records added so far are written."""
+        self._send_batch()
+        self.queue.join()
+        self._check_error()
+
+    def close(self):
+        """Writes all the pending records and stops the writer thread. Closing a closed writer has no effect."""
+        if self.thread is not None:
+            if self.batch and self.error is None:
+                self.queue.put(self.batch)
+            self.batch = list()
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+            self._check_error()
+
+    def _send_batch(self):
+        self._check_error()
+        if self.batch:
+            self.queue.put(self.batch)
+            self.batch = list()
+
+    def _check_error(self):
+        if self.error is not None:
+            raise RuntimeError('writer thread failed') from self.error
+
+    def _run(self):
+        while True:
+            batch = self.queue.get()
+            try:
+                if batch is None:
+                    return
+                if self.error is None:  # after a failure, batches are discarded so the simulation never blocks
+                    self.write(batch)
+            except BaseException as e:
+                self.error = e
+            finally:
+                self.queue.task_done()
@@ -1,6 +1,10 @@
-from math import log10, sqrt
+from math import exp, lgamma, log, log10, sqrt
 from typing import Optional, Tuple
 
+# Physical constants (exact values, as in scipy.constants) to avoid importing SciPy in the simulation core
+SPEED_OF_LIGHT: float = 299792458.0  # speed of light in vacuum (in m/s)
+BOLTZMANN: float = 1.380649e-23      # Boltzmann constant (in J/K)
+
 
 def euclidean_distance(a: Tuple[float, ...], b: Tuple[float, ...]) -> float:
     """Computes the euclidean distance between two points."""
@@ -26,3 +30,56 @@ def from_watt_to_dbm(watt: float) -> Optional[float]:
 def from_dbm_to_watt(dbm: Optional[float]) -> float:
     """Converts dBm to Watts."""
     return 0 if dbm is None else from_db_to_natural(dbm - 30)
+
+
+def _betacf(a: float, b: float, x: float, max_iter: int = 200, eps: float = 3e-14) -> float:
+    """Continued fraction of the regularized incomplete beta function (modified Lentz's method)."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1, a - 1
+    c, d = 1, 1 - qab * x / qap
+    d = 1 / (tiny if abs(d) < tiny else d)
+    h = d
+    for m in range(1, max_iter + 1):
+        m2 = 2 * m
+        for aa in m * (b - m) * x / ((qam + m2) * (a + m2)), -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2)):
+            d = 1 + aa * d
+            d = 1 / (tiny if abs(d) < tiny else d)
+            c = 1 + aa / c
+            c = tiny if abs(c) < tiny else c
+            h *= d * c
+        if abs(d * c - 1) < eps:
+            break
+    return h
+
+
+def betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0:
+        return 0
+    if x >= 1:
+        return 1
+    bt = exp(lgamma(a + b) - lgamma(a) - lgamma(b) + a * log(x) + b * log(1 - x))
+    if x < (a + 1) / (a + b + 2):
+        return bt * _betacf(a, b, x) / a
+    return 1 - bt * _betacf(b, a, 1 - x) / b
+
+
+def t_cdf(t: float, df: float) -> float:
+    """Cumulative distribution function of Student's t distribution with df degrees of freedom."""
+    tail = betainc(df / 2, 0.5, df / (df + t * t)) / 2
+    return 1 - tail if t > 0 else tail
+
+
+def t_ppf(q: float, df: float, tol: float = 1e-10) -> float:
+    """Quantile function (inverse of the CDF) of Student's t distribution with df degrees of freedom."""
+    if not 0 < q < 1:
+        raise ValueError(f'q ({q}) must be in the (0, 1) interval')
+    low, high = -1., 1.
+    while t_cdf(low, df) > q:
+        low *= 2
+    while t_cdf(high, df) < q:
+        high *= 2
+    while high - low > tol:
+        mid = (low + high) / 2
+        low, high = (mid, high) if t_cdf(mid, df) < q else (low, mid)
+    return (low + high) / 2
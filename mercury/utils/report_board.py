@@ -0,0 +1,46 @@
+from __future__ import annotations
+from mercury.msg.edcs import EdgeDataCenterReport
+from typing import Iterable
+from .timeline import EventTimeline
+
+
+class EDCReportBoard:
+    def __init__(self, edc_ids: Iterable[str], delay: float = 0):
+        """
+        Federation-wide board with the latest report of every EDC. EDCs publish their reports in the board instead
+        of sending a report packet to every other EDC. Control traffic is not simulated, so it is meant for models
+        in which the fidelity of control traffic is not relevant (e.g., lite and shortcut models).
+        :param edc_ids: IDs of the EDCs of the federation.
+        :param delay: staleness delay (in seconds). Published reports are only visible after this delay.
+        """
+        if delay < 0:
+            raise ValueError(f'delay ({delay}) must be greater than or equal to 0')
+        self.delay: float = delay
+        self.reports: dict[str, EdgeDataCenterReport | None] = {edc_id: None for edc_id in edc_ids}
+        self.version: int = 0  # it increases every time a report becomes visible
+        self.versions: dict[str, int] = {edc_id: 0 for edc_id in self.reports}  # version of every EDC report
+        self._pending: EventTimeline[EdgeDataCenterReport] = EventTimeline()
+
+    def publish(self, t: float, edc_report: EdgeDataCenterReport):
+        """
+        Publishes a new EDC report in the board.
+        :param t: current time.
+        :param edc_report: new (complete or delta) EDC report.
+        """
+        if self.delay > 0:
+            self._pending.push(t + self.delay, edc_report)
+        else:
+            self._update_report(edc_report)
+
+    def update(self, t: float):
+        """
+        Makes visible all the reports that have been published at least delay seconds ago.
+        :param t: current time.
+        """
+        for edc_report in self._pending.pop_until(t):
+            self._update_report(edc_report)
+
+    def _update_report(self, edc_report: EdgeDataCenterReport):
+        self.reports[edc_report.edc_id] = edc_report.merge(self.reports.get(edc_report.edc_id))
+        self.version += 1
+        self.versions[edc_report.edc_id] = self.version
@@ -0,0 +1,50 @@
+from __future__ import annotations
+import numpy as np
+import random
+from hashlib import sha256
+from random import Random
+
+# Generators behind the functions of the random and numpy.random modules (e.g., random.gauss or numpy.random.poisson)
+GLOBAL_RNG: Random = random._inst
+GLOBAL_NP_RNG: np.random.RandomState = np.random.mtrand._rand
+
+_seed: int | None = None
+
+
+def derive_seed(seed: int, *keys) -> int:
+    """:return: 64-bit seed derived from a base seed and a sequence of keys. It does not depend on PYTHONHASHSEED."""
+    digest = sha256('/'.join(str(x) for x in (seed, *keys)).encode()).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def set_seed(seed: int | None):
+    """
+    Enables or disables common random numbers. When enabled, every stochastic source of the models created
+    afterwards (e.g., a client generator or the processing times of a PU type) draws from its own stream,
+    seeded with the base seed and the ID of the source. Thus, two scenarios with the same base seed see the
+    same workload even if their configurations (and the order in which random numbers are drawn) differ.
+    :param seed: base seed of the random streams. If None, all the sources share the global random generators.
+    """
+    global _seed
+    _seed = seed
+
+
+def get_seed() -> int | None:
+    """:return: base seed of the random streams. If None, common random numbers are disabled."""
+    return _seed
+
+
+def stream(stream_id: str) -> Random:
+    """
+    :param stream_id: unique ID of the stochastic source.
+    :return: random generator of the source. If common random numbers are disabled, it returns the global generator.
+    """
+    return GLOBAL_RNG if _seed is None else Random(derive_seed(_seed, stream_id))
+
+
+def numpy_rng(rng: Random) -> np.random.RandomState:
+    """
+    :param rng: random generator of a stochastic source.
+    :return: NumPy random generator of the same source (e.g., for sampling Poisson distributions).
+    """
+    return GLOBAL_NP_RNG if rng is GLOBAL_RNG else np.random.RandomState(rng.getrandbits(32))
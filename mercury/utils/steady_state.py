@@ -0,0 +1,92 @@
+from __future__ import annotations
+from math import sqrt
+from typing import Sequence
+from .maths import t_ppf
+
+
+def mser(data: Sequence[float], batch_size: int = 5) -> int:
+    """
+    Marginal Standard Error Rule (MSER-m) for truncating the warm-up period of a simulation output series.
+    Observations are grouped in batches of batch_size (MSER-5 by default), and the truncation point is the number of
+    batches d (up to half of the series) that minimizes the marginal standard error of the remaining batch means.
+    :param data: output series, in order of observation.
+    :param batch_size: number of observations per batch.
+    :return: number of observations to be discarded (i.e., the warm-up period).
+    """
+    if batch_size < 1:
+        raise ValueError(f'batch_size ({batch_size}) must be greater than 0')
+    n_batches = len(data) // batch_size
+    if n_batches < 2:
+        return 0
+    means = [sum(data[i * batch_size:(i + 1) * batch_size]) / batch_size for i in range(n_batches)]
+    best_d, best_mser = 0, None
+    acc, acc_sq = 0., 0.  # suffix sums of the batch means and their squares
+    for d in range(n_batches - 1, -1, -1):
+        acc += means[d]
+        acc_sq += means[d] * means[d]
+        if d <= n_batches // 2:
+            n = n_batches - d
+            mser_d = max(0., acc_sq - acc * acc / n) / (n * n)
+            if best_mser is None or mser_d <= best_mser:
+                best_d, best_mser = d, mser_d
+    return best_d * batch_size
+
+
+class SteadyStateEstimate:
+    def __init__(self, mean: float, half_width: float, n_obs: int, warm_up: int, n_batches: int, confidence: float):
+        """
+        Estimation of the steady-state mean of a simulation output series.
+        :param mean: estimated mean.
+        :param half_width: half-width of the confidence interval of the mean.
+        :param n_obs: total number of observations.
+        :param warm_up: number of observations discarded as warm-up period.
+        :param n_batches: number of batches used for computing the confidence interval.
+        :param confidence: confidence level of the interval.
+        """
+        self.mean: float = mean
+        self.half_width: float = half_width
+        self.n_obs: int = n_obs
+        self.warm_up: int = warm_up
+        self.n_batches: int = n_batches
+        self.confidence: float = confidence
+
+    @property
+    def rel_half_width(self) -> float:
+        """:return: half-width of the confidence interval relative to the estimated mean."""
+        return self.half_width / abs(self.mean) if self.mean else float('inf')
+
+    def __str__(self):
+        return f'{self.mean:.6g} +/- {self.half_width:.3g} ({self.confidence:.0%} CI, {self.n_batches} batches, ' \
+               f'{self.warm_up} of {self.n_obs} observations discarded as warm-up)'
+
+
+def batch_means(data: Sequence[float], n_batches: int = 20, confidence: float = 0.95,
+                mser_batch_size: int = 5, min_batch_size: int = 10) -> SteadyStateEstimate | None:
+    """
+    Estimates the steady-state mean of an output series using the non-overlapping batch means method.
+    The warm-up period is first removed with the MSER rule.
+    :param data: output series, in order of observation.
+    :param n_batches: number of batches. Remaining observations at the beginning of the series are discarded.
+    :param confidence: confidence level of the interval.
+    :param mser_batch_size: batch size of the MSER rule.
+    :param min_batch_size: minimum number of observations per batch. Smaller batches are neither independent nor
+    normally distributed enough for computing a confidence interval (e.g., a few observations of a rare event).
+    :return: steady-state estimate. If there are not enough observations (i.e., less than min_batch_size per batch),
+    it returns None.
+    """
+    if n_batches < 2:
+        raise ValueError(f'n_batches ({n_batches}) must be greater than 1')
+    if min_batch_size < 1:
+        raise ValueError(f'min_batch_size ({min_batch_size}) must be greater than 0')
+    if not 0 < confidence < 1:
+        raise ValueError(f'confidence ({confidence}) must be in the (0, 1) interval')
+    warm_up = mser(data, mser_batch_size)
+    batch_size = (len(data) - warm_up) // n_batches
+    if batch_size < min_batch_size:
+        return None
+    start = len(data) - batch_size * n_batches
+    means = [sum(data[start + i * batch_size:start + (i + 1) * batch_size]) / batch_size for i in range(n_batches)]
+    mean = sum(means) / n_batches
+    std = sqrt(max(0., sum((x - mean) ** 2 for x in means) / (n_batches - 1)))
+    half_width = t_ppf((1 + confidence) / 2, n_batches - 1) * std / sqrt(n_batches)
+    return SteadyStateEstimate(mean, half_width, len(data), start, n_batches, confidence)
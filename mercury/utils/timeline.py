@@ -0,0 +1,60 @@
+from __future__ import annotations
+from heapq import heappop, heappush
+from math import inf
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class EventTimeline(Generic[T]):
+    def __init__(self, abs_tol: float = 1e-9):
+        """
+        Time-ordered collection of pending events. Insertions and pops of the earliest events are O(log n).
+        Events are grouped by their scheduled time. Groups whose times are within abs_tol are popped together.
+        :param abs_tol: absolute tolerance (in seconds) for considering two event times as simultaneous.
+        """
+        if abs_tol < 0:
+            raise ValueError(f'abs_tol ({abs_tol}) must be greater than or equal to 0')
+        self.abs_tol: float = abs_tol
+        self._times: list[float] = list()
+        self._events: dict[float, list[T]] = dict()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, t: float) -> bool:
+        return t in self._events
+
+    def __getitem__(self, t: float) -> list[T]:
+        return self._events[t]
+
+    @property
+    def next_t(self) -> float:
+        """:return: time of the earliest pending event. If the timeline is empty, it returns infinity."""
+        return self._times[0] if self._times else inf
+
+    def push(self, t: float, event: T):
+        """
+        Schedules a new event.
+        :param t: time at which the event is due.
+        :param event: event to be scheduled.
+        """
+        if t not in self._events:
+            heappush(self._times, t)
+            self._events[t] = list()
+        self._events[t].append(event)
+
+    def pop_until(self, t: float) -> list[T]:
+        """
+        Removes all the events that are due at time t (considering the timeline tolerance) or before.
+        :param t: current time.
+        :return: list of removed events, sorted by their scheduled time.
+        """
+        res: list[T] = list()
+        while self._times and self._times[0] <= t + self.abs_tol:
+            res.extend(self._events.pop(heappop(self._times)))
+        return res
+
+    def time_advance(self, clock: float) -> float:
+        """:return: time remaining until the earliest pending event. It is never less than 0."""
+        return max(0., self.next_t - clock)
@@ -0,0 +1,3 @@
+import os
+
+os.environ.setdefault('MERCURY_CACHE_DIR', '')  # tests must not cache plugin entry points in the user's home
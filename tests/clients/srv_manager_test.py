@@ -258,6 +258,31 @@ class SrvManagerTest(unittest.TestCase):
         self.assertEqual(inf, manager.sigma)
         self.assertTrue(manager.ready_to_dump)
 
+    def test_log_level(self):
+        self.prepare_scenario()
+        manager = SrvManager('test', ServicesConfig.SERVICES['req'], None, t_end=100)
+        request = SrvRequest('req', 'test', 0, 'gateway', None, 0)
+        request.send(0)
+        request.receive(0)
+        response = SrvResponse(request, True, 0)
+        response.send(1)
+        response.receive(1)
+        prev_level = logger.logger.level
+        event_log = logger.enable_event_log()
+        try:
+            # Miss ratios are not computed (there are no responses yet) for events below the logger level
+            logger.set_logger_level(logger.ERROR)
+            manager.log_response(logger.WARNING, response, True)
+            self.assertEqual(0, len(event_log.buffer))
+            logger.set_logger_level(logger.INFO)
+            manager.srv_met_deadlines += 1
+            manager.log_response(logger.INFO, response, True, '. Done')
+            self.assertEqual(1, len(event_log.buffer))
+            self.assertTrue(next(event_log.decode()).endswith('; miss ratio: 0.000. Done'))
+        finally:
+            logger.disable_event_log()
+            logger.set_logger_level(prev_level)
+
     def test_sess_srv(self):
         self.prepare_scenario()
         manager = SrvManager('test', ServicesConfig.SERVICES['sess'], None, t_end=150)
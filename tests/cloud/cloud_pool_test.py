@@ -437,6 +437,104 @@ class CloudPoolTestCase(unittest.TestCase):
         self.assertEqual(1.5, res_5.response)
         self.assertIsNone(res_5.trace)
 
+    def test_near_equal_times(self):
+        CloudPoolTestCase.prepare_scenario()
+        cloud_pool: CloudPool = CloudPool(cloud_config)
+        cloud_pool.initialize()
+
+        req_1 = SrvRequest('req_1', 'client_1', 0, 'gateway', 'cloud', 0)
+        req_1.send(0)
+        req_1.receive(0.3)
+        cloud_pool.input_requests.add(req_1)
+        external_advance(cloud_pool, 0.3)
+        req_2 = SrvRequest('req_1', 'client_2', 0, 'gateway', 'cloud', 0)
+        req_2.send(0)
+        req_2.receive(0.3 + 1e-12)
+        cloud_pool.input_requests.add(req_2)
+        external_advance(cloud_pool, 1e-12)
+        self.assertEqual(2, len(cloud_pool.timeline))
+        self.assertEqual(1.3, cloud_pool.timeline.next_t)
+        self.assertAlmostEqual(1, cloud_pool.sigma)
+
+        internal_advance(cloud_pool)
+        self.assertEqual(0, cloud_pool.sigma)
+        self.assertFalse(cloud_pool.requests)
+        self.assertFalse(cloud_pool.timeline)
+        internal_advance(cloud_pool)
+        self.assertEqual(inf, cloud_pool.sigma)
+        self.assertEqual(2, len(cloud_pool.output_responses))
+
+    def test_finite_servers(self):
+        CloudPoolTestCase.prepare_scenario()
+        config = CloudConfig(CLOUD_ID)
+        config.add_srv_config('req_1', proc_t_id='constant', proc_t_config={'proc_t': 1}, n_servers=1)
+        cloud_pool: CloudPool = CloudPool(config)
+        cloud_pool.initialize()
+        self.assertEqual(inf, cloud_pool.sigma)
+
+        req_1 = SrvRequest('req_1', 'client_1', 0, 'gateway', 'cloud', 0)
+        req_2 = SrvRequest('req_1', 'client_2', 0, 'gateway', 'cloud', 0)
+        for req in req_1, req_2:
+            req.send(0)
+            req.receive(1)
+            cloud_pool.input_requests.add(req)
+        external_advance(cloud_pool, 1)
+        self.assertEqual(0, cloud_pool.sigma)
+        self.assertEqual(2, len(cloud_pool.requests))
+        self.assertEqual(1, len(cloud_pool.timeline))
+        self.assertTrue(('req_1', 'client_1') in cloud_pool.timeline[2])
+        internal_advance(cloud_pool)
+        self.assertEqual(1, cloud_pool.sigma)
+        self.assertEqual(1, len(cloud_pool.output_queue))
+        report = cloud_pool.output_queue.get()
+        self.assertEqual(1, report.n_busy)
+        self.assertEqual(1, report.queue_len)
+        self.assertEqual(1, report.utilization)
+
+        internal_advance(cloud_pool)
+        self.assertEqual(0, cloud_pool.sigma)
+        self.assertEqual(1, len(cloud_pool.requests))
+        self.assertEqual(1, len(cloud_pool.timeline))
+        self.assertTrue(('req_1', 'client_2') in cloud_pool.timeline[3])
+        internal_advance(cloud_pool)
+        self.assertEqual(1, cloud_pool.sigma)
+        self.assertEqual(1, len(cloud_pool.output_responses))
+        self.assertEqual(req_1, cloud_pool.output_responses.get().request)
+        report = cloud_pool.output_queue.get()
+        self.assertEqual(1, report.n_busy)
+        self.assertEqual(0, report.queue_len)
+
+        internal_advance(cloud_pool)
+        internal_advance(cloud_pool)
+        self.assertEqual(inf, cloud_pool.sigma)
+        self.assertFalse(cloud_pool.requests)
+        res_2 = cloud_pool.output_responses.get()
+        self.assertEqual(req_2, res_2.request)
+        self.assertEqual(2, res_2.t_processing)
+        report = cloud_pool.output_queue.get()
+        self.assertEqual(0, report.n_busy)
+        self.assertEqual(0, report.utilization)
+
+    def test_no_queue_reports(self):
+        CloudPoolTestCase.prepare_scenario()
+        config = CloudConfig(CLOUD_ID)
+        config.add_srv_config('req_1', proc_t_id='constant', proc_t_config={'proc_t': 1}, n_servers=1)
+        cloud_pool: CloudPool = CloudPool(config, False)
+        cloud_pool.initialize()
+
+        req_1 = SrvRequest('req_1', 'client_1', 0, 'gateway', 'cloud', 0)
+        req_1.send(0)
+        req_1.receive(1)
+        cloud_pool.input_requests.add(req_1)
+        external_advance(cloud_pool, 1)
+        self.assertEqual(1, cloud_pool.sigma)  # no transition is required for sending queue reports
+        internal_advance(cloud_pool)
+        self.assertEqual(0, cloud_pool.sigma)
+        internal_advance(cloud_pool)
+        self.assertEqual(inf, cloud_pool.sigma)
+        self.assertEqual(1, len(cloud_pool.output_responses))
+        self.assertFalse(cloud_pool.output_queue)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,69 @@
+import contextlib
+import io
+import unittest
+import numpy as np
+import pandas as pd
+from mercury.optimization.allocation_manager import AllocationManager
+from mercury.utils.rng import set_seed
+
+
+def new_traces() -> pd.DataFrame:
+    return pd.DataFrame({
+        'epoch': [0, 10, 20, 70, 80, 130, 140, 150, 160],
+        'x': [5, 5, 35, 5, 6, 15, 16, 17, 39],
+        'y': [5, 6, 35, 5, 5, 25, 25, 25, 39],
+        'cab_id': ['a', 'b', 'a', 'a', 'a', 'a', 'b', 'c', 'c'],
+    })
+
+
+class AllocationManagerTestCase(unittest.TestCase):
+    def test_density_grid(self):
+        manager = AllocationManager(new_traces(), time_window=60, grid_res=4)
+        self.assertEqual(10, manager.grid_step)
+        expected = np.zeros((3, 3))
+        expected[0, 0] = 2  # a and b during the first time window
+        expected[1, 2] = 3  # a, b, and c during the third time window (c at t=160 belongs to the fourth one)
+        np.testing.assert_array_equal(expected, manager.grid)
+
+    def test_chunks(self):
+        traces = new_traces()
+        expected = AllocationManager(traces, time_window=60, grid_res=4).grid
+        for chunk_size in 1, 2, 4:
+            chunks = (traces.iloc[i:i + chunk_size] for i in range(0, len(traces), chunk_size))
+            manager = AllocationManager(chunks, time_window=60, grid_res=4, bounds=(39, 39))
+            np.testing.assert_array_equal(expected, manager.grid)
+            self.assertIsNone(manager.data)
+        with self.assertRaises(ValueError):
+            AllocationManager([traces], time_window=60, grid_res=4)
+        with self.assertRaises(ValueError):
+            AllocationManager([traces.iloc[4:], traces.iloc[:4]], time_window=60, grid_res=4, bounds=(39, 39))
+
+    def test_allocation(self):
+        set_seed(1)
+        self.addCleanup(set_seed, None)
+        manager = AllocationManager(new_traces(), time_window=60, grid_res=4)
+        manager.grid = np.floor(np.random.default_rng(1).gamma(0.5, 8, size=(30, 20)))
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager.allocate_aps(max_density=100)
+            cells = np.indices(manager.grid.shape).reshape(2, -1).T * manager.grid_step
+            clusters = np.argmin(np.linalg.norm(cells[:, np.newaxis] - manager.aps[np.newaxis], axis=2), axis=1)
+            densities = np.bincount(clusters, weights=manager.grid.reshape(-1))
+            self.assertLessEqual(np.max(densities), 100)
+            self.assertGreater(np.min(densities), 0)
+            self.assertGreater(len(manager.aps), np.sum(manager.grid) / 100)
+            aps = manager.aps
+            manager.allocate_aps(max_density=100)
+            np.testing.assert_array_equal(aps, manager.aps)  # same seed, same placement
+
+            manager.allocate_edcs(opt='n', n=3)
+            self.assertEqual((3, 2), manager.edcs.shape)
+            manager.allocate_edcs(opt='max', EDC_max=4)
+            n_aps = np.bincount(np.argmin(np.linalg.norm(aps[:, np.newaxis] - manager.edcs, axis=2), axis=1))
+            self.assertLessEqual(np.max(n_aps), 4)
+        manager.grid = np.zeros(manager.grid.shape)
+        with self.assertRaises(ValueError):
+            manager.allocate_aps()
+
+
+if __name__ == '__main__':
+    unittest.main()
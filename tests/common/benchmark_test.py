@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from mercury.benchmark.regression import BenchmarkRun, compare_runs, machine_fingerprint, welch_test
+from mercury.benchmark.scenario import grid_locations, synthetic_scenario
+from mercury.benchmark.suite import BenchmarkResult, run_suite
+
+
+class BenchmarkTestCase(unittest.TestCase):
+    def test_grid_locations(self):
+        self.assertEqual([(50, 50)], grid_locations(1, 100))
+        self.assertEqual([(25, 50), (75, 50)], grid_locations(2, 100))
+        self.assertEqual([(25, 25), (75, 25), (25, 75), (75, 75)], grid_locations(4, 100))
+
+    def test_synthetic_scenario(self):
+        config = synthetic_scenario(n_edcs=3, n_pus=2, n_gws=4, n_clients=7, n_services=2, cloud=False)
+        self.assertEqual(['srv_0', 'srv_1'], list(config['services']))
+        self.assertEqual(4, len(config['gateways']))
+        self.assertEqual(3, len(config['edcs']))
+        self.assertTrue(all(len(edc_config['pus']) == 2 for edc_config in config['edcs'].values()))
+        self.assertEqual(7, len(config['clients_config']['client_generators'][0]['generator_config']['clients']))
+        self.assertNotIn('cloud_config', config)
+        self.assertEqual(config, synthetic_scenario(n_edcs=3, n_pus=2, n_gws=4, n_clients=7, n_services=2, cloud=False))
+        with self.assertRaises(ValueError):
+            synthetic_scenario(n_edcs=0)
+
+    def test_run_suite(self):
+        res = run_suite(['xs'], ['lite'], time_interv=20)
+        self.assertEqual(1, len(res))
+        self.assertEqual(('xs', 'lite'), (res[0].scenario, res[0].variant))
+        self.assertGreater(res[0].n_events, 0)
+        self.assertGreater(res[0].peak_rss_kb, 0)
+        self.assertEqual(res[0].to_dict(), BenchmarkResult.from_dict(res[0].to_dict()).to_dict())
+        flat = run_suite(['xs'], ['lite'], time_interv=20, flatten=True)
+        self.assertTrue(flat[0].params['flatten'])
+        self.assertEqual(res[0].n_events, flat[0].n_events)
+        fast = run_suite(['xs'], ['lite'], time_interv=20, fast=True)
+        self.assertTrue(fast[0].params['fast'])
+        self.assertEqual(res[0].n_events, fast[0].n_events)
+        with self.assertRaises(ValueError):
+            run_suite(['xs'], ['undefined'])
+
+
+class RegressionTestCase(unittest.TestCase):
+    @staticmethod
+    def new_run(sim_times: list[float], timestamp: float = 0) -> BenchmarkRun:
+        results = [BenchmarkResult('xs', 'lite', 10, 1000, 0.1, sim_time, 1024) for sim_time in sim_times]
+        return BenchmarkRun(results, timestamp=timestamp)
+
+    def test_welch_test(self):
+        self.assertAlmostEqual(0.2986, welch_test([1, 2, 3, 4], [2, 3, 4, 5.5]), places=4)
+        self.assertLess(welch_test([10.1, 10.3, 9.9, 10.0, 10.2], [11.0, 11.2, 10.9, 11.1, 10.8]), 1e-4)
+        self.assertEqual(1, welch_test([1, 1], [1, 1]))
+        self.assertEqual(0, welch_test([1], [2, 3]))
+
+    def test_compare_runs(self):
+        baseline = self.new_run([1.0, 1.01, 0.99, 1.0])
+        comparisons = {c.metric: c for c in compare_runs(baseline, self.new_run([1.2, 1.21, 1.19, 1.2]))}
+        self.assertTrue(comparisons['sim_time'].regression)
+        self.assertTrue(comparisons['events_per_second'].regression)
+        self.assertFalse(comparisons['peak_rss_kb'].regression)
+        comparisons = {c.metric: c for c in compare_runs(baseline, self.new_run([0.8, 0.81, 0.79, 0.8]))}
+        self.assertTrue(comparisons['sim_time'].improvement)
+        self.assertFalse(any(c.regression for c in comparisons.values()))
+        # Noisy samples: the difference is not statistically significant
+        comparisons = compare_runs(baseline, self.new_run([0.7, 1.6, 0.9, 1.4]))
+        self.assertFalse(any(c.regression for c in comparisons))
+        # Small differences are below the threshold
+        comparisons = compare_runs(baseline, self.new_run([1.03]), threshold=0.05)
+        self.assertFalse(any(c.regression for c in comparisons))
+
+    def test_results_store(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.assertIsNone(BenchmarkRun.latest(tmp_dir))
+            self.new_run([1], timestamp=100).save(tmp_dir)
+            path = self.new_run([2], timestamp=200).save(tmp_dir)
+            other_machine = self.new_run([3], timestamp=300)
+            other_machine.fingerprint = dict(other_machine.fingerprint, id='other')
+            other_machine.save(tmp_dir)
+            self.assertEqual(3, len(os.listdir(tmp_dir)))
+            latest = BenchmarkRun.latest(tmp_dir, machine_fingerprint()['id'])
+            self.assertEqual(200, latest.timestamp)
+            self.assertEqual(BenchmarkRun.load(path).to_dict(), latest.to_dict())
+            self.assertEqual(300, BenchmarkRun.latest(tmp_dir).timestamp)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from math import inf
+from xdevs.models import Port
+from xdevs.sim import Coordinator
+from xdevs.transducers import Transducers
+from mercury import Mercury
+from mercury.benchmark.scenario import write_scenario
+from mercury.config import MercuryConfig
+from mercury.model import MercuryModelABC
+from mercury.model.common import FastCoordinator
+from mercury.msg.packet import AppPacket
+from tests.common.hierarchy_test import Relay, new_model, read_files
+
+
+class CountingPort(Port):
+    def __init__(self, p_type, name: str):
+        super().__init__(p_type, name)
+        self.n_clears: int = 0
+
+    def clear(self):
+        self.n_clears += 1
+        super().clear()
+
+
+def simulate(coordinator: Coordinator, output_dir: str) -> tuple[list[tuple[float, int]], list[tuple[float, int]], int]:
+    """:return: messages received by the sinks and number of times that the port of an idle model is cleared."""
+    model = coordinator.model
+    idle = Relay('idle')
+    idle.in_ports, idle.out_ports = list(), list()
+    idle.add_in_port(CountingPort(int, 'input'))
+    model.inner.add_component(idle)
+    for port in model.inner.get_out_port('output'), model.sink.output:
+        transducer = Transducers.create_transducer('csv', transducer_id=port.parent.name, output_dir=output_dir)
+        transducer.add_target_port(port)
+        coordinator.add_transducer(transducer)
+    coordinator.initialize()
+    coordinator.inject(model.get_in_port('input'), [10], 0.5)
+    coordinator.simulate_time(10)
+    coordinator.exit()
+    return model.sink.received, model.inner_sink.received, idle.in_ports[0].n_clears
+
+
+class FastCoordinatorTestCase(unittest.TestCase):
+    def test_coordinator(self):
+        with tempfile.TemporaryDirectory() as generic_dir, tempfile.TemporaryDirectory() as fast_dir:
+            expected = simulate(Coordinator(new_model()), generic_dir)
+            self.assertGreater(expected[2], 0)
+            coordinator = FastCoordinator(new_model())
+            self.assertEqual((*expected[:2], 0), simulate(coordinator, fast_dir))  # idle models are not visited
+            self.assertEqual(4, len(coordinator.simulators))
+            self.assertEqual(inf, coordinator.time_next)
+            self.assertEqual(read_files(generic_dir), read_files(fast_dir))
+            self.assertEqual(2, len(read_files(fast_dir)))
+            with self.assertRaises(ValueError):
+                FastCoordinator(new_model().inner)
+
+    def test_mercury(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = os.path.join(tmp_dir, 'scenario.json')
+            write_scenario(config_path, n_clients=5)
+            results = list()
+            for fast in False, True:
+                output_dir = os.path.join(tmp_dir, 'fast' if fast else 'generic')
+                os.makedirs(output_dir)
+                model = MercuryModelABC.new_mercury(MercuryConfig.from_json(config_path), False, AppPacket)
+                model.add_transducers('res', 'csv', {'output_dir': output_dir})
+                mercury = Mercury(model)
+                mercury.start_simulation(50, fast=fast)
+                self.assertEqual(fast, isinstance(mercury.coordinator, FastCoordinator))
+                results.append(read_files(output_dir))
+            self.assertEqual(results[0], results[1])
+            self.assertGreater(len(results[1]['res_srv_report_events.csv'].splitlines()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
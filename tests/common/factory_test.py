@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from mercury.plugin.edc.pu_mapping import FirstFit
+from mercury.plugin.factory import EntryPointIndex, Factory
+
+
+class NoScanIndex(EntryPointIndex):
+    def _scan(self):
+        raise AssertionError('index should be read from cache')
+
+
+class FactoryTestCase(unittest.TestCase):
+    GROUP = 'mercury.edc.pu.mapping.plugins'
+
+    def test_entry_point_index(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, 'cache', 'entry_points.json')
+            index = EntryPointIndex(cache_path)
+            self.assertIn('ff', index.group(self.GROUP))
+            self.assertEqual(dict(), index.group('mercury.undefined.plugins'))
+            self.assertTrue(os.path.exists(cache_path))
+
+            cached_index = NoScanIndex(cache_path)
+            self.assertEqual(index.group(self.GROUP), cached_index.group(self.GROUP))
+
+            with open(cache_path) as file:
+                cache = json.load(file)
+            cache['fingerprint'][0][1] += 1  # An entry of sys.path changed
+            with open(cache_path, 'w') as file:
+                json.dump(cache, file)
+            with self.assertRaises(AssertionError):
+                NoScanIndex(cache_path).group(self.GROUP)
+
+            index.invalidate()
+            self.assertFalse(os.path.exists(cache_path))
+
+    def test_lazy_index(self):
+        prev_index = Factory.INDEX
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.dict(os.environ, {'MERCURY_CACHE_DIR': tmp_dir}):
+                Factory.INDEX = None
+                factory = Factory(self.GROUP)
+                self.assertIsNone(Factory.INDEX)
+                self.assertEqual([], os.listdir(tmp_dir))
+                self.assertTrue(factory.defined('ff'))
+                self.assertIsNotNone(Factory.INDEX)
+                self.assertEqual(tmp_dir, os.path.dirname(Factory.INDEX.cache_path))
+                self.assertEqual([os.path.basename(Factory.INDEX.cache_path)], os.listdir(tmp_dir))
+        finally:
+            Factory.INDEX = prev_index
+
+    def test_lazy_factory(self):
+        factory = Factory(self.GROUP)
+        self.assertEqual(dict(), factory._entities)
+        self.assertTrue(factory.defined('ff'))
+        self.assertFalse(factory.defined('undefined'))
+        self.assertIsInstance(factory.create('ff'), FirstFit)
+        self.assertIs(FirstFit, factory._entities['ff'])
+        with self.assertRaises(ValueError):
+            factory.create('undefined')
+        with self.assertRaises(ValueError):
+            factory.register('ff', FirstFit)
+        factory.register('my_ff', FirstFit)
+        self.assertIsInstance(factory.create('my_ff'), FirstFit)
+
+    def test_load_plugin(self):
+        self.assertIs(FirstFit, Factory.load_plugin('ff', 'mercury.plugin.edc.pu_mapping:FirstFit'))
+        with self.assertRaises(ValueError):
+            Factory.load_plugin('bad', 'mercury.plugin.edc.pu_mapping:Undefined')
+        with self.assertRaises(ValueError):
+            Factory.load_plugin('bad', 'mercury.undefined_module:Undefined')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import tempfile
+import unittest
+from math import inf
+from xdevs.models import Atomic, Coupled, Port
+from xdevs.sim import Coordinator
+from mercury import Mercury
+from mercury.benchmark.scenario import write_scenario
+from mercury.config import MercuryConfig
+from mercury.model import MercuryModelABC
+from mercury.model.common import atomics, destinations, flatten
+from mercury.msg.packet import AppPacket
+
+
+class Relay(Atomic):
+    def __init__(self, name: str, n_msgs: int = 0):
+        super().__init__(name)
+        self.n_msgs: int = n_msgs
+        self.received: list[tuple[float, int]] = list()
+        self.clock: float = 0
+        self.input: Port[int] = Port(int, 'input')
+        self.output: Port[int] = Port(int, 'output')
+        self.add_in_port(self.input)
+        self.add_out_port(self.output)
+
+    def initialize(self):
+        self.hold_in('active', 1 if self.n_msgs else inf)
+
+    def exit(self):
+        pass
+
+    def deltint(self):
+        self.clock += self.sigma
+        self.n_msgs -= 1
+        self.hold_in('active', 1 if self.n_msgs else inf)
+
+    def deltext(self, e):
+        self.clock += e
+        self.received.extend((self.clock, msg) for msg in self.input.values)
+        self.sigma -= e
+
+    def lambdaf(self):
+        self.output.add(self.n_msgs)
+
+
+def new_model() -> Coupled:
+    """root: (inner: source -> inner.output), root.input -> (inner: sink), inner.output -> sink and root.output"""
+    root, inner = Coupled('root'), Coupled('inner')
+    root.source, root.sink, root.inner_sink = Relay('source', 3), Relay('sink'), Relay('inner_sink')
+    root.inner = inner
+    inner.add_component(root.source)
+    inner.add_component(root.inner_sink)
+    inner.add_in_port(Port(int, 'input'))
+    inner.add_out_port(Port(int, 'output'))
+    inner.add_coupling(inner.get_in_port('input'), root.inner_sink.input)
+    inner.add_coupling(root.source.output, inner.get_out_port('output'))
+    root.add_component(root.sink)
+    root.add_component(inner)
+    root.add_in_port(Port(int, 'input'))
+    root.add_out_port(Port(int, 'output'))
+    root.add_coupling(root.get_in_port('input'), inner.get_in_port('input'))
+    root.add_coupling(inner.get_out_port('output'), root.sink.input)
+    root.add_coupling(inner.get_out_port('output'), root.get_out_port('output'))
+    return root
+
+
+def simulate(model: Coupled) -> tuple[list[tuple[float, int]], list[tuple[float, int]]]:
+    coordinator = Coordinator(model)
+    coordinator.initialize()
+    coordinator.inject(model.get_in_port('input'), [10], 0.5)
+    coordinator.simulate_time(10)
+    return model.sink.received, model.inner_sink.received
+
+
+def read_files(output_dir: str) -> dict[str, str]:
+    res = dict()
+    for filename in sorted(os.listdir(output_dir)):
+        with open(os.path.join(output_dir, filename)) as file:
+            res[filename] = file.read()
+    return res
+
+
+class HierarchyTestCase(unittest.TestCase):
+    def test_hierarchy(self):
+        model = new_model()
+        self.assertEqual([model.source, model.inner_sink, model.sink], atomics(model))
+        self.assertEqual([model.sink], atomics(model.sink))
+        through = list()
+        self.assertEqual({model.sink.input, model.get_out_port('output')},
+                         set(destinations(model.source.output, through)))
+        self.assertEqual([model.inner.get_out_port('output')], through)
+        self.assertEqual([model.inner_sink.input], destinations(model.get_in_port('input')))
+
+    def test_flatten(self):
+        expected = simulate(new_model())
+        self.assertEqual([(1, 3), (2, 2), (3, 1)], expected[0])
+        self.assertEqual([(0.5, 10)], expected[1])
+
+        model = new_model()
+        sources = flatten(model)
+        self.assertEqual({model.inner.get_out_port('output'): [model.source.output]}, sources)
+        self.assertEqual([model.source, model.inner_sink, model.sink], model.components)
+        self.assertEqual({model.get_in_port('input'): [model.inner_sink.input]},
+                         {port: list(couplings) for port, couplings in model.eic.items()})
+        self.assertEqual({model.source.output: [model.sink.input]},
+                         {port: list(couplings) for port, couplings in model.ic.items()})
+        self.assertEqual({model.source.output: [model.get_out_port('output')]},
+                         {port: list(couplings) for port, couplings in model.eoc.items()})
+        self.assertEqual(expected, simulate(model))
+        with self.assertRaises(ValueError):
+            flatten(model.inner)
+
+    def test_mercury(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = os.path.join(tmp_dir, 'scenario.json')
+            write_scenario(config_path, n_clients=5)
+            results = list()
+            for flat in False, True:
+                output_dir = os.path.join(tmp_dir, 'flat' if flat else 'hierarchical')
+                os.makedirs(output_dir)
+                model = MercuryModelABC.new_mercury(MercuryConfig.from_json(config_path), False, AppPacket)
+                model.add_transducers('res', 'csv', {'output_dir': output_dir})
+                Mercury(model).start_simulation(50, flatten=flat)
+                self.assertEqual(flat, model.flat)
+                self.assertEqual(flat, all(isinstance(component, Atomic) for component in model.components))
+                results.append(read_files(output_dir))
+            self.assertEqual(results[0], results[1])
+            self.assertGreater(len(results[1]['res_edc_report_events.csv'].splitlines()), 1)
+            with self.assertRaises(ValueError):
+                model.flatten_model()
+
+
+if __name__ == '__main__':
+    unittest.main()
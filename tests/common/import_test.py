@@ -0,0 +1,17 @@
+import unittest
+from mercury.benchmark.import_time import CORE_MODULES, measure_import
+
+
+class ImportTestCase(unittest.TestCase):
+    def test_lightweight_core(self):
+        report = measure_import(CORE_MODULES + ('mercury',), repeat=1)
+        self.assertEqual([], report.heavy_modules)
+        self.assertEqual(1, len(report.t_import))
+
+    def test_invalid_repeat(self):
+        with self.assertRaises(ValueError):
+            measure_import(repeat=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
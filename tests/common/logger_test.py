@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+import mercury.logger as logger
+
+
+class Unformattable:
+    def __str__(self):
+        raise AssertionError('event arguments must not be formatted')
+
+
+class EventLogTestCase(unittest.TestCase):
+    def setUp(self):
+        self.prev_level = logger.logger.level
+        logger.set_logger_level(logger.INFO)
+
+    def tearDown(self):
+        logger.disable_event_log()
+        logger.set_logger_level(self.prev_level)
+
+    def test_level_check(self):
+        event_log = logger.enable_event_log()
+        logger.log_event(logger.DEBUG, 0, '', 'debug event %s', Unformattable())
+        logger.log_event(logger.INFO, 1, '  ', 'info event %s', 'edc')
+        self.assertEqual(1, len(event_log.buffer))
+        self.assertEqual((logger.INFO, 1, '  ', 'info event %s', ('edc',)), event_log.buffer[0])
+        logger.disable_event_log()
+        self.assertIsNone(logger.get_event_log())
+        logger.log_event(logger.DEBUG, 2, '', 'debug event %s', Unformattable())
+
+    def test_ring_buffer(self):
+        event_log = logger.enable_event_log(max_len=2)
+        for i in range(3):
+            logger.log_event(logger.INFO, i, '', 'event %d', i)
+        logger.log_event(logger.WARNING, 3, '  ', 'event %s; delay: %.3f', 'warning', 0.12345)
+        self.assertEqual(['INFO     [t=2.00] event 2', 'WARNING  [t=3.00]   event warning; delay: 0.123'],
+                         list(event_log.decode()))
+        self.assertEqual(['WARNING  [t=3.00]   event warning; delay: 0.123'], list(event_log.decode(logger.WARNING)))
+
+    def test_mutable_args(self):
+        event_log = logger.enable_event_log()
+        pus = ['pu_1']
+        logger.log_event(logger.INFO, 0, '', 'PUs: %s', pus)
+        pus.append('pu_2')
+        self.assertEqual(["INFO     [t=0.00] PUs: ['pu_1']"], list(event_log.decode()))
+
+    def test_binary_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'events.bin')
+            event_log = logger.enable_event_log(max_len=1, path=path, chunk_size=2)
+            for i in range(5):
+                logger.log_event(logger.INFO, i, '', 'event %d from %s', i, ('edc', i))
+            self.assertEqual(1, len(event_log.buffer))
+            logger.disable_event_log()
+            events = list(logger.EventLog.read(path))
+            self.assertEqual([f"INFO     [t={i}.00] event {i} from ('edc', {i})" for i in range(5)], events)
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            logger.EventLog(max_len=0)
+        with self.assertRaises(ValueError):
+            logger.EventLog(chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from copy import deepcopy
+from types import SimpleNamespace
+from typing import Any
+from xdevs.models import Coupled
+from xdevs.sim import Coordinator
+from mercury.benchmark.scenario import synthetic_scenario
+from mercury.plugin.optimization.cost_function import CostBound, CostFunction, DeadlinesBound, EnergyBound
+from mercury.plugin.optimization.move_function import MoveFunction
+from mercury.plugin.optimization.optimizer.optimizer import Optimizer, PruningController
+from mercury.plugin.optimization.optimizer.simulated_annealing import SimulatedAnnealing
+from mercury.plugin.optimization.optimizer.stc_hill_climbing import StochasticHillClimbing
+from tests.common.run_controller_test import SampleGenerator
+
+
+class SampleCost(CostFunction):
+    def _cost(self, base_dir: str) -> float:
+        return 0
+
+    def online_bound(self, model) -> CostBound | None:
+        bound = SampleBound(self)
+        bound.add_target_port(model.components[0].output)
+        return bound
+
+
+class SampleBound(CostBound):
+    def update(self, event: Any):
+        self.raw_bound += event.value
+
+
+class SrvReportsCost(CostFunction):
+    def _cost(self, base_dir: str) -> float:
+        with open(os.path.join(base_dir, 'transducer_srv_report_events.csv')) as file:
+            return sum(1 for _ in file)
+
+
+class SameConfig(MoveFunction):
+    def move(self, prev_state: dict[str, Any]) -> dict[str, Any]:
+        return deepcopy(prev_state)
+
+
+class OptimizerTestCase(unittest.TestCase):
+    def test_cost_bounds(self):
+        deadlines = DeadlinesBound(SampleCost(map=lambda x: 2 * x))
+        for deadline_met in True, False, False, True:
+            deadlines.update(SimpleNamespace(deadline_met=deadline_met))
+        self.assertEqual(2, deadlines.raw_bound)
+        self.assertEqual(4, deadlines.bound)
+
+        energy = EnergyBound(SampleCost())
+        for consumer_id, acc_cost in ('edc_0', 1), ('edc_1', 2), ('edc_0', 3), ('edc_1', 2):
+            energy.update(SimpleNamespace(consumer_id=consumer_id, acc_cost=acc_cost))
+        self.assertEqual(5, energy.bound)
+
+    def test_acceptance_threshold(self):
+        for optimizer_class, kwargs in (Optimizer, {}), (SimulatedAnnealing, {'t_max': 10}), \
+                                       (StochasticHillClimbing, {'temp': 10}):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                with open(os.path.join(tmp_dir, 'initial_config.json'), 'w') as file:
+                    json.dump(dict(), file)
+                optimizer = optimizer_class(base_dir=tmp_dir, interval=1, cost_function=SampleCost(),
+                                            move_function=None, **kwargs)
+                optimizer.current_state = SimpleNamespace(cost=100)
+                self.assertIsNone(optimizer.acceptance_threshold(0))
+                for u in .01, .2, .5, .8, .99:
+                    threshold = optimizer.acceptance_threshold(u)
+                    self.assertGreaterEqual(threshold, 100)
+                    # candidates above the threshold must be rejected, and candidates below it can be accepted
+                    self.assertLess(optimizer.acceptance_p(SimpleNamespace(cost=threshold + 1e-6)), u)
+                    self.assertGreaterEqual(optimizer.acceptance_p(SimpleNamespace(cost=threshold - 1e-6)), u)
+
+    def test_pruning_controller(self):
+        model = Coupled('root')
+        model.add_component(SampleGenerator())
+        for threshold, pruned in (100, True), (10000, False):
+            controller = PruningController(SampleCost(), threshold)
+            coordinator = Coordinator(model)
+            for bound in controller.create_kpis(model):
+                coordinator.add_transducer(bound)
+            coordinator.initialize()
+            self.assertEqual(pruned, controller.simulate(coordinator, 100))
+            if pruned:
+                self.assertLess(controller.t_stop, 10)
+                self.assertGreater(controller.bound.bound, threshold)
+            else:
+                self.assertIsNone(controller.t_stop)
+                self.assertEqual(101, coordinator.clock.time)  # as with simulate_time, the clock is at the next event
+
+    def test_common_random_numbers(self):
+        config = synthetic_scenario(n_clients=3)
+        config['services']['srv_0']['req_gen_id'] = 'exponential'
+        config['services']['srv_0']['req_gen_config'] = {'mean': 0.5}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, 'initial_config.json'), 'w') as file:
+                json.dump(config, file)
+            optimizer = Optimizer(base_dir=tmp_dir, interval=30, cost_function=SrvReportsCost(),
+                                  move_function=SameConfig(), pruning=False, crn_seed=1)
+            optimizer.run(3, verbose=False)
+            with open(os.path.join(tmp_dir, 'optimization_log.csv')) as file:
+                rows = list(csv.DictReader(file))
+            self.assertEqual(3, len(rows))
+            # The candidate has the same configuration as the current state, and it sees the same workload
+            for row in rows:
+                self.assertEqual(row['current_cost'], row['candidate_cost'])
+                self.assertEqual('False', row['accepted'])
+            self.assertGreater(optimizer.best_state.cost, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import random
+import unittest
+from mercury.config.client import ServicesConfig
+from mercury.config.edcs import ProcessingUnitConfig
+from mercury.model.edcs.edc.r_manager.pu import ProcessingUnit
+from mercury.plugin.client.client_generator import SyntheticClientGenerator
+from mercury.plugin.edc.pu_proc_t import GaussianProcTimeModel
+from mercury.utils.rng import GLOBAL_RNG, derive_seed, get_seed, set_seed, stream
+
+
+class RandomStreamsTestCase(unittest.TestCase):
+    def tearDown(self):
+        set_seed(None)
+
+    @staticmethod
+    def synthetic_clients(n_clients: int) -> list[tuple[float, float]]:
+        generator = SyntheticClientGenerator(services=set(), rng=stream('client_generator_0'),
+                                             synth_generation_id='exponential', synth_generation_config={'lambda': 1},
+                                             synth_destruction_id='uniform',
+                                             synth_destruction_config={'min_t': 10, 'max_t': 20})
+        res = list()
+        for _ in range(n_clients):
+            client_config = generator.generate_clients()[0]
+            res.append((client_config.t_start, client_config.t_end))
+        return res
+
+    def test_streams(self):
+        self.assertIsNone(get_seed())
+        self.assertIs(GLOBAL_RNG, stream('client_generator_0'))
+        set_seed(1)
+        self.assertEqual(stream('a').random(), stream('a').random())
+        self.assertNotEqual(stream('a').random(), stream('b').random())
+        self.assertEqual(derive_seed(1, 'a'), derive_seed(1, 'a'))
+        self.assertNotEqual(derive_seed(1, 'a'), derive_seed(2, 'a'))
+
+    def test_common_random_numbers(self):
+        set_seed(1)
+        clients = self.synthetic_clients(10)
+        proc_t = GaussianProcTimeModel(max_parallel_tasks=1, mu=1, sigma=0.1, rng=stream('pu_adas_proc_t'))
+        proc_times = [proc_t.proc_time(1) for _ in range(10)]
+        # Other sources consuming random numbers do not alter the workload
+        random.random()
+        self.assertEqual(clients, self.synthetic_clients(10))
+        proc_t = GaussianProcTimeModel(max_parallel_tasks=1, mu=1, sigma=0.1, rng=stream('pu_adas_proc_t'))
+        self.assertEqual(proc_times, [proc_t.proc_time(1) for _ in range(10)])
+        set_seed(2)
+        self.assertNotEqual(clients, self.synthetic_clients(10))
+
+        # Without common random numbers, sources share the global random generator
+        set_seed(None)
+        random.seed(1)
+        clients = self.synthetic_clients(10)
+        random.seed(1)
+        random.random()
+        self.assertNotEqual(clients, self.synthetic_clients(10))
+
+    def test_pu_streams(self):
+        if not ServicesConfig.srv_defined('crn'):
+            ServicesConfig.add_service('crn', 1, 'periodic', {'period': 1}, 'constant', {}, 'periodic', {'period': 1})
+        pu_config = ProcessingUnitConfig('pu')
+        pu_config.add_service('crn', 1, proc_t_id='gaussian', proc_t_config={'mu': 1, 'sigma': 0.1})
+        set_seed(1)
+        pus = [ProcessingUnit(edc_id, 'pu_0', pu_config, 298, True) for edc_id in ('edc_0', 'edc_1', 'edc_0')]
+        proc_times = [[pu.srv_proc_t_models['crn'].proc_time(1) for pu in pus] for _ in range(5)]
+        # PUs of the same type do not share their stream, and PUs with the same ID draw the same processing times
+        self.assertNotEqual([row[0] for row in proc_times], [row[1] for row in proc_times])
+        self.assertEqual([row[0] for row in proc_times], [row[2] for row in proc_times])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+from random import Random
+from xdevs.models import Atomic, Coupled, Port
+from xdevs.sim import Coordinator
+from mercury.run_controller import KPI, RunController
+from mercury.utils.maths import t_ppf
+from mercury.utils.steady_state import batch_means, mser
+
+
+class Sample:
+    def __init__(self, source_id: str, value: float):
+        self.source_id: str = source_id
+        self.value: float = value
+
+
+class SampleGenerator(Atomic):
+    def __init__(self, name: str = 'generator', seed: int = 0):
+        super().__init__(name)
+        self.rng: Random = Random(seed)
+        self.n_samples: int = 0
+        self.output = Port(Sample, 'output')
+        self.add_out_port(self.output)
+
+    def initialize(self):
+        self.hold_in('active', 1)
+
+    def exit(self):
+        pass
+
+    def deltint(self):
+        self.n_samples += 1
+        self.hold_in('active', 1)
+
+    def deltext(self, e):
+        pass
+
+    def lambdaf(self):
+        warm_up = 10 if self.n_samples < 50 else 0  # the first samples are biased
+        self.output.add(Sample('generator', warm_up + self.rng.gauss(5, 1)))
+
+
+class RunControllerTestCase(unittest.TestCase):
+    def test_t_ppf(self):
+        self.assertAlmostEqual(12.706, t_ppf(0.975, 1), places=3)
+        self.assertAlmostEqual(2.093, t_ppf(0.975, 19), places=3)
+        self.assertAlmostEqual(-2.093, t_ppf(0.025, 19), places=3)
+        self.assertAlmostEqual(0, t_ppf(0.5, 10), places=6)
+        with self.assertRaises(ValueError):
+            t_ppf(1, 10)
+
+    def test_mser(self):
+        rng = Random(0)
+        data = [10 + rng.gauss(0, 1) for _ in range(100)] + [rng.gauss(0, 1) for _ in range(900)]
+        self.assertEqual(100, mser(data))
+        self.assertLess(mser(data[100:]), 100)
+        self.assertEqual(0, mser(data[:9]))
+
+    def test_batch_means(self):
+        rng = Random(1)
+        data = [rng.gauss(5, 1) for _ in range(2000)]
+        estimate = batch_means(data, n_batches=20)
+        self.assertLess(abs(estimate.mean - 5), estimate.half_width)
+        self.assertLess(estimate.half_width, 0.1)
+        self.assertEqual(2000, estimate.n_obs)
+        self.assertIsNone(batch_means(data[:19], n_batches=20, min_batch_size=1))
+        self.assertIsNone(batch_means(data[:199], n_batches=20))
+        with self.assertRaises(ValueError):
+            batch_means(data, n_batches=1)
+        with self.assertRaises(ValueError):
+            batch_means(data, min_batch_size=0)
+
+    def test_constant_kpi(self):
+        self.assertIsNone(batch_means([0.] * 20))  # one observation per batch is not enough
+        estimate = batch_means([0.] * 2000)
+        self.assertEqual((0, 0), (estimate.mean, estimate.half_width))
+        # A KPI that did not change yet (e.g., no deadline missed) does not stop the simulation
+        model = Coupled('root')
+        generator = SampleGenerator()
+        model.add_component(generator)
+        controller = RunController(check_period=100, n_batches=10)
+        kpi = KPI('misses', lambda x: 0, abs_half_width=0.01)
+        kpi.add_target_port(generator.output)
+        controller.kpis = {'misses': kpi}
+        coordinator = Coordinator(model)
+        coordinator.add_transducer(kpi)
+        coordinator.initialize()
+        self.assertFalse(controller.simulate(coordinator, 1000))
+        self.assertEqual(0, controller.report()['misses'].half_width)
+
+    def test_signal_kpi(self):
+        kpi = KPI('power', lambda x: x.value, lambda x: x.source_id, bin_size=2)
+        port = Port(Sample, 'port')
+        kpi.imminent_ports.append(port)
+        for t, source_id, value in (1, 'a', 10), (2, 'b', 20), (6, 'a', 0), (6.5, 'b', 0):
+            port.add(Sample(source_id, value))
+            kpi.bulk_data(t)
+            port.clear()
+        kpi.update_time(9.5)
+        # bins start with the first event: [1, 3) -> (10 + 30) / 2, [3, 5) -> 30, [5, 7) -> (30 + 20 * 0.5) / 2, ...
+        self.assertEqual([20, 30, 20, 0], kpi.observations)
+
+    def test_early_termination(self):
+        model = Coupled('root')
+        generator = SampleGenerator()
+        model.add_component(generator)
+        controller = RunController(check_period=100, n_batches=10)
+        kpi = KPI('value', lambda x: x.value, abs_half_width=0.2)
+        kpi.add_target_port(generator.output)
+        controller.kpis = {'value': kpi}
+        coordinator = Coordinator(model)
+        coordinator.add_transducer(kpi)
+        coordinator.initialize()
+        self.assertTrue(controller.simulate(coordinator, 10000))
+        self.assertLess(controller.t_stop, 10000)
+        estimate = controller.report()['value']
+        self.assertLessEqual(estimate.half_width, 0.2)
+        self.assertGreaterEqual(estimate.warm_up, 50)
+        self.assertLess(abs(estimate.mean - 5), estimate.half_width)
+
+        controller = RunController(check_period=100)
+        controller.kpis = {'value': KPI('value', lambda x: x.value)}  # KPIs without target do not stop simulations
+        coordinator = Coordinator(model)
+        coordinator.add_transducer(controller.kpis['value'])
+        coordinator.initialize()
+        self.assertFalse(controller.simulate(coordinator, 500))
+        self.assertIsNone(controller.t_stop)
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            RunController(check_period=0)
+        with self.assertRaises(ValueError):
+            RunController(min_batch_size=0)
+        with self.assertRaises(ValueError):
+            RunController().add_kpi('undefined')
+        controller = RunController()
+        controller.add_kpi('srv_delay', rel_half_width=0.05)
+        with self.assertRaises(ValueError):
+            controller.add_kpi('srv_delay')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from xdevs.models import Atomic, Coupled, Port
+from xdevs.sim import Coordinator
+from xdevs.transducers import Transducers
+from mercury.analysis.results import is_sqlite, list_tables, read_results
+from mercury.transducers import AsyncWriter
+
+
+class Counter(Atomic):
+    def __init__(self, name: str = 'counter'):
+        super().__init__(name)
+        self.count: int = 0
+        self.output = Port(int, 'output')
+        self.add_out_port(self.output)
+
+    def initialize(self):
+        self.activate()
+
+    def exit(self):
+        pass
+
+    def deltint(self):
+        self.count += 1
+        self.hold_in('active', 0.5)
+
+    def deltext(self, e):
+        pass
+
+    def lambdaf(self):
+        self.output.add(self.count)
+        self.output.add(-self.count)
+
+
+class TransducerTestCase(unittest.TestCase):
+    @staticmethod
+    def run_counter(transducer_type: str, output_dir: str, **kwargs) -> str:
+        model = Coupled('root')
+        counter = Counter()
+        model.add_component(counter)
+        transducer = Transducers.create_transducer(transducer_type, transducer_id=f'counter_{transducer_type}',
+                                                   output_dir=output_dir, **kwargs)
+        transducer.add_target_port(counter.output)
+        transducer.drop_event_field('value')
+        transducer.add_event_field('value', int, lambda x: x)
+        transducer.add_event_field('abs_value', int, lambda x: abs(x))
+        transducer.add_event_field('even', bool, lambda x: x % 2 == 0)
+        coordinator = Coordinator(model)
+        coordinator.add_transducer(transducer)
+        coordinator.initialize()
+        coordinator.simulate_time(100)
+        coordinator.exit()
+        if transducer_type == 'sqlite':
+            return transducer.path
+        with open(transducer.filename if transducer_type == 'summary' else transducer.event_filename) as file:
+            return file.read()
+
+    def test_async_csv(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            expected = self.run_counter('csv', tmp_dir)
+            self.assertEqual(expected, self.run_counter('csv_async', tmp_dir, batch_size=7, max_batches=2))
+            self.assertEqual(expected, self.run_counter('csv_async', tmp_dir, batch_size=1000))
+            self.assertEqual(401, len(expected.splitlines()))  # header + 2 events every 0.5 s
+
+    def test_sqlite(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.run_counter('csv', tmp_dir)
+            csv_path = os.path.join(tmp_dir, 'counter_csv_events.csv')
+            db_path = self.run_counter('sqlite', tmp_dir, batch_size=50)
+            self.assertTrue(is_sqlite(db_path))
+            self.assertFalse(is_sqlite(csv_path))
+            self.assertEqual(['counter_sqlite_events'], list_tables(db_path))
+            with sqlite3.connect(db_path) as conn:
+                indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            self.assertEqual({f'counter_sqlite_events_{field}' for field in ('sim_time', 'model_name', 'port_name')}, indexes)
+
+            csv_df = read_results(csv_path, time_col='sim_time')
+            db_df = read_results(db_path, 'counter_sqlite_events', time_col='sim_time')
+            self.assertEqual(400, len(db_df))
+            self.assertEqual(csv_df.values.tolist(), db_df.values.tolist())
+            for path in csv_path, db_path:
+                df = read_results(path, 'counter_sqlite_events', columns=['sim_time', 'value'], t_start=10, t_end=20,
+                                  time_col='sim_time', abs_value=[25, 30], model_name=None)
+                self.assertEqual([[12.5, 25], [12.5, -25], [15, 30], [15, -30]], df.values.tolist())
+            with self.assertRaises(ValueError):
+                read_results(db_path)
+
+    def test_summary(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rows = [row.split(',') for row in self.run_counter('summary', tmp_dir, interval=10).splitlines()]
+            self.assertEqual(['sim_time', 'model_name', 'port_name', 'n_events', 'value_mean', 'value_max',
+                              'abs_value_mean', 'abs_value_max', 'even_ratio'], rows[0])
+            self.assertEqual(11, len(rows))
+            self.assertEqual(['0', 'counter', 'output', '40', '0.0', '19', '9.5', '19', '0.5'], rows[1])
+            self.assertEqual(['90', 'counter', 'output', '40', '0.0', '199', '189.5', '199', '0.5'], rows[10])
+
+            rows = [row.split(',') for row in self.run_counter('summary', tmp_dir, interval=10,
+                                                                 time_weighted=True).splitlines()]
+            self.assertEqual(['sim_time', 'model_name', 'port_name', 'n_events', 'value_mean', 'value_max',
+                              'value_integral', 'abs_value_mean', 'abs_value_max', 'abs_value_integral',
+                              'even_ratio'], rows[0])
+            self.assertEqual(11, len(rows))
+            # Every 0.5 seconds, the counter reports count and then -count: the latter is held until the next report
+            self.assertEqual(['0', 'counter', 'output', '40', '-9.5', '0', '-95.0', '9.5', '19', '95.0', '0.5'],
+                             rows[1])
+            self.assertEqual(['90', 'counter', 'output', '40', '-189.0', '-180', '-1795.5', '189.0', '198', '1795.5',
+                              '0.5263157894736842'], rows[10])  # the last step of the simulation is at t=99.5
+            with self.assertRaises(ValueError):
+                Transducers.create_transducer('summary', transducer_id='summary', interval=0)
+
+    def test_backpressure(self):
+        records, blocked = list(), threading.Event()
+        writer = AsyncWriter(lambda batch: blocked.wait() and records.extend(batch), batch_size=2, max_batches=1)
+        for i in range(5):  # 2 batches: the first one is being written, the second one waits in the queue
+            writer.put(i)
+        self.assertTrue(writer.queue.full())
+        pending = threading.Thread(target=writer.put, args=(5,))
+        pending.start()
+        pending.join(0.1)
+        self.assertTrue(pending.is_alive())  # a third batch must wait until the queue has room
+        blocked.set()
+        pending.join()
+        writer.flush()
+        self.assertEqual(list(range(6)), records)
+        writer.close()
+        self.assertTrue(writer.closed)
+        writer.close()
+        with self.assertRaises(RuntimeError):
+            writer.put(6)
+
+    def test_writer_error(self):
+        def write(batch):
+            raise OSError('disk full')
+
+        writer = AsyncWriter(write, batch_size=1)
+        writer.put(0)
+        with self.assertRaises(RuntimeError):
+            writer.flush()
+        with self.assertRaises(RuntimeError):
+            writer.close()
+        with self.assertRaises(ValueError):
+            AsyncWriter(write, batch_size=0)
+        with self.assertRaises(ValueError):
+            AsyncWriter(write, max_batches=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from mercury.model.edcs.edc.profiler import EDCProfiler
+from mercury.msg.profile import EDCProfile
 from mercury.msg.packet.app_packet.srv_packet import *
 from typing import Type
 
@@ -182,6 +183,32 @@ class EDCProfilerTestCase(unittest.TestCase):
         self.assertEqual(inf, profiler.sigma)  # req window
         self.assertEqual(1, len(profiler.output_profile_report))
 
+    def test_aggregates(self):
+        self.prepare_scenario()
+        profile = EDCProfile('edc', {'req': 5, 'sess': 10})
+        responses = {
+            1: [new_res(SrvRequest, 'req', 'client_1', 0, SrvResponse, True, 1)],
+            2: [new_res(SrvRequest, 'req', 'client_2', 1, SrvResponse, False, 0.5),
+                new_res(OpenSessRequest, 'sess', 'client_1', 1, OpenSessResponse, 'edc', 1.5)],
+            6: [new_res(SrvRequest, 'req', 'client_1', 3, SrvResponse, True, 3)],
+            8: [new_res(CloseSessRequest, 'sess', 'client_1', 7, CloseSessResponse, 0, 0.5)],
+        }
+        for t in range(20):
+            profile.clean(t)
+            for response in responses.get(t, list()):
+                profile.push(t, response)
+            windows = [window for srv_profile in profile.profiles.values()
+                       for response_profile in srv_profile.profiles.values()
+                       for window in response_profile.profiles.values()]
+            self.assertEqual(sum(window.total_n for window in windows), profile.total_n)
+            self.assertEqual(sum(window.total_acc_delay for window in windows), profile.total_acc_delay)
+            self.assertEqual(sum(window.window_n for window in windows), profile.window_n)
+            self.assertAlmostEqual(sum(window.window_acc_delay for window in windows), profile.window_acc_delay)
+            self.assertEqual(min((window.t_next for window in windows), default=inf), profile.t_next)
+        self.assertEqual(5, profile.total_n)
+        self.assertEqual(0, profile.window_n)
+        self.assertEqual(inf, profile.t_next)
+
 
 if __name__ == '__main__':
     unittest.main()
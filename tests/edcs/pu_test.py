@@ -1,5 +1,6 @@
 from __future__ import annotations
 import unittest
+from random import Random
 from mercury.config.edcs import ProcessingUnitConfig
 from mercury.model.edcs.edc.r_manager.pu import ProcessingUnit
 from mercury.msg.packet.app_packet.srv_packet import *
@@ -703,3 +704,54 @@ class TestProcessingUnit(unittest.TestCase):
         self.assertFalse(pu.ready_open_sess)
         self.assertFalse(pu.ready_close_sess)
         self.assertFalse(pu.ready_srv_reqs)
+
+    @staticmethod
+    def run_workload(processor_sharing: bool, seed: int) -> list[tuple[float, str, int | float]]:
+        ProcessingUnit.PROCESSOR_SHARING = processor_sharing
+        try:
+            pu = ProcessingUnit('edc', 'my_pu', pu_config, 298, True)
+        finally:
+            ProcessingUnit.PROCESSOR_SHARING = True
+        assert (pu.engine is not None) == processor_sharing
+        rng = Random(seed)
+        t, n_reqs, res = 0, [0] * 4, list()
+        while t < 200:
+            t_arrival = t + rng.choice([0.5, 1, 1.5, 2.5])
+            while pu.next_t <= t_arrival:  # internal events before the next arrival
+                t = pu.next_t
+                for responses in pu.update_t(t):
+                    res.extend((t, response.request.client_id, response.request.req_n) for response in responses)
+            t = t_arrival
+            client = rng.randrange(4)
+            req = SrvRequest('req_2', f'client_{client}', n_reqs[client], 'gateway', 'edc', t)
+            if pu.add_srv_request(SrvRequestProcess(req, t)) is None:
+                n_reqs[client] += 1
+            for responses in pu.update_t(t):
+                res.extend((t, response.request.client_id, response.request.req_n) for response in responses)
+            res.append((t, 'queue_time', pu.queue_time))
+        return res
+
+    def test_processor_sharing(self):
+        self.prepare_scenario()
+        ProcessingUnit.CHECK_CONSISTENCY = True
+        try:
+            for seed in range(5):
+                expected = self.run_workload(False, seed)
+                self.assertLess(10, sum(event[1] != 'queue_time' for event in expected))
+                self.assertEqual(expected, self.run_workload(True, seed))
+        finally:
+            ProcessingUnit.CHECK_CONSISTENCY = False
+
+    def test_additional_tasks_rounding(self):
+        self.prepare_scenario()
+        pu = ProcessingUnit('edc', 'my_pu', pu_config, 298, False)
+        pu.set_standby(True, True)
+        pu.update_t(0)
+        self.assertEqual(2, pu.additional_tasks('req_1'))
+        # Rounding errors of the incremental queue time must not change the number of additional tasks
+        pu.pending_work = 1 + 1e-12
+        self.assertEqual(2, pu.additional_tasks('req_1'))
+        pu.pending_work = 1 - 1e-12
+        self.assertEqual(2, pu.additional_tasks('req_1'))
+        pu.pending_work = 1 + 1e-6
+        self.assertEqual(1, pu.additional_tasks('req_1'))
@@ -281,3 +281,59 @@ class TestResourceManager(unittest.TestCase):
         self.assertEqual(report.srv_free_u('sess'), 0)
         self.assertEqual(report.srv_slice_u('req'), 1)  # there are no sliced resources
         self.assertEqual(report.srv_free_u('req'), 0)
+
+    def test_r_manager_delta_reports(self):
+        self.prepare_scenario(RManagerConfig(mapping_id='epu', standby=False))
+        delta_config = EdgeDataCenterConfig('edc', (0, 0), RManagerConfig(delta_reports=True, report_quantum=1))
+        for pu_id, pu_config in edc_config.pu_configs.items():
+            delta_config.add_pu(pu_id, pu_config)
+        r_manager = EDCResourceManager(delta_config, SRV_PRIORITY, cloud_id=None)
+
+        r_manager.initialize()
+        self.assertEqual(0, r_manager.sigma)
+        internal_advance(r_manager)
+        self.assertEqual(inf, r_manager.sigma)
+        report = r_manager.output_report.get()
+        self.assertTrue(report.delta)
+        self.assertEqual(set(SRV_PRIORITY), set(report.slicing))
+        self.assertEqual(10, report.srv_free_size('sess'))
+        self.assertEqual(5, report.srv_free_available('req'))
+        prev_report = report.merge(None)
+
+        # The new request changes the status of the resources, but the report is delayed until t = 1
+        srv_req = SrvRequest('req', 'client_1', 0, 'gateway', 'edc', 0)
+        srv_req.send(0)
+        r_manager.input_srv.add(srv_req)
+        external_advance(r_manager, 0)
+        self.assertEqual(1, r_manager.sigma)
+        # The output function must not alter the state of the model
+        updated_srvs = set(r_manager.updated_srvs)
+        r_manager.lambdaf()
+        r_manager.lambdaf()
+        self.assertEqual(2, len(r_manager.output_report))
+        first, second = r_manager.output_report.values
+        self.assertIs(first, second)
+        self.assertEqual(updated_srvs, r_manager.updated_srvs)
+        internal_advance(r_manager)
+        self.assertEqual(1, r_manager._clock)
+        self.assertEqual(1, r_manager.sigma)
+        self.assertEqual(len(r_manager.output_report), 1)
+        report = r_manager.output_report.get()
+        self.assertTrue(report.delta)
+        report = report.merge(prev_report)
+        self.assertFalse(report.delta)
+        self.assertEqual(set(SRV_PRIORITY), report.updated)
+        self.assertEqual(10, report.srv_free_size('sess'))
+        self.assertEqual(8, report.srv_free_available('sess'))
+        self.assertEqual(5, report.srv_free_size('req'))
+        self.assertEqual(4, report.srv_free_available('req'))
+
+        # Once the request is processed, the PU goes back to its original status
+        internal_advance(r_manager)
+        self.assertEqual(2, r_manager._clock)
+        self.assertEqual(0, r_manager.sigma)
+        internal_advance(r_manager)
+        self.assertEqual(len(r_manager.output_report), 1)
+        report = r_manager.output_report.get().merge(report)
+        self.assertEqual(10, report.srv_free_available('sess'))
+        self.assertEqual(5, report.srv_free_available('req'))
@@ -0,0 +1,46 @@
+import unittest
+from mercury.msg.edcs import EdgeDataCenterReport, SrvSlicingReport
+from mercury.utils.report_board import EDCReportBoard
+
+
+def new_report(edc_id: str, slicing: dict[str, int], delta: bool = False) -> EdgeDataCenterReport:
+    slicing = {srv_id: SrvSlicingReport(0, 0, 0, free_size, free_size) for srv_id, free_size in slicing.items()}
+    return EdgeDataCenterReport(edc_id, slicing, 0, 0, delta)
+
+
+class EDCReportBoardTestCase(unittest.TestCase):
+    def test_no_delay(self):
+        board = EDCReportBoard(['edc_1', 'edc_2'])
+        self.assertIsNone(board.reports['edc_1'])
+        self.assertIsNone(board.reports['edc_2'])
+        board.publish(0, new_report('edc_1', {'srv_1': 1, 'srv_2': 2}))
+        self.assertEqual(2, board.reports['edc_1'].srv_free_size('srv_2'))
+        self.assertIsNone(board.reports['edc_2'])
+        board.publish(1, new_report('edc_1', {'srv_2': 3}, True))
+        self.assertFalse(board.reports['edc_1'].delta)
+        self.assertEqual(1, board.reports['edc_1'].srv_free_size('srv_1'))
+        self.assertEqual(3, board.reports['edc_1'].srv_free_size('srv_2'))
+
+    def test_delay(self):
+        board = EDCReportBoard(['edc_1', 'edc_2'], 1)
+        board.publish(0, new_report('edc_1', {'srv_1': 1}))
+        board.publish(0.5, new_report('edc_2', {'srv_1': 2}))
+        board.update(0.5)
+        self.assertIsNone(board.reports['edc_1'])
+        board.update(1)
+        self.assertEqual(1, board.reports['edc_1'].srv_free_size('srv_1'))
+        self.assertIsNone(board.reports['edc_2'])
+        board.publish(1, new_report('edc_1', {'srv_1': 3}, True))
+        board.update(1.5)
+        self.assertEqual(1, board.reports['edc_1'].srv_free_size('srv_1'))
+        self.assertEqual(2, board.reports['edc_2'].srv_free_size('srv_1'))
+        board.update(2)
+        self.assertEqual(3, board.reports['edc_1'].srv_free_size('srv_1'))
+
+    def test_invalid_delay(self):
+        with self.assertRaises(ValueError):
+            EDCReportBoard(['edc_1'], -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+import unittest
+from math import inf
+from mercury.config.client import ServicesConfig
+from mercury.config.edcs import EdgeFederationConfig
+from mercury.config.gateway import GatewaysConfig
+from mercury.msg.edcs import EdgeDataCenterReport, SrvSlicingReport
+from mercury.msg.packet.app_packet.srv_packet import SrvRequest
+from mercury.msg.smart_grid import EnergyConsumption
+from mercury.plugin.edc.server_mapping import *
+from mercury.utils.amf import AccessManagementFunction
+from mercury.utils.report_board import EDCReportBoard
+from random import Random
+
+STRATEGIES = [ClosestEDCStrategy, EmptiestEDCStrategy, FullestEDCStrategy, PowerBalanceStrategy,
+              HighestPowerStrategy, SmartGridClosestEDCStrategy, SmartGridEmptiestEDCStrategy,
+              SmartGridFullestEDCStrategy]
+SERVICES = ['mapping_srv_1', 'mapping_srv_2']
+N_EDCS = 4
+N_GWS = 3
+
+
+class ServerMappingTestCase(unittest.TestCase):
+    @staticmethod
+    def prepare_scenario(report_board: bool = False) -> dict:
+        for srv_id in SERVICES:
+            if not ServicesConfig.srv_defined(srv_id):
+                ServicesConfig.add_service(srv_id, 1, 'periodic', {'period': 1}, 'constant', {}, 'periodic', {'period': 1})
+        edge_fed_config = EdgeFederationConfig()
+        for i in range(N_EDCS):
+            edge_fed_config.add_edc_config(f'edc_{i}', (i * 10, 0))
+        gws_config = GatewaysConfig()
+        for i in range(N_GWS):
+            gws_config.add_gateway(f'gw_{i}', (i * 15, 5), True)
+        amf = AccessManagementFunction(gws_config.gateways)
+        for i in range(N_GWS):
+            amf.connect_client(f'client_{i}', f'gw_{i}')
+        board = EDCReportBoard(edge_fed_config.edcs_config) if report_board else None
+        return {'edc_id': 'edc_0', 'amf': amf, 'gws_config': gws_config,
+                'edge_fed_config': edge_fed_config, 'report_board': board}
+
+    @staticmethod
+    def random_report(rng: Random, edc_id: str) -> EdgeDataCenterReport:
+        slicing = dict()
+        for srv_id in SERVICES:
+            if rng.random() < 0.9:
+                slice_size, free_size = rng.randint(0, 3), rng.randint(0, 3)
+                slicing[srv_id] = SrvSlicingReport(slice_size, slice_size, rng.randint(0, slice_size),
+                                                   free_size, rng.randint(0, free_size))
+        report = EdgeDataCenterReport(edc_id, slicing, rng.choice([0, 10, 20]), 0)
+        EnergyConsumption(report, rng.choice([0, 10, 20]), None, None, 0, 0, 0)
+        return report
+
+    @staticmethod
+    def scalar_mapping(mapper: ServerMappingStrategy, srv_request: SrvRequest) -> str | None:
+        best_edc, best_cost = None, None
+        for edc_id in mapper.edcs_config:
+            if mapper.edc_available(edc_id, srv_request.service_id):
+                cost = mapper.cost(edc_id, srv_request)
+                if best_cost is None or cost < best_cost:
+                    best_edc, best_cost = edc_id, cost
+        return best_edc
+
+    def test_vectorized_mapping(self):
+        rng = Random(1)
+        for strategy in STRATEGIES:
+            mapper = strategy(**self.prepare_scenario())
+            requests = [SrvRequest(SERVICES[i % len(SERVICES)], f'client_{i % N_GWS}', i, f'gw_{i % N_GWS}', None, 0)
+                        for i in range(6)]
+            self.assertEqual([None] * len(requests), mapper.map_servers(requests))
+            for _ in range(50):
+                edc_id = f'edc_{rng.randrange(N_EDCS)}'
+                report = self.random_report(rng, edc_id)
+                mapper.edc_reports[edc_id] = report
+                mapper.update_state(edc_id)
+                expected = [self.scalar_mapping(mapper, req) for req in requests]
+                self.assertEqual(expected, mapper.map_servers(requests))
+                self.assertEqual(expected[0], mapper.map_server(requests[0]))
+
+    def test_report_board(self):
+        rng = Random(2)
+        scenario = self.prepare_scenario(True)
+        board = scenario['report_board']
+        mapper = EmptiestEDCStrategy(**scenario)
+        requests = [SrvRequest(srv_id, 'client_0', 0, 'gw_0', None, 0) for srv_id in SERVICES]
+        for _ in range(50):
+            board.publish(0, self.random_report(rng, f'edc_{rng.randrange(1, N_EDCS)}'))
+            expected = [self.scalar_mapping(mapper, req) for req in requests]
+            self.assertEqual(expected, mapper.map_servers(requests))
+
+    def test_batch_accounting(self):
+        scenario = self.prepare_scenario()
+        mapper = EmptiestEDCStrategy(**scenario, batch_accounting=True)
+        for i, (slice_available, free_available) in enumerate([(2, 0), (1, 1), (0, 0), (0, 1)]):
+            slicing = {SERVICES[0]: SrvSlicingReport(2, 2, slice_available, 1, free_available)}
+            mapper.update_edc_report(EdgeDataCenterReport(f'edc_{i}', slicing, 0, 0))
+        requests = [SrvRequest(SERVICES[0], 'client_0', i, 'gw_0', None, 0) for i in range(7)]
+        self.assertEqual(['edc_0', 'edc_1', 'edc_0', 'edc_1', 'edc_3', None, None], mapper.map_servers(requests))
+        # Status matrices are restored after mapping the batch
+        self.assertEqual(['edc_0', 'edc_1'], mapper.map_servers(requests[:2]))
+        mapper.batch_accounting = False
+        self.assertEqual(['edc_0'] * 7, mapper.map_servers(requests))
+
+    def test_lexicographic_argmin(self):
+        keys = ([[0, 0, 1], [2, 1, 1], [0, 0, 0]], [[3, 2, 1], [0, 1, 0], [0, 0, 0]])
+        keys = tuple(np.array(key, dtype=float) for key in keys)
+        mask = np.array([[True, True, True], [True, True, True], [False, False, False]])
+        self.assertEqual([1, 2, -1], list(ServerMappingStrategy.lexicographic_argmin(keys, mask)))
+        keys[0][0, 1] = inf
+        self.assertEqual([0, 2, -1], list(ServerMappingStrategy.lexicographic_argmin(keys, mask)))
+
+
+if __name__ == '__main__':
+    unittest.main()